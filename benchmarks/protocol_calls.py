@@ -0,0 +1,167 @@
+"""Count Playwright protocol calls per page-object method, before and after the locator-first rewrite
+
+Runs against the bundled mock site:
+
+    python -m benchmarks.protocol_calls [--json results.json]
+"""
+import argparse
+import json
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+
+from playwright._impl._connection import Connection
+from playwright.sync_api import sync_playwright
+
+from config.config import Config
+from mock_site.app import create_server
+from pages.cart_page import CartPage
+from pages.home_page import HomePage
+from pages.products_page import ProductsPage
+
+
+class CallCounter:
+    """Counts messages sent from the client to the Playwright driver"""
+
+    def __init__(self):
+        self.calls = 0
+        self._send = Connection._send_message_to_server
+
+    def install(self):
+        counter = self
+
+        def counting_send(connection, *args, **kwargs):
+            counter.calls += 1
+            return counter._send(connection, *args, **kwargs)
+
+        Connection._send_message_to_server = counting_send
+
+    def uninstall(self):
+        Connection._send_message_to_server = self._send
+
+    @contextmanager
+    def measure(self, results: Dict[str, int], name: str):
+        before = self.calls
+        yield
+        results[name] = self.calls - before
+
+
+class LegacyPrimitives:
+    """The pre-rewrite BasePage primitives: double waits and ElementHandles"""
+
+    def click(self, selector, timeout=60000, wait=None, nth=None):
+        wait = wait or self.default_click_wait
+        self.page.wait_for_selector(selector, timeout=timeout, state="visible")
+        element = self.page.locator(selector)
+        element.wait_for(state="visible", timeout=timeout)
+        wait.run(self.page, element.click, timeout)
+
+    def fill(self, selector, text, timeout=60000, nth=None):
+        self.page.wait_for_selector(selector, timeout=timeout, state="visible")
+        element = self.page.locator(selector)
+        element.wait_for(state="visible", timeout=timeout)
+        element.fill(text)
+
+    def get_text(self, selector, timeout=60000, nth=None):
+        self.page.wait_for_selector(selector, timeout=timeout, state="visible")
+        element = self.page.locator(selector)
+        element.wait_for(state="visible", timeout=timeout)
+        return element.text_content() or ""
+
+    def get_element_count(self, selector, timeout=60000):
+        self.page.wait_for_selector(selector, timeout=timeout)
+        return len(self.page.query_selector_all(selector))
+
+    def is_visible(self, selector, timeout=60000, nth=None):
+        try:
+            return self.page.wait_for_selector(selector, timeout=timeout, state="visible").is_visible()
+        except Exception:
+            return False
+
+    def click_view_product(self, index=0):
+        self.page.query_selector_all(self.VIEW_PRODUCT_BUTTONS)[index].click()
+        self.page.wait_for_url("**/product_details/*")
+
+    def add_to_cart(self, index=0):
+        products = self.page.query_selector_all(self.PRODUCT_ITEMS)
+        if index < len(products):
+            products[index].hover()
+            self.page.query_selector_all(self.ADD_TO_CART_BUTTONS)[index].click()
+        self.page.locator(self.CART_MODAL).wait_for(state="visible")
+
+
+def legacy(page_class):
+    """Page object class running on the legacy primitives"""
+    return type(f"Legacy{page_class.__name__}", (LegacyPrimitives, page_class), {})
+
+
+def scenario(page, home_class, products_class, cart_class) -> List[Tuple[str, Callable[[], object]]]:
+    """Page-object calls measured, in the order they run"""
+    home, products, cart = home_class(page), products_class(page), cart_class(page)
+    return [
+        ("HomePage.load", home.load),
+        ("HomePage.verify_page_loaded", home.verify_page_loaded),
+        ("HomePage.subscribe_newsletter", lambda: home.subscribe_newsletter("bench@example.com")),
+        ("HomePage.click_products", home.click_products),
+        ("ProductsPage.verify_products_page", products.verify_products_page),
+        ("ProductsPage.get_product_count", products.get_product_count),
+        ("ProductsPage.add_to_cart", lambda: products.add_to_cart(1)),
+        ("ProductsPage.click_continue_shopping", products.click_continue_shopping),
+        ("ProductsPage.search_product", lambda: products.search_product("Top")),
+        ("ProductsPage.click_view_product", lambda: products.click_view_product(0)),
+        ("ProductsPage.set_quantity", lambda: products.set_quantity(2)),
+        ("HomePage.click_cart", home.click_cart),
+        ("CartPage.verify_cart_page", cart.verify_cart_page),
+    ]
+
+
+def run(browser, base_url: str, wrap: Callable, counter: CallCounter) -> Dict[str, int]:
+    """Run the scenario in a fresh context and count calls per step"""
+    results: Dict[str, int] = {}
+    context = browser.new_context(base_url=base_url)
+    page = context.new_page()
+    for name, step in scenario(page, wrap(HomePage), wrap(ProductsPage), wrap(CartPage)):
+        with counter.measure(results, name):
+            step()
+    context.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="Write the per-method counts to this file")
+    parser.add_argument("--browser", default=Config.BROWSER)
+    args = parser.parse_args()
+
+    server = create_server()
+    Config.BASE_URL = server.start()
+    counter = CallCounter()
+    counter.install()
+    try:
+        with sync_playwright() as playwright:
+            browser = getattr(playwright, args.browser).launch(headless=True)
+            started = time.perf_counter()
+            before = run(browser, Config.BASE_URL, legacy, counter)
+            legacy_seconds = time.perf_counter() - started
+            started = time.perf_counter()
+            after = run(browser, Config.BASE_URL, lambda page_class: page_class, counter)
+            current_seconds = time.perf_counter() - started
+            browser.close()
+    finally:
+        counter.uninstall()
+        server.stop()
+
+    print(f"{'method':<40} {'legacy':>7} {'current':>8} {'saved':>6}")
+    for name in before:
+        print(f"{name:<40} {before[name]:>7} {after[name]:>8} {before[name] - after[name]:>6}")
+    total_before, total_after = sum(before.values()), sum(after.values())
+    print(f"{'total':<40} {total_before:>7} {total_after:>8} {total_before - total_after:>6}")
+    print(f"wall time: legacy {legacy_seconds:.2f}s, current {current_seconds:.2f}s")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"legacy": before, "current": after}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
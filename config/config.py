@@ -5,7 +5,8 @@ class Config:
     """Test configuration"""
     
     # Base URL
-    BASE_URL = "https://www.automationexercise.com"
+    BASE_URL = os.getenv("BASE_URL", "https://www.automationexercise.com")
+    MOCK_SITE = os.getenv("MOCK_SITE", "false").lower() == "true"  # Serve the bundled local mock site instead
     
     # Browser settings
     BROWSER = os.getenv("BROWSER", "chromium")  # chromium, firefox, or webkit
@@ -16,11 +17,91 @@ class Config:
     DEFAULT_TIMEOUT = 30000
     NAVIGATION_TIMEOUT = 30000
     
+    # Wait strategies
+    DEFAULT_CLICK_WAIT = os.getenv("CLICK_WAIT", "dom_settled")  # none, load_state, navigation, url_change, dom_settled
+    DOM_SETTLE_QUIET_MS = int(os.getenv("DOM_SETTLE_QUIET_MS", "100"))
+    DOM_SETTLE_MAX_MS = int(os.getenv("DOM_SETTLE_MAX_MS", "2000"))
+    
+    # Authenticated storage state cache
+    STORAGE_STATE_DIR = os.getenv("STORAGE_STATE_DIR", ".auth")
+    STORAGE_STATE_TTL = int(os.getenv("STORAGE_STATE_TTL", "3600"))  # seconds
+    
+    # HAR record/replay
+    HAR_DIR = os.getenv("HAR_DIR", "hars")
+    
+    # Request blocking (ads, trackers, images, fonts)
+    BLOCK_RESOURCES = os.getenv("BLOCK_RESOURCES", "true").lower() == "true"
+    
+    # Load the site once before the first test of each worker
+    WARM_UP = os.getenv("WARM_UP", "true").lower() == "true"
+    
+    # Browser context pooling
+    CONTEXT_POOL = os.getenv("CONTEXT_POOL", "true").lower() == "true"
+    CONTEXT_POOL_MAX_USES = int(os.getenv("CONTEXT_POOL_MAX_USES", "20"))  # Recycle a context after X tests
+    
+    # Per-action timing of page-object methods
+    ACTION_TIMING = os.getenv("ACTION_TIMING", "true").lower() == "true"
+    ACTION_REPORT = os.getenv("ACTION_REPORT", "reports/action_timings.json")
+    
+    # Browser performance metrics per page load (opt-in)
+    PERF_METRICS = os.getenv("PERF_METRICS", "false").lower() == "true"
+    PERF_METRICS_FILE = os.getenv("PERF_METRICS_FILE", "reports/perf_metrics.jsonl")
+    
+    # Product catalog index scraped from the products grid and detail pages
+    CATALOG_PATH = os.getenv("CATALOG_PATH", "catalog_index.json")
+    CATALOG_MAX_AGE_HOURS = float(os.getenv("CATALOG_MAX_AGE_HOURS", "24"))
+    CATALOG_WORKERS = int(os.getenv("CATALOG_WORKERS", "8"))  # Detail pages fetched concurrently
+    
+    # Product detail crawler
+    CRAWL_OUTPUT = os.getenv("CRAWL_OUTPUT", "reports/product_crawl.jsonl")
+    CRAWL_CONCURRENCY = int(os.getenv("CRAWL_CONCURRENCY", "4"))  # Pages visited at the same time
+    CRAWL_RATE = float(os.getenv("CRAWL_RATE", "10"))  # Page visits per second; 0 for no limit
+    
+    # Batched form filling
+    BATCH_FORMS = os.getenv("BATCH_FORMS", "true").lower() == "true"
+    FORM_FIELD_COST_MS = float(os.getenv("FORM_FIELD_COST_MS", "150"))  # Estimated cost of filling one field on its own
+    
+    # Performance budgets of page-object methods (opt-in: live-site timings would make functional runs flaky)
+    PERF_BUDGETS = os.getenv("PERF_BUDGETS", "false").lower() == "true"
+    BUDGET_BASELINE = os.getenv("BUDGET_BASELINE", "perf_baseline.json")
+    BUDGET_TOLERANCE = float(os.getenv("BUDGET_TOLERANCE", "0.5"))  # Allowed regression over the baseline
+    BUDGET_SLACK_MS = float(os.getenv("BUDGET_SLACK_MS", "250"))  # Absolute slack for timing noise
+    
+    # Always-on tracing; traces are only written for failed or slow tests
+    CONTEXT_TRACING = os.getenv("CONTEXT_TRACING", "true").lower() == "true"
+    TRACE_DIR = os.getenv("TRACE_DIR", "traces")
+    TRACE_KEEP = int(os.getenv("TRACE_KEEP", "20"))  # Newest trace files kept, across runs
+    TRACE_SLOW_SECONDS = float(os.getenv("TRACE_SLOW_SECONDS", "30"))  # Keep traces of tests slower than this
+    TRACE_SCREENSHOT_SAMPLE = float(os.getenv("TRACE_SCREENSHOT_SAMPLE", "0.1"))  # Share of contexts with screencast
+    
+    # Concurrent async tests per worker (tests marked multiplex)
+    MULTIPLEX_CONTEXTS = int(os.getenv("MULTIPLEX_CONTEXTS", "4"))
+    
+    # Duration-aware xdist scheduling
+    DURATION_HISTORY = os.getenv("DURATION_HISTORY", ".test_durations.json")
+    
+    # Retries: jittered exponential backoff, a session-wide budget and test reruns for transient failures only
+    RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "0.5"))  # seconds
+    RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "8"))  # seconds
+    RETRY_BUDGET = int(os.getenv("RETRY_BUDGET", "30"))  # Retries per session, split across xdist workers
+    TEST_RERUNS = int(os.getenv("TEST_RERUNS", "0"))  # Test-level reruns, opt-in like --reruns
+    
     # Screenshot settings
     SCREENSHOT_ON_FAILURE = True
-    SCREENSHOT_PATH = "screenshots"
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "jpeg")  # jpeg or png
+    SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "70"))  # JPEG quality, 0-100
+    SCREENSHOT_FULL_PAGE = os.getenv("SCREENSHOT_FULL_PAGE", "false").lower() == "true"
+    
+    # Failure artifacts (screenshots, DOM snapshots, console logs), written in the background
+    ARTIFACT_PATH = os.getenv("ARTIFACT_PATH", "artifacts")
+    ARTIFACT_WORKERS = int(os.getenv("ARTIFACT_WORKERS", "2"))
+    ARTIFACT_QUOTA_MB = int(os.getenv("ARTIFACT_QUOTA_MB", "200"))  # Oldest artifacts are deleted beyond this
+    ARTIFACT_GZIP_LEVEL = int(os.getenv("ARTIFACT_GZIP_LEVEL", "6"))
+    CONSOLE_LOG_LINES = int(os.getenv("CONSOLE_LOG_LINES", "500"))  # Console messages kept per test
     
     # Test data
+    TESTDATA_SEED = os.getenv("TESTDATA_SEED", "")  # Empty: a new seed per run, shared with xdist workers
+    TESTDATA_BATCH = int(os.getenv("TESTDATA_BATCH", "64"))  # Records generated at a time
     TEST_USER: Dict[str, str] = {
         "name": "Test User",
         "email": "testuser@example.com",
@@ -42,8 +123,3 @@ class Config:
             "headless": cls.HEADLESS,
             "slow_mo": cls.SLOW_MO
         }
-    
-    @classmethod
-    def ensure_screenshot_dir(cls):
-        """Ensure screenshot directory exists"""
-        os.makedirs(cls.SCREENSHOT_PATH, exist_ok=True) 
\ No newline at end of file
@@ -0,0 +1 @@
+"""Local stand-in for automationexercise.com"""
\ No newline at end of file
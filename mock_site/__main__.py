@@ -0,0 +1,26 @@
+import argparse
+import logging
+import time
+
+from .app import create_server
+
+
+def main():
+    """Serve the mock site until interrupted"""
+    parser = argparse.ArgumentParser(description="Local stand-in for automationexercise.com")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = create_server(args.host, args.port)
+    print(f"Serving mock site on {server.start()} (set BASE_URL to use it)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,509 @@
+import html
+import json
+import mimetypes
+import os
+import re
+import secrets
+from string import Template
+from typing import Callable, Dict, List, Tuple
+
+from config.config import Config
+
+from .server import MockSiteServer, Request, Response
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+CATALOG_PATH = os.path.join(BASE_DIR, "fixtures", "catalog.json")
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+COUNTRIES = ["India", "United States", "Canada", "Australia", "Israel", "New Zealand", "Singapore"]
+TEST_CASES = ["Register User", "Login User with correct email and password",
+              "Login User with incorrect email and password", "Logout User",
+              "Register User with existing email", "Contact Us Form", "Verify Test Cases Page",
+              "Verify All Products and product detail page", "Search Product"]
+
+
+def price_value(price: str) -> int:
+    """Numeric value of a price such as 'Rs. 500'"""
+    return int(re.sub(r"\D", "", price))
+
+
+class ShopApp:
+    """In-memory implementation of the pages and APIs the page objects touch"""
+
+    def __init__(self, catalog_path: str = CATALOG_PATH):
+        with open(catalog_path) as f:
+            catalog = json.load(f)
+        self.products: Dict[int, dict] = {p["id"]: p for p in catalog["products"]}
+        self.categories: Dict[int, dict] = {c["id"]: c for c in catalog["categories"]}
+        # The fixed account of Config.TEST_USER exists on the live site, so it exists here too
+        user = Config.TEST_USER
+        self.accounts: Dict[str, dict] = {user["email"]: {
+            "name": user["name"],
+            "email": user["email"],
+            "password": user["password"],
+            "title": "Mr",
+            "birth_day": "1",
+            "birth_month": "1",
+            "birth_year": "1990",
+            "first_name": user["first_name"],
+            "last_name": user["last_name"],
+            "company": "",
+            "address1": user["address"],
+            "address2": "",
+            "country": user["country"],
+            "state": user["state"],
+            "city": user["city"],
+            "zipcode": user["zipcode"],
+            "mobile_number": user["mobile_number"]
+        }}
+        self.sessions: Dict[str, dict] = {}
+        self.subscribers: List[str] = []
+        self._templates: Dict[str, Template] = {}
+        self.routes: List[Tuple[str, re.Pattern, Callable]] = []
+        for method, pattern, handler in [
+            ("GET", r"/", self.home),
+            ("GET", r"/products", self.products_page),
+            ("GET", r"/product_details/(\d+)", self.product_details),
+            ("GET", r"/category_products/(\d+)", self.category_products),
+            ("GET", r"/brand_products/(.+)", self.brand_products),
+            ("GET", r"/add_to_cart/(\d+)", self.add_to_cart),
+            ("GET", r"/delete_cart/(\d+)", self.delete_cart),
+            ("GET", r"/view_cart", self.view_cart),
+            ("GET", r"/login", self.login_page),
+            ("POST", r"/login", self.login),
+            ("POST", r"/signup", self.signup),
+            ("GET", r"/account_created", self.account_created),
+            ("GET", r"/logout", self.logout),
+            ("GET", r"/delete_account", self.delete_account),
+            ("GET", r"/checkout", self.checkout),
+            ("GET", r"/payment", self.payment_page),
+            ("POST", r"/payment", self.payment),
+            ("GET", r"/payment_done/(\d+)", self.payment_done),
+            ("GET", r"/download_invoice/(\d+)", self.download_invoice),
+            ("GET", r"/contact_us", self.contact_us),
+            ("POST", r"/contact_us", self.contact_us),
+            ("GET", r"/test_cases", self.test_cases),
+            ("POST", r"/subscribe", self.subscribe),
+            ("GET", r"/static/(.+)", self.static),
+            ("GET", r"/api/productsList", self.api_products_list),
+            ("POST", r"/api/searchProduct", self.api_search_product),
+            ("POST", r"/api/verifyLogin", self.api_verify_login),
+            ("POST", r"/api/createAccount", self.api_create_account),
+            ("DELETE", r"/api/deleteAccount", self.api_delete_account),
+            ("GET", r"/api/getUserDetailByEmail", self.api_user_detail),
+        ]:
+            self.routes.append((method, re.compile(f"^{pattern}$"), handler))
+
+    def __call__(self, request: Request) -> Response:
+        """Dispatch a request to its handler"""
+        session_id = request.cookies.get("sessionid")
+        new_session = session_id not in self.sessions
+        if new_session:
+            session_id = secrets.token_hex(16)
+            self.sessions[session_id] = {"email": None, "cart": {}, "csrf": secrets.token_hex(16)}
+        session = self.sessions[session_id]
+
+        allowed = False
+        response = None
+        for method, pattern, handler in self.routes:
+            match = pattern.match(request.path)
+            if not match:
+                continue
+            allowed = True
+            if method == request.method:
+                response = handler(request, session, *match.groups())
+                break
+        if response is None:
+            response = Response("Method Not Allowed", status=405) if allowed else Response("Not Found", status=404)
+
+        if new_session:
+            response.set_cookie("sessionid", session_id)
+            response.set_cookie("csrftoken", session["csrf"])
+        return response
+
+    # Rendering helpers
+
+    def _template(self, name: str) -> Template:
+        if name not in self._templates:
+            with open(os.path.join(TEMPLATE_DIR, f"{name}.html")) as f:
+                self._templates[name] = Template(f.read())
+        return self._templates[name]
+
+    def render(self, template: str, session: dict, title: str = "Automation Exercise", status: int = 200, **context) -> Response:
+        """Render a page template inside the site layout"""
+        user = self.accounts.get(session["email"])
+        if user:
+            account_links = (
+                '<li><a href="/logout"><i class="fa fa-lock"></i> Logout</a></li>\n'
+                '<li><a href="/delete_account"><i class="fa fa-trash-o"></i> Delete Account</a></li>\n'
+                f'<li><a><i class="fa fa-user"></i> Logged in as <b>{html.escape(user["name"])}</b></a></li>'
+            )
+        else:
+            account_links = '<li><a href="/login"><i class="fa fa-lock"></i> Signup / Login</a></li>'
+        content = self._template(template).safe_substitute(csrf_token=session["csrf"], **context)
+        body = self._template("layout").safe_substitute(
+            title=html.escape(title), account_links=account_links, content=content, csrf_token=session["csrf"]
+        )
+        return Response(body, status=status)
+
+    def _product_card(self, product: dict) -> str:
+        name = html.escape(product["name"])
+        return (
+            '<div class="col-sm-4"><div class="product-image-wrapper"><div class="single-products">'
+            f'<div class="productinfo text-center"><h2>{product["price"]}</h2><p>{name}</p>'
+            f'<a href="#" data-product-id="{product["id"]}" class="btn btn-default add-to-cart">'
+            '<i class="fa fa-shopping-cart"></i>Add to cart</a></div></div>'
+            f'<div class="choose"><ul class="nav nav-pills nav-justified"><li>'
+            f'<a href="/product_details/{product["id"]}" class="view-product"><i class="fa fa-plus-square"></i>View Product</a>'
+            '</li></ul></div></div></div>'
+        )
+
+    def _cart_modal(self) -> str:
+        return (
+            '<div class="modal fade" id="cartModal" role="dialog"><div class="modal-dialog modal-confirm">'
+            '<div class="modal-content"><div class="modal-header"><h4 class="modal-title w-100">Added!</h4></div>'
+            '<div class="modal-body"><p class="text-center">Your product has been added to cart.</p>'
+            '<p class="text-center"><a href="/view_cart"><u>View Cart</u></a></p></div>'
+            '<div class="modal-footer"><button class="btn btn-success close-modal btn-block" data-dismiss="modal">'
+            'Continue Shopping</button></div></div></div></div>'
+        )
+
+    def _category_panels(self) -> str:
+        panels = []
+        for usertype in ("Women", "Men", "Kids"):
+            links = "".join(
+                f'<li><a href="/category_products/{c["id"]}">{html.escape(c["category"])} </a></li>'
+                for c in self.categories.values() if c["usertype"] == usertype
+            )
+            panels.append(
+                '<div class="panel panel-default"><div class="panel-heading"><h4 class="panel-title">'
+                f'<a data-toggle="collapse" data-parent="#accordian" href="#{usertype}">{usertype}</a></h4></div>'
+                f'<div id="{usertype}" class="panel-collapse collapse"><div class="panel-body"><ul>{links}</ul></div></div></div>'
+            )
+        return "\n".join(panels)
+
+    def _product_listing(self, session: dict, heading: str, products: List[dict], search: str = "") -> Response:
+        return self.render(
+            "products", session, title="Automation Exercise - All Products",
+            heading=html.escape(heading),
+            search=html.escape(search, quote=True),
+            category_panels=self._category_panels(),
+            product_cards="\n".join(self._product_card(p) for p in products),
+            cart_modal=self._cart_modal()
+        )
+
+    def _cart_lines(self, session: dict) -> Tuple[str, int]:
+        rows, total = [], 0
+        for product_id, quantity in session["cart"].items():
+            product = self.products[product_id]
+            line_total = price_value(product["price"]) * quantity
+            total += line_total
+            category = product["category"]
+            rows.append(
+                f'<tr id="product-{product_id}" class="cart_item">'
+                f'<td class="cart_product"><a href="/product_details/{product_id}">'
+                f'<img src="/get_product_picture/{product_id}" alt="Product Image"></a></td>'
+                f'<td class="cart_description"><h4><a href="/product_details/{product_id}">{html.escape(product["name"])}</a></h4>'
+                f'<p>{category["usertype"]["usertype"]} &gt; {html.escape(category["category"])}</p></td>'
+                f'<td class="cart_price"><p>{product["price"]}</p></td>'
+                f'<td class="cart_quantity"><button class="disabled">{quantity}</button></td>'
+                f'<td class="cart_total"><p class="cart_total_price">Rs. {line_total}</p></td>'
+                f'<td class="cart_delete"><a class="cart_quantity_delete" data-product-id="{product_id}">'
+                '<i class="fa fa-times"></i></a></td></tr>'
+            )
+        return "\n".join(rows), total
+
+    def _account_status(self, session: dict, heading: str, heading_qa: str, message: str) -> Response:
+        return self.render("account_status", session, heading=heading, heading_qa=heading_qa, message=message)
+
+    def _search(self, term: str) -> List[dict]:
+        term = term.lower()
+        return [
+            p for p in self.products.values()
+            if term in p["name"].lower() or term in p["brand"].lower()
+            or term in p["category"]["category"].lower() or term in p["category"]["usertype"]["usertype"].lower()
+        ]
+
+    # Shop pages
+
+    def home(self, request: Request, session: dict) -> Response:
+        products = list(self.products.values())
+        brands = sorted({p["brand"] for p in products})
+        return self.render(
+            "home", session,
+            category_panels=self._category_panels(),
+            brand_links="\n".join(f'<li><a href="/brand_products/{html.escape(b)}">{html.escape(b)}</a></li>' for b in brands),
+            product_cards="\n".join(self._product_card(p) for p in products),
+            recommended_cards="\n".join(self._product_card(p) for p in products[:3]),
+            cart_modal=self._cart_modal()
+        )
+
+    def products_page(self, request: Request, session: dict) -> Response:
+        search = request.query.get("search")
+        if search is not None:
+            return self._product_listing(session, "SEARCHED PRODUCTS", self._search(search), search)
+        return self._product_listing(session, "ALL PRODUCTS", list(self.products.values()))
+
+    def category_products(self, request: Request, session: dict, category_id: str) -> Response:
+        category = self.categories.get(int(category_id))
+        if not category:
+            return Response("Not Found", status=404)
+        products = [
+            p for p in self.products.values()
+            if p["category"]["category"] == category["category"] and p["category"]["usertype"]["usertype"] == category["usertype"]
+        ]
+        return self._product_listing(session, f"{category['usertype']} - {category['category']} Products", products)
+
+    def brand_products(self, request: Request, session: dict, brand: str) -> Response:
+        products = [p for p in self.products.values() if p["brand"] == brand]
+        return self._product_listing(session, f"Brand - {brand} Products", products)
+
+    def product_details(self, request: Request, session: dict, product_id: str) -> Response:
+        product = self.products.get(int(product_id))
+        if not product:
+            return Response("Not Found", status=404)
+        return self.render(
+            "product_details", session, title="Automation Exercise - Product Details",
+            id=product["id"],
+            name=html.escape(product["name"]),
+            price=product["price"],
+            usertype=product["category"]["usertype"]["usertype"],
+            category=html.escape(product["category"]["category"]),
+            availability=product["availability"],
+            condition=product["condition"],
+            brand=html.escape(product["brand"]),
+            cart_modal=self._cart_modal()
+        )
+
+    def add_to_cart(self, request: Request, session: dict, product_id: str) -> Response:
+        product_id = int(product_id)
+        if product_id not in self.products:
+            return Response("Not Found", status=404)
+        quantity = int(request.query.get("quantity", 1))
+        session["cart"][product_id] = session["cart"].get(product_id, 0) + quantity
+        return Response("Added", content_type="text/plain")
+
+    def delete_cart(self, request: Request, session: dict, product_id: str) -> Response:
+        session["cart"].pop(int(product_id), None)
+        return Response("Deleted", content_type="text/plain")
+
+    def view_cart(self, request: Request, session: dict) -> Response:
+        rows, _ = self._cart_lines(session)
+        if session["email"]:
+            checkout_button = '<a href="/checkout" class="btn btn-default check_out">Proceed To Checkout</a>'
+        else:
+            checkout_button = '<a class="btn btn-default check_out" data-target="#checkoutModal">Proceed To Checkout</a>'
+        empty_cart = "" if session["cart"] else '<span id="empty_cart"><p class="text-center"><b>Cart is empty!</b></p></span>'
+        return self.render("cart", session, title="Automation Exercise - Checkout",
+                           cart_rows=rows, empty_cart=empty_cart, checkout_button=checkout_button)
+
+    # Accounts
+
+    def login_page(self, request: Request, session: dict, login_error: str = "", signup_error: str = "") -> Response:
+        return self.render(
+            "login", session, title="Automation Exercise - Signup / Login",
+            login_error=f'<p style="color: red;">{login_error}</p>' if login_error else "",
+            signup_error=f'<p style="color: red;">{signup_error}</p>' if signup_error else ""
+        )
+
+    def login(self, request: Request, session: dict) -> Response:
+        form = request.form
+        account = self.accounts.get(form.get("email"))
+        if not account or account["password"] != form.get("password"):
+            return self.login_page(request, session, login_error="Your email or password is incorrect!")
+        session["email"] = account["email"]
+        return Response.redirect("/")
+
+    def signup(self, request: Request, session: dict) -> Response:
+        form = request.form
+        if form.get("form_type") == "create_account":
+            self.accounts[form["email"]] = {
+                "name": form.get("name", ""),
+                "email": form["email"],
+                "password": form.get("password", ""),
+                "title": form.get("title", ""),
+                "birth_day": form.get("days", ""),
+                "birth_month": form.get("months", ""),
+                "birth_year": form.get("years", ""),
+                "first_name": form.get("first_name", ""),
+                "last_name": form.get("last_name", ""),
+                "company": form.get("company", ""),
+                "address1": form.get("address1", ""),
+                "address2": form.get("address2", ""),
+                "country": form.get("country", ""),
+                "state": form.get("state", ""),
+                "city": form.get("city", ""),
+                "zipcode": form.get("zipcode", ""),
+                "mobile_number": form.get("mobile_number", "")
+            }
+            session["email"] = form["email"]
+            return Response.redirect("/account_created")
+
+        if form.get("email") in self.accounts:
+            return self.login_page(request, session, signup_error="Email Address already exist!")
+        return self.render(
+            "signup", session, title="Automation Exercise - Signup",
+            name=html.escape(form.get("name", ""), quote=True),
+            email=html.escape(form.get("email", ""), quote=True),
+            day_options="".join(f'<option value="{d}">{d}</option>' for d in range(1, 32)),
+            month_options="".join(f'<option value="{i}">{m}</option>' for i, m in enumerate(MONTHS, 1)),
+            year_options="".join(f'<option value="{y}">{y}</option>' for y in range(2021, 1899, -1)),
+            country_options="".join(f'<option value="{c}">{c}</option>' for c in COUNTRIES)
+        )
+
+    def account_created(self, request: Request, session: dict) -> Response:
+        return self._account_status(session, "ACCOUNT CREATED!", "account-created",
+                                    "Congratulations! Your new account has been successfully created!")
+
+    def logout(self, request: Request, session: dict) -> Response:
+        session["email"] = None
+        session["cart"] = {}
+        return Response.redirect("/login")
+
+    def delete_account(self, request: Request, session: dict) -> Response:
+        if session["email"]:
+            self.accounts.pop(session["email"], None)
+            session["email"] = None
+        return self._account_status(session, "ACCOUNT DELETED!", "account-deleted",
+                                    "Your account has been permanently deleted!")
+
+    # Checkout
+
+    def checkout(self, request: Request, session: dict) -> Response:
+        account = self.accounts.get(session["email"])
+        if not account:
+            return Response.redirect("/login")
+        address = "\n".join(f'<li class="{css}">{html.escape(value)}</li>' for css, value in [
+            ("address_firstname address_lastname", f"{account['title']}. {account['first_name']} {account['last_name']}"),
+            ("address_address1 address_address2", account["company"]),
+            ("address_address1 address_address2", account["address1"]),
+            ("address_address1 address_address2", account["address2"]),
+            ("address_city address_state_name address_postcode", f"{account['city']} {account['state']} {account['zipcode']}"),
+            ("address_country_name", account["country"]),
+            ("address_phone", account["mobile_number"]),
+        ])
+        rows, total = self._cart_lines(session)
+        return self.render("checkout", session, title="Automation Exercise - Checkout",
+                           address=address, cart_rows=rows, total=f"Rs. {total}")
+
+    def payment_page(self, request: Request, session: dict) -> Response:
+        if not session["email"]:
+            return Response.redirect("/login")
+        return self.render("payment", session, title="Automation Exercise - Payment")
+
+    def payment(self, request: Request, session: dict) -> Response:
+        if not session["email"]:
+            return Response.redirect("/login")
+        _, total = self._cart_lines(session)
+        session["cart"] = {}
+        return Response.redirect(f"/payment_done/{total}")
+
+    def payment_done(self, request: Request, session: dict, amount: str) -> Response:
+        return self.render("payment_done", session, title="Automation Exercise - Order Placed", amount=amount)
+
+    def download_invoice(self, request: Request, session: dict, amount: str) -> Response:
+        account = self.accounts.get(session["email"]) or {"first_name": "", "last_name": ""}
+        body = (f"Hi {account['first_name']} {account['last_name']}, "
+                f"Your total purchase amount is {amount}. Thank you")
+        return Response(body, content_type="text/plain",
+                        headers={"Content-Disposition": "attachment; filename=invoice.txt"})
+
+    # Misc
+
+    def contact_us(self, request: Request, session: dict) -> Response:
+        status = ""
+        if request.method == "POST":
+            status = ('<div class="status alert alert-success">'
+                      'Success! Your details have been submitted successfully.</div>')
+        return self.render("contact_us", session, title="Automation Exercise - Contact Us", contact_status=status)
+
+    def test_cases(self, request: Request, session: dict) -> Response:
+        items = "\n".join(
+            f'<div class="panel panel-default"><h4 class="panel-title"><u>Test Case {i}: {html.escape(name)}</u></h4></div>'
+            for i, name in enumerate(TEST_CASES, 1)
+        )
+        return self.render("test_cases", session, title="Automation Exercise - TEST CASES", test_case_list=items)
+
+    def subscribe(self, request: Request, session: dict) -> Response:
+        self.subscribers.append(request.form.get("email", ""))
+        return Response("Subscribed", content_type="text/plain")
+
+    def static(self, request: Request, session: dict, path: str) -> Response:
+        full_path = os.path.normpath(os.path.join(STATIC_DIR, path))
+        if not full_path.startswith(STATIC_DIR) or not os.path.isfile(full_path):
+            return Response("Not Found", status=404)
+        with open(full_path, "rb") as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(full_path)[0] or "application/octet-stream"
+        return Response(body, content_type=content_type, headers={"Cache-Control": "public, max-age=3600"})
+
+    # API
+
+    def _api(self, response_code: int, **payload) -> Response:
+        return Response(json.dumps({"responseCode": response_code, **payload}), content_type="application/json")
+
+    def api_products_list(self, request: Request, session: dict) -> Response:
+        return self._api(200, products=list(self.products.values()))
+
+    def api_search_product(self, request: Request, session: dict) -> Response:
+        term = request.form.get("search_product")
+        if term is None:
+            return self._api(400, message="Bad request, search_product parameter is missing in POST request.")
+        return self._api(200, products=self._search(term))
+
+    def api_verify_login(self, request: Request, session: dict) -> Response:
+        form = request.form
+        if "email" not in form or "password" not in form:
+            return self._api(400, message="Bad request, email or password parameter is missing in POST request.")
+        account = self.accounts.get(form["email"])
+        if account and account["password"] == form["password"]:
+            return self._api(200, message="User exists!")
+        return self._api(404, message="User not found!")
+
+    def api_create_account(self, request: Request, session: dict) -> Response:
+        form = request.form
+        if form.get("email") in self.accounts:
+            return self._api(400, message="Email already exists!")
+        self.accounts[form["email"]] = {
+            "name": form.get("name", ""),
+            "email": form["email"],
+            "password": form.get("password", ""),
+            "title": form.get("title", ""),
+            "birth_day": form.get("birth_date", ""),
+            "birth_month": form.get("birth_month", ""),
+            "birth_year": form.get("birth_year", ""),
+            "first_name": form.get("firstname", ""),
+            "last_name": form.get("lastname", ""),
+            "company": form.get("company", ""),
+            "address1": form.get("address1", ""),
+            "address2": form.get("address2", ""),
+            "country": form.get("country", ""),
+            "state": form.get("state", ""),
+            "city": form.get("city", ""),
+            "zipcode": form.get("zipcode", ""),
+            "mobile_number": form.get("mobile_number", "")
+        }
+        return self._api(201, message="User created!")
+
+    def api_delete_account(self, request: Request, session: dict) -> Response:
+        form = request.form
+        account = self.accounts.get(form.get("email"))
+        if not account or account["password"] != form.get("password"):
+            return self._api(404, message="Account not found!")
+        del self.accounts[form["email"]]
+        return self._api(200, message="Account deleted!")
+
+    def api_user_detail(self, request: Request, session: dict) -> Response:
+        account = self.accounts.get(request.query.get("email"))
+        if not account:
+            return self._api(404, message="Account not found with this email, try another email!")
+        user = {k: v for k, v in account.items() if k != "password"}
+        return self._api(200, user=user)
+
+
+def create_server(host: str = "127.0.0.1", port: int = 0, catalog_path: str = CATALOG_PATH) -> MockSiteServer:
+    """Build a mock site server around a fresh ShopApp"""
+    return MockSiteServer(ShopApp(catalog_path), host=host, port=port)
@@ -0,0 +1,154 @@
+import asyncio
+import logging
+import threading
+from http.cookies import SimpleCookie
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    302: "Found",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error"
+}
+
+
+class Request:
+    """Parsed HTTP request"""
+
+    def __init__(self, method: str, target: str, headers: Dict[str, str], body: bytes):
+        self.method = method
+        parts = urlsplit(target)
+        self.path = parts.path
+        self.query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        self.headers = headers
+        self.body = body
+        cookie = SimpleCookie()
+        cookie.load(headers.get("cookie", ""))
+        self.cookies = {name: morsel.value for name, morsel in cookie.items()}
+
+    @property
+    def form(self) -> Dict[str, str]:
+        """URL-encoded form fields of the body"""
+        if "application/x-www-form-urlencoded" not in self.headers.get("content-type", ""):
+            return {}
+        return {k: v[0] for k, v in parse_qs(self.body.decode(), keep_blank_values=True).items()}
+
+
+class Response:
+    """HTTP response to be serialized by the server"""
+
+    def __init__(self, body="", status: int = 200, content_type: str = "text/html; charset=utf-8",
+                 headers: Optional[Dict[str, str]] = None):
+        self.body = body.encode() if isinstance(body, str) else body
+        self.status = status
+        self.headers = {"Content-Type": content_type, **(headers or {})}
+        self.cookies: List[str] = []
+
+    @classmethod
+    def redirect(cls, location: str) -> "Response":
+        """Build a 302 redirect"""
+        return cls("", status=302, headers={"Location": location})
+
+    def set_cookie(self, name: str, value: str):
+        """Add a Set-Cookie header"""
+        self.cookies.append(f"{name}={value}; Path=/; SameSite=Lax")
+
+    def encode(self, keep_alive: bool) -> bytes:
+        """Serialize status line, headers and body"""
+        lines = [f"HTTP/1.1 {self.status} {REASONS.get(self.status, 'OK')}"]
+        headers = {**self.headers, "Content-Length": str(len(self.body)),
+                   "Connection": "keep-alive" if keep_alive else "close"}
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        lines += [f"Set-Cookie: {cookie}" for cookie in self.cookies]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode() + self.body
+
+
+class MockSiteServer:
+    """Minimal asyncio HTTP/1.1 server running in a background thread"""
+
+    def __init__(self, app: Callable[[Request], Response], host: str = "127.0.0.1", port: int = 0):
+        self.app = app
+        self.host = host
+        self.port = port
+        self.logger = logging.getLogger(__name__)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    @property
+    def url(self) -> str:
+        """Base URL the server is listening on"""
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> str:
+        """Start serving in a daemon thread and return the base URL"""
+        self._thread = threading.Thread(target=self._run, name="mock-site", daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout=10):
+            raise RuntimeError("Mock site server did not start")
+        self.logger.info(f"Mock site listening on {self.url}")
+        return self.url
+
+    def stop(self):
+        """Stop serving and wait for the thread to exit"""
+        if self._loop and self._server:
+            self._loop.call_soon_threadsafe(self._server.close)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread:
+            self._thread.join(timeout=10)
+
+    def _run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[Request, bool]]:
+        """Read one request; returns None when the client closed the connection"""
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        method, target, version = request_line.decode("latin-1").split()
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+        body = await reader.readexactly(length) if length else b""
+        keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+        return Request(method, target, headers, body), keep_alive
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                parsed = await self._read_request(reader)
+                if parsed is None:
+                    break
+                request, keep_alive = parsed
+                try:
+                    response = self.app(request)
+                except Exception as e:
+                    self.logger.exception(f"Mock site failed to handle {request.method} {request.path}")
+                    response = Response(f"Internal error: {e}", status=500, content_type="text/plain")
+                writer.write(response.encode(keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
@@ -0,0 +1,64 @@
+from typing import Dict, List, Optional
+from urllib.parse import urlencode
+
+from .app import CATALOG_PATH, ShopApp
+from .server import Request
+
+SIGNUP_FORM = {
+    "form_type": "create_account", "name": "Snapshot User", "email": "snapshot@example.com", "password": "secret",
+    "title": "Mr", "days": "1", "months": "1", "years": "1990", "first_name": "Snapshot", "last_name": "User",
+    "company": "Mock Ltd", "address1": "1 Main St", "address2": "Apt 1", "country": "Canada", "state": "Ontario",
+    "city": "Toronto", "zipcode": "10000", "mobile_number": "5550000000"
+}
+
+
+class SnapshotClient:
+    """Calls a ShopApp in-process with a session cookie, as a browser would over HTTP"""
+
+    def __init__(self, app: ShopApp):
+        self.app = app
+        self.cookie = ""
+
+    def html(self, path: str, form: Optional[dict] = None) -> str:
+        headers = {"cookie": self.cookie}
+        body = b""
+        if form is not None:
+            headers["content-type"] = "application/x-www-form-urlencoded"
+            body = urlencode(form).encode()
+        response = self.app(Request("POST" if form is not None else "GET", path, headers, body))
+        for cookie in response.cookies:
+            if cookie.startswith("sessionid="):
+                self.cookie = cookie.split(";", 1)[0]
+        if response.status == 302:
+            return self.html(response.headers["Location"])
+        return response.body.decode()
+
+
+def capture_snapshots(catalog_path: str = CATALOG_PATH) -> Dict[str, List[str]]:
+    """HTML of the mock site's pages in the states the tests see, keyed by locator page name"""
+    app = ShopApp(catalog_path)
+    guest, user = SnapshotClient(app), SnapshotClient(app)
+    snapshots: Dict[str, List[str]] = {
+        "Home": [guest.html("/"), guest.html("/contact_us"), guest.html("/contact_us", {"name": "Guest"})],
+        "Login": [guest.html("/login"), guest.html("/login", {"email": "nobody@example.com", "password": "x"})],
+        "Products": [guest.html("/products"), guest.html("/products?search=top"), guest.html("/product_details/1")],
+    }
+    guest.html("/add_to_cart/1")
+    guest.html("/add_to_cart/2")
+    snapshots["Cart"] = [guest.html("/view_cart")]
+    signup = user.html("/signup", {"name": SIGNUP_FORM["name"], "email": SIGNUP_FORM["email"]})
+    account_created = user.html("/signup", SIGNUP_FORM)
+    snapshots["Signup"] = [signup, account_created]
+    snapshots["Home"].append(user.html("/"))
+    user.html("/add_to_cart/1")
+    snapshots["Cart"].append(user.html("/view_cart"))
+    snapshots["Checkout"] = [user.html("/checkout"), user.html("/payment")]
+    payment_done = user.html("/payment", {})
+    snapshots["Checkout"].append(payment_done)
+    # The cart page object downloads the invoice from the order confirmation
+    snapshots["Cart"].append(payment_done)
+    account_deleted = user.html("/delete_account")
+    snapshots["Home"].append(account_deleted)
+    snapshots["Subscription"] = [snapshots["Home"][0]]
+    snapshots["AccountStatus"] = [account_created, account_deleted]
+    return snapshots
@@ -0,0 +1,67 @@
+(function () {
+    function show(id) { document.getElementById(id).classList.add("show"); }
+    function hide(id) { document.getElementById(id).classList.remove("show"); }
+
+    document.addEventListener("click", function (event) {
+        var target = event.target;
+
+        var addToCart = target.closest(".add-to-cart");
+        if (addToCart) {
+            event.preventDefault();
+            var quantity = document.getElementById("quantity");
+            var query = quantity ? "?quantity=" + encodeURIComponent(quantity.value) : "";
+            fetch("/add_to_cart/" + addToCart.dataset.productId + query).then(function () { show("cartModal"); });
+            return;
+        }
+        if (target.closest(".close-modal")) {
+            hide("cartModal");
+            return;
+        }
+        if (target.closest(".close-checkout-modal")) {
+            hide("checkoutModal");
+            return;
+        }
+        var checkout = target.closest("a.check_out[data-target]");
+        if (checkout) {
+            event.preventDefault();
+            show(checkout.dataset.target.substring(1));
+            return;
+        }
+        var toggle = target.closest("a[data-toggle='collapse']");
+        if (toggle) {
+            event.preventDefault();
+            document.querySelector(toggle.getAttribute("href")).classList.toggle("in");
+            return;
+        }
+        var remove = target.closest("a.cart_quantity_delete");
+        if (remove) {
+            event.preventDefault();
+            var productId = remove.dataset.productId;
+            fetch("/delete_cart/" + productId).then(function () {
+                document.getElementById("product-" + productId).remove();
+            });
+            return;
+        }
+        if (target.closest("#submit_search")) {
+            var search = document.getElementById("search_product").value;
+            window.location = "/products?search=" + encodeURIComponent(search);
+            return;
+        }
+        if (target.closest("#scrollUp")) {
+            event.preventDefault();
+            window.scrollTo(0, 0);
+        }
+    });
+
+    document.addEventListener("submit", function (event) {
+        var form = event.target;
+        if (form.id === "subscribe-form") {
+            event.preventDefault();
+            fetch("/subscribe", {method: "POST", body: new URLSearchParams(new FormData(form))})
+                .then(function () { document.getElementById("success-subscribe").classList.remove("hide"); });
+        } else if (form.id === "review-form") {
+            event.preventDefault();
+            document.getElementById("review-section").classList.remove("hide");
+        }
+    });
+})();
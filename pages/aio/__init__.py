@@ -0,0 +1 @@
+"""Async page objects mirroring the pages package"""
@@ -0,0 +1,99 @@
+from playwright.async_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from config.config import Config
+from ..extraction import Column, async_extract_rows
+from ..forms import Field, async_fill_form
+from ..registry import locator_registry
+from ..retry import ACTION_POLICY, NAVIGATION_POLICY, RetryPolicy, retrier
+from ..timing import Instrumented
+from ..wait_strategies import WaitStrategy, LoadState, get_wait_strategy
+
+class AsyncBasePage(Instrumented):
+    def __init__(self, page: Page):
+        self.page = page
+        self.url = Config.BASE_URL
+        self.logger = logging.getLogger(__name__)
+        self.default_click_wait = get_wait_strategy(Config.DEFAULT_CLICK_WAIT)
+        self.navigation_wait = LoadState("domcontentloaded")
+
+    def locator(self, selector: str, nth: Optional[int] = None) -> Locator:
+        """Locator for selector, interned per page; strict unless an index is given"""
+        return locator_registry.locator(self.page, selector, nth)
+
+    async def navigate(self, url: str, max_retries: Optional[int] = None,
+                       timeout: int = Config.NAVIGATION_TIMEOUT):
+        """Navigate to URL, retrying navigation errors and timeouts with backoff"""
+        self.logger.info(f"Navigating to {url}")
+        policy = NAVIGATION_POLICY if max_retries is None else RetryPolicy(NAVIGATION_POLICY.retry_on, max_retries)
+        await retrier.acall("action", policy, self.navigation_wait.arun, self.page,
+                            lambda: self.page.goto(url, timeout=timeout, wait_until="commit"), timeout)
+
+    async def click(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, wait: Optional[WaitStrategy] = None,
+                    nth: Optional[int] = None):
+        """Click element, then wait according to the given strategy"""
+        wait = wait or self.default_click_wait
+        self.logger.info(f"Clicking element: {selector} (wait: {wait!r})")
+        try:
+            element = self.locator(selector, nth)
+            await retrier.acall("action", ACTION_POLICY, wait.arun, self.page, lambda: element.click(timeout=timeout),
+                                timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to click element: {selector}")
+            raise e
+
+    async def fill(self, selector: str, text: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None):
+        """Fill text in element"""
+        self.logger.info(f"Filling {text} in {selector}")
+        try:
+            await retrier.acall("action", ACTION_POLICY, self.locator(selector, nth).fill, text, timeout=timeout)
+        except Exception as e:
+            self.logger.error(f"Failed to fill text in element: {selector}")
+            raise e
+
+    async def fill_form(self, form: str, fields: List[Field]):
+        """Fill a form's fields in one round-trip, falling back to filling them one by one"""
+        self.logger.info(f"Filling {len(fields)} fields of {form}")
+        await async_fill_form(self, form, fields)
+
+    async def get_text(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None) -> str:
+        """Get text from element once it is visible"""
+        try:
+            element = self.locator(selector, nth)
+            await element.wait_for(state="visible", timeout=timeout)
+            return await element.text_content(timeout=timeout) or ""
+        except Exception as e:
+            self.logger.error(f"Failed to get text from element: {selector}")
+            raise e
+
+    async def get_element_count(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT) -> int:
+        """Get count of elements matching selector, waiting for the first one"""
+        elements = self.locator(selector)
+        await elements.first.wait_for(state="attached", timeout=timeout)
+        return await elements.count()
+
+    async def extract_rows(self, row_selector: str, schema: Dict[str, Column]) -> List[dict]:
+        """Get a typed record per row, reading every column in one round-trip"""
+        return await async_extract_rows(self.page, row_selector, schema)
+
+    async def is_visible(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None) -> bool:
+        """Check if element becomes visible within the timeout"""
+        try:
+            await self.locator(selector, nth).wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
+    async def wait_for_navigation(self, timeout: int = Config.NAVIGATION_TIMEOUT):
+        """Wait for navigation to complete"""
+        await self.navigation_wait.arun(self.page, lambda: asyncio.sleep(0), timeout)
+
+    async def wait_for_element(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None):
+        """Wait for element to be visible"""
+        await self.locator(selector, nth).wait_for(state="visible", timeout=timeout)
+
+    async def take_screenshot(self, name: str):
+        """Take screenshot"""
+        await self.page.screenshot(path=f"screenshots/{name}.png")
@@ -0,0 +1,45 @@
+from .base_page import AsyncBasePage
+from ..locators import CartLocators
+from ..wait_strategies import ElementState, NoWait, UrlChange
+
+class AsyncCartPage(CartLocators, AsyncBasePage):
+    async def verify_cart_page(self) -> bool:
+        """Verify cart page is loaded"""
+        return await self.is_visible(self.CART_INFO)
+    
+    async def get_cart_items(self) -> list:
+        """Get all cart items details"""
+        return await self.extract_rows(self.CART_ITEMS, self.CART_ITEM_COLUMNS)
+    
+    async def remove_product(self, index: int = 0):
+        """Remove product from cart"""
+        row_id = await self.locator(self.CART_ITEMS, index).get_attribute("id")
+        await self.click(self.REMOVE_BUTTONS, nth=index, wait=ElementState(f"tr#{row_id}", "detached"))
+    
+    async def click_proceed_to_checkout(self):
+        """Click proceed to checkout button"""
+        await self.click(self.PROCEED_CHECKOUT_BUTTON)
+    
+    async def click_register_login(self):
+        """Click register/login button"""
+        await self.click(self.REGISTER_LOGIN_BUTTON, wait=UrlChange("**/login"))
+    
+    async def subscribe_newsletter(self, email: str):
+        """Subscribe to newsletter"""
+        await self.fill(self.SUBSCRIPTION_EMAIL, email)
+        await self.click(self.SUBSCRIPTION_BUTTON, wait=ElementState(self.SUBSCRIPTION_SUCCESS))
+    
+    async def verify_subscription_success(self) -> bool:
+        """Verify subscription success message"""
+        return await self.is_visible(self.SUBSCRIPTION_SUCCESS)
+    
+    async def download_invoice(self):
+        """Click download invoice button"""
+        async with self.page.expect_download() as download_info:
+            await self.click(self.DOWNLOAD_INVOICE_BUTTON, wait=NoWait())
+        download = await download_info.value
+        return download
+    
+    async def verify_product_removed(self, product_name: str) -> bool:
+        """Verify product is removed from cart"""
+        return not any(item["name"] == product_name for item in await self.get_cart_items()) 
\ No newline at end of file
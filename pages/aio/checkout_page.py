@@ -0,0 +1,41 @@
+from .base_page import AsyncBasePage
+from ..locators import CheckoutLocators
+from ..wait_strategies import UrlChange
+
+class AsyncCheckoutPage(CheckoutLocators, AsyncBasePage):
+    async def verify_address_details(self) -> dict:
+        """Get and verify address details"""
+        delivery = await self.get_text(self.DELIVERY_ADDRESS)
+        billing = await self.get_text(self.BILLING_ADDRESS)
+        return {
+            "delivery": delivery,
+            "billing": billing
+        }
+    
+    async def verify_order_review(self) -> bool:
+        """Verify order review section is visible"""
+        return await self.is_visible(self.ORDER_REVIEW)
+    
+    async def add_comment(self, comment: str):
+        """Add comment to order"""
+        await self.fill(self.COMMENT_TEXTAREA, comment)
+    
+    async def click_place_order(self):
+        """Click place order button"""
+        await self.click(self.PLACE_ORDER_BUTTON, wait=UrlChange("**/payment"))
+    
+    async def fill_payment_details(self, payment_info: dict):
+        """Fill payment form details"""
+        await self.fill_form("payment details", self.payment_form(payment_info))
+    
+    async def click_pay_button(self):
+        """Click pay and confirm order button"""
+        await self.click(self.PAY_BUTTON, wait=UrlChange("**/payment_done/**"))
+    
+    async def verify_success_message(self) -> bool:
+        """Verify order success message"""
+        return "Your order has been placed successfully" in await self.get_text(self.SUCCESS_MESSAGE)
+    
+    async def verify_payment_form(self) -> bool:
+        """Verify payment form is visible"""
+        return await self.is_visible(self.PAYMENT_FORM) 
\ No newline at end of file
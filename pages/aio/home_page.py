@@ -0,0 +1,105 @@
+from .base_page import AsyncBasePage
+from ..locators import HomeLocators
+from config.config import Config
+from ..wait_strategies import ElementState, NoWait, UrlChange
+from ..retry import retry_step
+
+class AsyncHomePage(HomeLocators, AsyncBasePage):
+    def __init__(self, page):
+        super().__init__(page)
+        self.url = Config.BASE_URL
+
+    async def load(self):
+        """Navigate to home page"""
+        await self.navigate(self.url)
+
+    @retry_step
+    async def click_products(self):
+        """Click on Products link"""
+        await self.click(self.PRODUCTS_LINK, wait=UrlChange("**/products"))
+
+    @retry_step
+    async def click_signup_login(self):
+        """Click on Signup / Login link"""
+        await self.click(self.SIGNUP_LOGIN_LINK, wait=UrlChange("**/login"))
+
+    @retry_step
+    async def click_cart(self):
+        """Click on Cart link"""
+        await self.click(self.CART_LINK, wait=UrlChange("**/view_cart"))
+
+    @retry_step
+    async def click_test_cases(self):
+        """Click on Test Cases link"""
+        await self.click(self.TEST_CASES_LINK, wait=UrlChange("**/test_cases"))
+
+    @retry_step
+    async def click_contact_us(self):
+        """Click on Contact Us link"""
+        await self.click(self.CONTACT_US_LINK, wait=UrlChange("**/contact_us"))
+
+    async def subscribe_newsletter(self, email: str):
+        """Subscribe to newsletter"""
+        await self.fill(self.SUBSCRIPTION_EMAIL, email)
+        await self.click(self.SUBSCRIPTION_BUTTON, wait=ElementState(self.SUBSCRIPTION_SUCCESS))
+
+    async def is_subscription_successful(self) -> bool:
+        """Check if subscription was successful"""
+        return await self.is_visible(self.SUBSCRIPTION_SUCCESS)
+
+    async def select_category(self, category: str):
+        """Select a category (Women, Men, or Kids)"""
+        category_map = {
+            "Women": self.CATEGORY_WOMEN,
+            "Men": self.CATEGORY_MEN,
+            "Kids": self.CATEGORY_KIDS
+        }
+        if category in category_map:
+            await self.click(category_map[category], wait=ElementState(f"div#{category}"))
+        else:
+            raise ValueError(f"Invalid category: {category}")
+
+    async def verify_page_loaded(self) -> bool:
+        """Verify home page is loaded"""
+        return await self.is_visible(self.PRODUCTS_LINK) and await self.is_visible(self.SIGNUP_LOGIN_LINK)
+
+    async def fill_contact_form(self, contact_info: dict):
+        """Fill and submit contact form"""
+        await self.fill_form("contact form", self.contact_form(contact_info))
+        await self.click(self.CONTACT_SUBMIT)
+
+    async def verify_contact_success(self) -> bool:
+        """Verify contact form submission success"""
+        return "Success! Your details have been submitted successfully." in await self.get_text(self.CONTACT_SUCCESS)
+
+    async def scroll_to_bottom(self):
+        """Scroll to bottom of page"""
+        await self.page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+
+    async def scroll_to_top(self):
+        """Scroll to top of page"""
+        await self.page.evaluate("window.scrollTo(0, 0)")
+
+    async def click_scroll_up_button(self):
+        """Click scroll up button"""
+        await self.click(self.SCROLL_UP_BUTTON, wait=NoWait())
+
+    async def verify_logged_in_as(self, username: str) -> bool:
+        """Verify logged in as specific user"""
+        return f"Logged in as {username}" in await self.get_text(self.LOGGED_IN_USER)
+
+    async def click_delete_account(self):
+        """Click delete account button"""
+        await self.click(self.DELETE_ACCOUNT, wait=UrlChange("**/delete_account"))
+
+    async def verify_account_deleted(self) -> bool:
+        """Verify account deleted message"""
+        return "ACCOUNT DELETED!" in await self.get_text(self.ACCOUNT_DELETED)
+
+    async def click_continue(self):
+        """Click continue button"""
+        await self.click(self.CONTINUE_BUTTON)
+
+    async def click_logout(self):
+        """Click logout button"""
+        await self.click(self.LOGOUT_BUTTON, wait=UrlChange("**/login")) 
\ No newline at end of file
@@ -0,0 +1,45 @@
+from .base_page import AsyncBasePage
+from ..locators import LoginLocators
+from ..wait_strategies import Navigation
+
+class AsyncLoginPage(LoginLocators, AsyncBasePage):
+    async def enter_login_credentials(self, email: str, password: str):
+        """Enter login credentials"""
+        await self.fill(self.LOGIN_EMAIL, email)
+        await self.fill(self.LOGIN_PASSWORD, password)
+    
+    async def click_login(self):
+        """Click login button"""
+        await self.click(self.LOGIN_BUTTON, wait=Navigation())
+    
+    async def enter_signup_details(self, name: str, email: str):
+        """Enter signup details"""
+        await self.fill(self.SIGNUP_NAME, name)
+        await self.fill(self.SIGNUP_EMAIL, email)
+    
+    async def click_signup(self):
+        """Click signup button"""
+        await self.click(self.SIGNUP_BUTTON, wait=Navigation())
+    
+    async def verify_login_form_visible(self) -> bool:
+        """Verify login form is visible"""
+        return "Login to your account" in await self.get_text(self.LOGIN_HEADER)
+    
+    async def verify_signup_form_visible(self) -> bool:
+        """Verify signup form is visible"""
+        return "New User Signup!" in await self.get_text(self.SIGNUP_HEADER)
+    
+    async def get_error_message(self) -> str:
+        """Get error message text"""
+        try:
+            return await self.get_text(self.ERROR_MESSAGE)
+        except:
+            return ""  # Return empty string if error message is not found
+    
+    async def verify_login_header(self) -> bool:
+        """Verify login header is visible"""
+        return "Login to your account" in await self.get_text(self.LOGIN_HEADER)
+    
+    async def verify_signup_header(self) -> bool:
+        """Verify signup header is visible"""
+        return "New User Signup!" in await self.get_text(self.SIGNUP_HEADER) 
\ No newline at end of file
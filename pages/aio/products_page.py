@@ -0,0 +1,63 @@
+from .base_page import AsyncBasePage
+from ..locators import ProductsLocators
+from ..wait_strategies import ElementState, UrlChange
+from ..retry import retry_step
+
+class AsyncProductsPage(ProductsLocators, AsyncBasePage):
+    async def verify_products_page(self) -> bool:
+        """Verify products page is loaded"""
+        return "ALL PRODUCTS" in await self.get_text(self.ALL_PRODUCTS_HEADER)
+    
+    @retry_step
+    async def search_product(self, product_name: str):
+        """Search for a product"""
+        await self.fill(self.SEARCH_INPUT, product_name)
+        await self.click(self.SEARCH_BUTTON, wait=UrlChange("**/products?search=*"))
+    
+    async def verify_search_results(self) -> bool:
+        """Verify search results are displayed"""
+        return "SEARCHED PRODUCTS" in await self.get_text(self.SEARCHED_PRODUCTS_HEADER)
+    
+    async def get_product_count(self) -> int:
+        """Get number of products displayed"""
+        return await self.get_element_count(self.PRODUCT_ITEMS)
+    
+    async def get_products(self) -> list:
+        """Get id, name and price of every product in the grid"""
+        return await self.extract_rows(self.PRODUCT_ITEMS, self.PRODUCT_COLUMNS)
+    
+    async def click_view_product(self, index: int = 0):
+        """Click view product button"""
+        await self.click(self.VIEW_PRODUCT_BUTTONS, nth=index, wait=UrlChange("**/product_details/*"))
+    
+    async def add_to_cart(self, index: int = 0):
+        """Add product to cart"""
+        await self.click(self.ADD_TO_CART_BUTTONS, nth=index, wait=ElementState(self.CART_MODAL))
+    
+    async def click_continue_shopping(self):
+        """Click continue shopping button"""
+        await self.click(self.CONTINUE_SHOPPING_BUTTON, wait=ElementState(self.CART_MODAL, "hidden"))
+    
+    async def click_view_cart(self):
+        """Click view cart button"""
+        await self.click(self.VIEW_CART_BUTTON, wait=UrlChange("**/view_cart"))
+    
+    async def get_product_details(self) -> dict:
+        """Get product details from product page"""
+        await self.wait_for_element(self.PRODUCT_INFORMATION)
+        return (await self.extract_rows(self.PRODUCT_INFORMATION, self.PRODUCT_DETAIL_COLUMNS))[0]
+    
+    async def set_quantity(self, quantity: int):
+        """Set product quantity"""
+        await self.fill(self.QUANTITY_INPUT, str(quantity))
+    
+    async def write_review(self, name: str, email: str, review: str):
+        """Write a product review"""
+        await self.fill(self.REVIEW_NAME, name)
+        await self.fill(self.REVIEW_EMAIL, email)
+        await self.fill(self.REVIEW_TEXT, review)
+        await self.click(self.SUBMIT_REVIEW_BUTTON, wait=ElementState(self.REVIEW_SUCCESS_MESSAGE))
+    
+    async def verify_review_success(self) -> bool:
+        """Verify review success message"""
+        return "Thank you for your review" in await self.get_text(self.REVIEW_SUCCESS_MESSAGE) 
\ No newline at end of file
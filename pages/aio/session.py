@@ -0,0 +1,28 @@
+from playwright.async_api import Page
+from typing import Awaitable, Callable, Optional
+
+from .cart_page import AsyncCartPage
+from .checkout_page import AsyncCheckoutPage
+from .home_page import AsyncHomePage
+from .login_page import AsyncLoginPage
+from .products_page import AsyncProductsPage
+from .signup_page import AsyncSignupPage
+
+class AsyncSession:
+    """Every async page object bound to the page of one isolated browser context"""
+
+    def __init__(self, page: Page, new_session: Optional[Callable[[], Awaitable["AsyncSession"]]] = None):
+        self.page = page
+        self.home = AsyncHomePage(page)
+        self.login = AsyncLoginPage(page)
+        self.signup = AsyncSignupPage(page)
+        self.products = AsyncProductsPage(page)
+        self.cart = AsyncCartPage(page)
+        self.checkout = AsyncCheckoutPage(page)
+        self._new_session = new_session
+
+    async def new_session(self) -> "AsyncSession":
+        """Another isolated context in the same browser, e.g. for a second user"""
+        if self._new_session is None:
+            raise RuntimeError("This session cannot open further sessions")
+        return await self._new_session()
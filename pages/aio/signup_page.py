@@ -0,0 +1,44 @@
+from .base_page import AsyncBasePage
+from ..locators import SignupLocators
+from ..wait_strategies import Navigation, UrlChange
+from typing import Dict
+
+class AsyncSignupPage(SignupLocators, AsyncBasePage):
+    async def fill_account_details(self, user_data: Dict[str, str]):
+        """Fill all account details"""
+        # Wait for form to be fully loaded
+        await self.wait_for_element(self.ACCOUNT_INFO_HEADER)
+        
+        await self.fill_form("account details", self.account_form(user_data))
+    
+    async def click_create_account(self):
+        """Click create account button"""
+        await self.click(self.CREATE_ACCOUNT_BUTTON, wait=UrlChange("**/account_created"))
+    
+    async def verify_account_created(self) -> bool:
+        """Verify account created message is visible"""
+        try:
+            await self.wait_for_element(self.ACCOUNT_CREATED_MESSAGE)
+            return "ACCOUNT CREATED!" in await self.get_text(self.ACCOUNT_CREATED_MESSAGE)
+        except:
+            return False
+    
+    async def click_continue(self):
+        """Click continue button"""
+        await self.click(self.CONTINUE_BUTTON, wait=Navigation())
+    
+    async def verify_account_info_visible(self) -> bool:
+        """Verify account information form is visible"""
+        try:
+            await self.wait_for_element(self.ACCOUNT_INFO_HEADER)
+            return "ENTER ACCOUNT INFORMATION" in await self.get_text(self.ACCOUNT_INFO_HEADER)
+        except:
+            return False
+    
+    async def select_dropdown(self, locator: str, value: str):
+        """Select value from dropdown"""
+        try:
+            await self.locator(locator).select_option(value)
+        except Exception as e:
+            self.logger.error(f"Failed to select option in dropdown: {locator}")
+            raise e 
\ No newline at end of file
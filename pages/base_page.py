@@ -1,85 +1,102 @@
-from playwright.sync_api import Page
+from playwright.sync_api import Locator, Page, TimeoutError as PlaywrightTimeoutError
 import logging
-import time
-from typing import Optional
+from typing import Dict, List, Optional
+
+from config.config import Config
+from .budgets import apply_budgets
+from .extraction import Column, extract_rows
+from .forms import Field, fill_form
+from .registry import locator_registry
+from .retry import ACTION_POLICY, NAVIGATION_POLICY, RetryPolicy, retrier
+from .timing import Instrumented
+from .wait_strategies import WaitStrategy, LoadState, get_wait_strategy
+
+class BasePage(Instrumented):
+    def __init_subclass__(cls, **kwargs):
+        # Budgets wrap the plain methods first, so the timing Instrumented adds stays the outermost wrapper
+        apply_budgets(cls)
+        super().__init_subclass__(**kwargs)
 
-class BasePage:
     def __init__(self, page: Page):
         self.page = page
-        self.url = "https://www.automationexercise.com"
+        self.url = Config.BASE_URL
         self.logger = logging.getLogger(__name__)
+        self.default_click_wait = get_wait_strategy(Config.DEFAULT_CLICK_WAIT)
+        self.navigation_wait = LoadState("domcontentloaded")
 
-    def navigate(self, url: str, max_retries: int = 3, timeout: int = 60000):
-        """Navigate to URL with retry logic"""
+    def locator(self, selector: str, nth: Optional[int] = None) -> Locator:
+        """Locator for selector, interned per page; strict unless an index is given"""
+        return locator_registry.locator(self.page, selector, nth)
+
+    def navigate(self, url: str, max_retries: Optional[int] = None, timeout: int = Config.NAVIGATION_TIMEOUT):
+        """Navigate to URL, retrying navigation errors and timeouts with backoff"""
         self.logger.info(f"Navigating to {url}")
-        for attempt in range(max_retries):
-            try:
-                self.page.goto(url, timeout=timeout)
-                self.page.wait_for_load_state("networkidle", timeout=timeout)
-                self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
-                return
-            except Exception as e:
-                if attempt == max_retries - 1:
-                    raise e
-                time.sleep(2)  # Wait before retry
+        policy = NAVIGATION_POLICY if max_retries is None else RetryPolicy(NAVIGATION_POLICY.retry_on, max_retries)
+        retrier.call("action", policy, self.navigation_wait.run, self.page,
+                     lambda: self.page.goto(url, timeout=timeout, wait_until="commit"), timeout)
 
-    def click(self, selector: str, timeout: int = 60000):
-        """Click element with retry logic"""
-        self.logger.info(f"Clicking element: {selector}")
+    def click(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, wait: Optional[WaitStrategy] = None,
+              nth: Optional[int] = None):
+        """Click element, then wait according to the given strategy"""
+        wait = wait or self.default_click_wait
+        self.logger.info(f"Clicking element: {selector} (wait: {wait!r})")
         try:
-            self.page.wait_for_selector(selector, timeout=timeout, state="visible")
-            element = self.page.locator(selector)
-            element.wait_for(state="visible", timeout=timeout)
-            element.click()
-            self.page.wait_for_load_state("networkidle", timeout=timeout)
+            # click() auto-waits for the element to be visible, stable and enabled
+            element = self.locator(selector, nth)
+            retrier.call("action", ACTION_POLICY, wait.run, self.page, lambda: element.click(timeout=timeout), timeout)
         except Exception as e:
             self.logger.error(f"Failed to click element: {selector}")
             raise e
 
-    def fill(self, selector: str, text: str, timeout: int = 60000):
-        """Fill text in element with retry logic"""
+    def fill(self, selector: str, text: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None):
+        """Fill text in element"""
         self.logger.info(f"Filling {text} in {selector}")
         try:
-            self.page.wait_for_selector(selector, timeout=timeout, state="visible")
-            element = self.page.locator(selector)
-            element.wait_for(state="visible", timeout=timeout)
-            element.fill(text)
+            retrier.call("action", ACTION_POLICY, self.locator(selector, nth).fill, text, timeout=timeout)
         except Exception as e:
             self.logger.error(f"Failed to fill text in element: {selector}")
             raise e
 
-    def get_text(self, selector: str, timeout: int = 60000) -> str:
-        """Get text from element with retry logic"""
+    def fill_form(self, form: str, fields: List[Field]):
+        """Fill a form's fields in one round-trip, falling back to filling them one by one"""
+        self.logger.info(f"Filling {len(fields)} fields of {form}")
+        fill_form(self, form, fields)
+
+    def get_text(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None) -> str:
+        """Get text from element once it is visible"""
         try:
-            self.page.wait_for_selector(selector, timeout=timeout, state="visible")
-            element = self.page.locator(selector)
+            element = self.locator(selector, nth)
             element.wait_for(state="visible", timeout=timeout)
-            return element.text_content() or ""
+            return element.text_content(timeout=timeout) or ""
         except Exception as e:
             self.logger.error(f"Failed to get text from element: {selector}")
             raise e
 
-    def get_element_count(self, selector: str, timeout: int = 60000) -> int:
-        """Get count of elements matching selector"""
-        self.page.wait_for_selector(selector, timeout=timeout)
-        return len(self.page.query_selector_all(selector))
+    def get_element_count(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT) -> int:
+        """Get count of elements matching selector, waiting for the first one"""
+        elements = self.locator(selector)
+        elements.first.wait_for(state="attached", timeout=timeout)
+        return elements.count()
+
+    def extract_rows(self, row_selector: str, schema: Dict[str, Column]) -> List[dict]:
+        """Get a typed record per row, reading every column in one round-trip"""
+        return extract_rows(self.page, row_selector, schema)
 
-    def is_visible(self, selector: str, timeout: int = 60000) -> bool:
-        """Check if element is visible"""
+    def is_visible(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None) -> bool:
+        """Check if element becomes visible within the timeout"""
         try:
-            element = self.page.wait_for_selector(selector, timeout=timeout, state="visible")
-            return element.is_visible()
-        except:
+            self.locator(selector, nth).wait_for(state="visible", timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
             return False
 
-    def wait_for_navigation(self, timeout: int = 60000):
+    def wait_for_navigation(self, timeout: int = Config.NAVIGATION_TIMEOUT):
         """Wait for navigation to complete"""
-        self.page.wait_for_load_state("networkidle", timeout=timeout)
-        self.page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        self.navigation_wait.run(self.page, lambda: None, timeout)
 
-    def wait_for_element(self, locator: str, timeout: int = 30000):
+    def wait_for_element(self, selector: str, timeout: int = Config.DEFAULT_TIMEOUT, nth: Optional[int] = None):
         """Wait for element to be visible"""
-        self.page.wait_for_selector(locator, timeout=timeout, state="visible")
+        self.locator(selector, nth).wait_for(state="visible", timeout=timeout)
 
     def take_screenshot(self, name: str):
         """Take screenshot"""
@@ -0,0 +1,156 @@
+import functools
+import inspect
+import json
+import logging
+import time
+import weakref
+from typing import Callable, Dict, List, Optional
+
+from config.config import Config
+
+NAVIGATION_TIMING_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType("navigation")[0];
+    return nav ? {dom_content_loaded_ms: nav.domContentLoadedEventEnd, load_ms: nav.loadEventEnd} : {};
+}
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class Budget:
+    """Performance limits of a page-object method; unset limits are not checked"""
+    METRICS = ("duration_ms", "dom_content_loaded_ms", "load_ms", "requests")
+
+    def __init__(self, duration_ms: Optional[float] = None, dom_content_loaded_ms: Optional[float] = None,
+                 load_ms: Optional[float] = None, max_requests: Optional[int] = None):
+        self.limits = {
+            "duration_ms": duration_ms,
+            "dom_content_loaded_ms": dom_content_loaded_ms,
+            "load_ms": load_ms,
+            "requests": max_requests,
+        }
+        self.limits = {metric: limit for metric, limit in self.limits.items() if limit is not None}
+
+    @property
+    def needs_navigation_timing(self) -> bool:
+        return "dom_content_loaded_ms" in self.limits or "load_ms" in self.limits
+
+    def __repr__(self) -> str:
+        return f"Budget({', '.join(f'{metric}={limit}' for metric, limit in self.limits.items())})"
+
+
+class BudgetTracker:
+    """Checks measurements against budgets and a recorded baseline, and collects violations per test
+
+    A baseline tightens a budget to the measured value plus a tolerance, so slow drifts
+    are caught long before the absolute limit is reached.
+    """
+
+    def __init__(self, baseline_path: str = Config.BUDGET_BASELINE, tolerance: float = Config.BUDGET_TOLERANCE,
+                 slack_ms: float = Config.BUDGET_SLACK_MS):
+        self.baseline_path = baseline_path
+        self.tolerance = tolerance
+        self.slack_ms = slack_ms
+        self.enabled = True
+        self.updating_baseline = False
+        self.violations: List[str] = []
+        self.measurements: Dict[str, Dict[str, float]] = {}
+        self._baseline: Optional[Dict[str, Dict[str, float]]] = None
+
+    @property
+    def baseline(self) -> Dict[str, Dict[str, float]]:
+        if self._baseline is None:
+            try:
+                with open(self.baseline_path) as f:
+                    self._baseline = json.load(f)
+            except (OSError, ValueError):
+                self._baseline = {}
+        return self._baseline
+
+    def limit(self, action: str, metric: str, budget: Budget) -> float:
+        """Effective limit: the budget, tightened by the baseline when one was recorded"""
+        limit = budget.limits[metric]
+        baseline = self.baseline.get(action, {}).get(metric)
+        if baseline is not None and not self.updating_baseline:
+            slack = 0 if metric == "requests" else self.slack_ms
+            limit = min(limit, baseline * (1 + self.tolerance) + slack)
+        return limit
+
+    def check(self, action: str, budget: Budget, measured: Dict[str, float]):
+        """Record a measurement and remember every limit it exceeds"""
+        worst = self.measurements.setdefault(action, {})
+        for metric, value in measured.items():
+            worst[metric] = max(worst.get(metric, value), value)
+            if metric not in budget.limits or self.updating_baseline:
+                continue
+            limit = self.limit(action, metric, budget)
+            if value > limit:
+                self.violations.append(f"{action}: {metric} {value:.0f} > {limit:.0f} (budget {budget.limits[metric]})")
+
+    def pop_violations(self) -> List[str]:
+        """Violations since the last call, i.e. of the current test"""
+        violations, self.violations = self.violations, []
+        return violations
+
+    def merge(self, measurements: Dict[str, Dict[str, float]]):
+        """Add the worst measurements of another process, e.g. an xdist worker"""
+        for action, metrics in measurements.items():
+            worst = self.measurements.setdefault(action, {})
+            for metric, value in metrics.items():
+                worst[metric] = max(worst.get(metric, value), value)
+
+    def save_baseline(self):
+        """Write the worst measurement of every budgeted action as the new baseline"""
+        with open(self.baseline_path, "w") as f:
+            json.dump(self.measurements, f, indent=2, sort_keys=True)
+        self._baseline = dict(self.measurements)
+
+
+budget_tracker = BudgetTracker()
+
+# Requests issued by each page, counted once per page however many budgeted calls it serves
+_request_counts: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def request_count(page) -> int:
+    """Requests the page has issued so far"""
+    if page not in _request_counts:
+        _request_counts[page] = [0]
+        counter = _request_counts[page]
+        page.on("request", lambda request: counter.__setitem__(0, counter[0] + 1))
+    return _request_counts[page][0]
+
+
+def budgeted(function: Callable, action: str, budget: Budget) -> Callable:
+    """Wrap a page-object method so each call is measured against its budget"""
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        if not budget_tracker.enabled:
+            return function(self, *args, **kwargs)
+        requests_before = request_count(self.page)
+        start = time.perf_counter()
+        result = function(self, *args, **kwargs)
+        measured = {
+            "duration_ms": (time.perf_counter() - start) * 1000,
+            "requests": request_count(self.page) - requests_before,
+        }
+        if budget.needs_navigation_timing:
+            try:
+                timing = self.page.evaluate(NAVIGATION_TIMING_SCRIPT)
+                # loadEventEnd stays 0 until the load event has finished
+                measured.update({metric: value for metric, value in timing.items() if value})
+            except Exception as e:
+                logger.debug(f"Could not read navigation timing for {action}: {str(e)}")
+        budget_tracker.check(action, budget, measured)
+        return result
+    return wrapper
+
+
+def apply_budgets(cls):
+    """Measure the methods a page class lists in its BUDGETS"""
+    for name, budget in vars(cls).get("BUDGETS", {}).items():
+        function = vars(cls).get(name)
+        if inspect.isfunction(function) and not inspect.iscoroutinefunction(function):
+            setattr(cls, name, budgeted(function, f"{cls.__name__}.{name}", budget))
+    return cls
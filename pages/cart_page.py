@@ -1,45 +1,20 @@
 from .base_page import BasePage
+from .locators import CartLocators
+from .wait_strategies import ElementState, NoWait, UrlChange
 
-class CartPage(BasePage):
-    # Locators
-    CART_ITEMS = "tr.cart_item"
-    PRODUCT_NAMES = "h4 a"
-    PRODUCT_PRICES = "td.cart_price p"
-    PRODUCT_QUANTITIES = "td.cart_quantity button"
-    PRODUCT_TOTALS = "td.cart_total p"
-    REMOVE_BUTTONS = "td.cart_delete a"
-    PROCEED_CHECKOUT_BUTTON = "a.check_out"
-    REGISTER_LOGIN_BUTTON = "a[href='/login']"
-    CART_INFO = "div#cart_info"
-    SUBSCRIPTION_EMAIL = "input#susbscribe_email"
-    SUBSCRIPTION_BUTTON = "button#subscribe"
-    SUBSCRIPTION_SUCCESS = "div#success-subscribe"
-    DOWNLOAD_INVOICE_BUTTON = "a.download-invoice"
-    
+class CartPage(CartLocators, BasePage):
     def verify_cart_page(self) -> bool:
         """Verify cart page is loaded"""
         return self.is_visible(self.CART_INFO)
     
     def get_cart_items(self) -> list:
         """Get all cart items details"""
-        items = []
-        names = self.page.query_selector_all(self.PRODUCT_NAMES)
-        prices = self.page.query_selector_all(self.PRODUCT_PRICES)
-        quantities = self.page.query_selector_all(self.PRODUCT_QUANTITIES)
-        totals = self.page.query_selector_all(self.PRODUCT_TOTALS)
-        
-        for i in range(len(names)):
-            items.append({
-                "name": names[i].text_content(),
-                "price": prices[i].text_content(),
-                "quantity": quantities[i].text_content(),
-                "total": totals[i].text_content()
-            })
-        return items
+        return self.extract_rows(self.CART_ITEMS, self.CART_ITEM_COLUMNS)
     
     def remove_product(self, index: int = 0):
         """Remove product from cart"""
-        self.page.query_selector_all(self.REMOVE_BUTTONS)[index].click()
+        row_id = self.locator(self.CART_ITEMS, index).get_attribute("id")
+        self.click(self.REMOVE_BUTTONS, nth=index, wait=ElementState(f"tr#{row_id}", "detached"))
     
     def click_proceed_to_checkout(self):
         """Click proceed to checkout button"""
@@ -47,12 +22,12 @@ class CartPage(BasePage):
     
     def click_register_login(self):
         """Click register/login button"""
-        self.click(self.REGISTER_LOGIN_BUTTON)
+        self.click(self.REGISTER_LOGIN_BUTTON, wait=UrlChange("**/login"))
     
     def subscribe_newsletter(self, email: str):
         """Subscribe to newsletter"""
         self.fill(self.SUBSCRIPTION_EMAIL, email)
-        self.click(self.SUBSCRIPTION_BUTTON)
+        self.click(self.SUBSCRIPTION_BUTTON, wait=ElementState(self.SUBSCRIPTION_SUCCESS))
     
     def verify_subscription_success(self) -> bool:
         """Verify subscription success message"""
@@ -61,11 +36,10 @@ class CartPage(BasePage):
     def download_invoice(self):
         """Click download invoice button"""
         with self.page.expect_download() as download_info:
-            self.click(self.DOWNLOAD_INVOICE_BUTTON)
+            self.click(self.DOWNLOAD_INVOICE_BUTTON, wait=NoWait())
         download = download_info.value
         return download
     
     def verify_product_removed(self, product_name: str) -> bool:
         """Verify product is removed from cart"""
-        names = self.page.query_selector_all(self.PRODUCT_NAMES)
-        return not any(name.text_content() == product_name for name in names) 
\ No newline at end of file
+        return not any(item["name"] == product_name for item in self.get_cart_items()) 
\ No newline at end of file
@@ -1,21 +1,8 @@
 from .base_page import BasePage
+from .locators import CheckoutLocators
+from .wait_strategies import UrlChange
 
-class CheckoutPage(BasePage):
-    # Locators
-    DELIVERY_ADDRESS = "ul#address_delivery"
-    BILLING_ADDRESS = "ul#address_billing"
-    ORDER_REVIEW = "div.order-review"
-    COMMENT_TEXTAREA = "textarea.form-control"
-    PLACE_ORDER_BUTTON = "a.check_out"
-    PAYMENT_FORM = "form.payment-form"
-    NAME_ON_CARD = "input[data-qa='name-on-card']"
-    CARD_NUMBER = "input[data-qa='card-number']"
-    CVC = "input[data-qa='cvc']"
-    EXPIRY_MONTH = "input[data-qa='expiry-month']"
-    EXPIRY_YEAR = "input[data-qa='expiry-year']"
-    PAY_BUTTON = "button[data-qa='pay-button']"
-    SUCCESS_MESSAGE = "div.alert-success"
-    
+class CheckoutPage(CheckoutLocators, BasePage):
     def verify_address_details(self) -> dict:
         """Get and verify address details"""
         delivery = self.get_text(self.DELIVERY_ADDRESS)
@@ -35,19 +22,15 @@ class CheckoutPage(BasePage):
     
     def click_place_order(self):
         """Click place order button"""
-        self.click(self.PLACE_ORDER_BUTTON)
+        self.click(self.PLACE_ORDER_BUTTON, wait=UrlChange("**/payment"))
     
     def fill_payment_details(self, payment_info: dict):
         """Fill payment form details"""
-        self.fill(self.NAME_ON_CARD, payment_info['name_on_card'])
-        self.fill(self.CARD_NUMBER, payment_info['card_number'])
-        self.fill(self.CVC, payment_info['cvc'])
-        self.fill(self.EXPIRY_MONTH, payment_info['expiry_month'])
-        self.fill(self.EXPIRY_YEAR, payment_info['expiry_year'])
+        self.fill_form("payment details", self.payment_form(payment_info))
     
     def click_pay_button(self):
         """Click pay and confirm order button"""
-        self.click(self.PAY_BUTTON)
+        self.click(self.PAY_BUTTON, wait=UrlChange("**/payment_done/**"))
     
     def verify_success_message(self) -> bool:
         """Verify order success message"""
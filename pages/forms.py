@@ -0,0 +1,187 @@
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config.config import Config
+
+# Sets every field of a form in one round-trip, firing the events a user's input would fire.
+# Returns null for each applied field, or why it has to be filled field by field instead.
+FILL_FORM_SCRIPT = """
+fields => fields.map(({selector, value, kind}) => {
+    let element;
+    try {
+        element = document.querySelector(selector);
+    } catch (e) {
+        return "unsupported selector";
+    }
+    if (!element) return "missing";
+    if (element.disabled || element.readOnly || !element.getClientRects().length) return "not editable";
+    if (kind === "check") {
+        // A real click fires click, input and change, and runs the control's own handlers
+        if (element.checked !== value) element.click();
+        return element.checked === value ? null : "not checked";
+    }
+    let expected = value;
+    if (kind === "select") {
+        const option = Array.from(element.options).find(o => o.value === value || o.label.trim() === value);
+        if (!option) return "no option";
+        expected = option.value;
+        element.value = expected;
+    } else {
+        // The prototype setter keeps frameworks that track the value property in sync
+        const prototype = Object.getPrototypeOf(element);
+        Object.getOwnPropertyDescriptor(prototype, "value").set.call(element, value);
+    }
+    element.dispatchEvent(new Event("input", {bubbles: true}));
+    element.dispatchEvent(new Event("change", {bubbles: true}));
+    return element.value === expected ? null : "rejected";
+})
+"""
+
+FIELD_KINDS = ("text", "select", "check")
+
+
+class Field:
+    """One form control: its selector, the value to enter and how it is entered
+
+    per_field forces the control through Playwright's fill/select/check, for controls whose
+    validation listens to focus, blur or keystrokes rather than input/change events.
+    """
+
+    def __init__(self, selector: str, value, kind: str = "text", per_field: bool = False):
+        if kind not in FIELD_KINDS:
+            raise ValueError(f"Invalid field kind: {kind}")
+        self.selector = selector
+        self.value = bool(value) if kind == "check" else str(value)
+        self.kind = kind
+        self.per_field = per_field
+
+    def spec(self) -> dict:
+        """What the browser needs to set the value"""
+        return {"selector": self.selector, "value": self.value, "kind": self.kind}
+
+
+class FormStats:
+    """Fields filled per form, batched or one by one, and the time each way took"""
+
+    FIELDS = ("fills", "batched", "fallbacks", "batch_seconds", "field_seconds")
+
+    def __init__(self):
+        self.forms: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, form: str, batched: int, fallbacks: int, batch_seconds: float, field_seconds: float,
+               fills: int = 1):
+        with self._lock:
+            stats = self.forms.setdefault(form, dict.fromkeys(self.FIELDS, 0))
+            stats["fills"] += fills
+            stats["batched"] += batched
+            stats["fallbacks"] += fallbacks
+            stats["batch_seconds"] += batch_seconds
+            stats["field_seconds"] += field_seconds
+
+    @property
+    def fields_timed(self) -> int:
+        """Fields filled on their own, whose time field_cost() averages"""
+        return sum(stats["fallbacks"] for stats in self.forms.values())
+
+    def field_cost(self) -> float:
+        """Seconds one field takes when filled on its own, measured if any were, else the configured estimate"""
+        if not self.fields_timed:
+            return Config.FORM_FIELD_COST_MS / 1000
+        return sum(stats["field_seconds"] for stats in self.forms.values()) / self.fields_timed
+
+    def rows(self) -> List[dict]:
+        """Stats per form with the estimated time saved by batching, JSON-friendly"""
+        cost = self.field_cost()
+        rows = []
+        for form, stats in sorted(self.forms.items()):
+            # What the batched fields would have taken one by one is never timed, only estimated
+            saved = stats["batched"] * cost - stats["batch_seconds"]
+            rows.append({
+                "form": form,
+                **{name: round(value, 4) if isinstance(value, float) else value for name, value in stats.items()},
+                "estimated_saved_seconds": round(saved, 4),
+                "estimated_saved_ms_per_fill": round(saved / stats["fills"] * 1000, 1),
+            })
+        return rows
+
+    def merge(self, rows: List[dict]):
+        """Add rows produced by another process, e.g. an xdist worker"""
+        for row in rows:
+            self.record(row["form"], row["batched"], row["fallbacks"], row["batch_seconds"], row["field_seconds"],
+                        fills=row["fills"])
+
+    def reset(self):
+        self.forms.clear()
+
+
+form_stats = FormStats()
+logger = logging.getLogger(__name__)
+
+
+def _plan(fields: List[Field]) -> List[Field]:
+    """Fields that can be set in the batch"""
+    return [field for field in fields if not field.per_field] if Config.BATCH_FORMS else []
+
+
+def _fallbacks(fields: List[Field], batched: List[Field], results: Optional[list]) -> List[Field]:
+    """Fields left for one-by-one filling, in form order"""
+    if results is None:
+        results = ["batch failed"] * len(batched)
+    pending = set()
+    for field, result in zip(batched, results):
+        if result:
+            logger.debug(f"Filling {field.selector} on its own: {result}")
+            pending.add(id(field))
+    applied = {id(field) for field in batched} - pending
+    return [field for field in fields if id(field) not in applied]
+
+
+def fill_form(page_object, form: str, fields: List[Field]):
+    """Fill a form with one page.evaluate call, filling the fields it could not set one by one"""
+    batched = _plan(fields)
+    start = time.perf_counter()
+    results = None
+    if batched:
+        try:
+            results = page_object.page.evaluate(FILL_FORM_SCRIPT, [field.spec() for field in batched])
+        except Exception as e:
+            logger.debug(f"Batch fill of {form} failed: {str(e)}")
+    batch_seconds = time.perf_counter() - start
+    fallbacks = _fallbacks(fields, batched, results)
+    start = time.perf_counter()
+    for field in fallbacks:
+        if field.kind == "text":
+            page_object.fill(field.selector, field.value)
+        elif field.kind == "select":
+            page_object.locator(field.selector).select_option(field.value, timeout=Config.DEFAULT_TIMEOUT)
+        else:
+            page_object.locator(field.selector).set_checked(field.value, timeout=Config.DEFAULT_TIMEOUT)
+    form_stats.record(form, len(fields) - len(fallbacks), len(fallbacks), batch_seconds,
+                      time.perf_counter() - start)
+
+
+async def async_fill_form(page_object, form: str, fields: List[Field]):
+    """Async counterpart of fill_form() for pages.aio"""
+    batched = _plan(fields)
+    start = time.perf_counter()
+    results = None
+    if batched:
+        try:
+            results = await page_object.page.evaluate(FILL_FORM_SCRIPT, [field.spec() for field in batched])
+        except Exception as e:
+            logger.debug(f"Batch fill of {form} failed: {str(e)}")
+    batch_seconds = time.perf_counter() - start
+    fallbacks = _fallbacks(fields, batched, results)
+    start = time.perf_counter()
+    for field in fallbacks:
+        if field.kind == "text":
+            await page_object.fill(field.selector, field.value)
+        elif field.kind == "select":
+            await page_object.locator(field.selector).select_option(field.value, timeout=Config.DEFAULT_TIMEOUT)
+        else:
+            await page_object.locator(field.selector).set_checked(field.value, timeout=Config.DEFAULT_TIMEOUT)
+    form_stats.record(form, len(fields) - len(fallbacks), len(fallbacks), batch_seconds,
+                      time.perf_counter() - start)
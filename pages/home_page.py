@@ -1,63 +1,52 @@
 from .base_page import BasePage
+from .budgets import Budget
+from .locators import HomeLocators
+from config.config import Config
+from .wait_strategies import ElementState, NoWait, UrlChange
+from .retry import retry_step
 
-class HomePage(BasePage):
-    # Locators
-    PRODUCTS_LINK = "a[href='/products']"
-    SIGNUP_LOGIN_LINK = "a[href='/login']"
-    CART_LINK = "a[href='/view_cart']"
-    TEST_CASES_LINK = "a[href='/test_cases']"
-    CONTACT_US_LINK = "a[href='/contact_us']"
-    CATEGORY_WOMEN = "a[href='#Women']"
-    CATEGORY_MEN = "a[href='#Men']"
-    CATEGORY_KIDS = "a[href='#Kids']"
-    SUBSCRIPTION_EMAIL = "input#susbscribe_email"
-    SUBSCRIPTION_BUTTON = "button#subscribe"
-    SUBSCRIPTION_SUCCESS = "div#success-subscribe"
-    CONTACT_NAME = "input[data-qa='name']"
-    CONTACT_EMAIL = "input[data-qa='email']"
-    CONTACT_SUBJECT = "input[data-qa='subject']"
-    CONTACT_MESSAGE = "textarea[data-qa='message']"
-    CONTACT_SUBMIT = "input[data-qa='submit-button']"
-    CONTACT_SUCCESS = "div.alert-success"
-    SCROLL_UP_BUTTON = "i.fa-angle-up"
-    LOGGED_IN_USER = "a:has-text('Logged in as')"
-    DELETE_ACCOUNT = "a[href='/delete_account']"
-    ACCOUNT_DELETED = "h2.title"
-    CONTINUE_BUTTON = "a[data-qa='continue-button']"
-    LOGOUT_BUTTON = "a[href='/logout']"
+class HomePage(HomeLocators, BasePage):
+    BUDGETS = {
+        "load": Budget(dom_content_loaded_ms=5000, duration_ms=10000),
+    }
 
     def __init__(self, page):
         super().__init__(page)
-        self.url = "https://www.automationexercise.com"
+        self.url = Config.BASE_URL
 
     def load(self):
         """Navigate to home page"""
         self.navigate(self.url)
 
+    @retry_step
     def click_products(self):
         """Click on Products link"""
-        self.click(self.PRODUCTS_LINK)
+        self.click(self.PRODUCTS_LINK, wait=UrlChange("**/products"))
 
+    @retry_step
     def click_signup_login(self):
         """Click on Signup / Login link"""
-        self.click(self.SIGNUP_LOGIN_LINK)
+        self.click(self.SIGNUP_LOGIN_LINK, wait=UrlChange("**/login"))
 
+    @retry_step
     def click_cart(self):
         """Click on Cart link"""
-        self.click(self.CART_LINK)
+        self.click(self.CART_LINK, wait=UrlChange("**/view_cart"))
 
+    @retry_step
     def click_test_cases(self):
         """Click on Test Cases link"""
-        self.click(self.TEST_CASES_LINK)
+        self.click(self.TEST_CASES_LINK, wait=UrlChange("**/test_cases"))
 
+    @retry_step
     def click_contact_us(self):
         """Click on Contact Us link"""
-        self.click(self.CONTACT_US_LINK)
+        self.click(self.CONTACT_US_LINK, wait=UrlChange("**/contact_us"))
 
     def subscribe_newsletter(self, email: str):
         """Subscribe to newsletter"""
         self.fill(self.SUBSCRIPTION_EMAIL, email)
-        self.click(self.SUBSCRIPTION_BUTTON)
+        self.click(self.SUBSCRIPTION_BUTTON, wait=ElementState(self.SUBSCRIPTION_SUCCESS))
 
     def is_subscription_successful(self) -> bool:
         """Check if subscription was successful"""
@@ -71,7 +60,7 @@ class HomePage(BasePage):
             "Kids": self.CATEGORY_KIDS
         }
         if category in category_map:
-            self.click(category_map[category])
+            self.click(category_map[category], wait=ElementState(f"div#{category}"))
         else:
             raise ValueError(f"Invalid category: {category}")
 
@@ -81,10 +70,7 @@ class HomePage(BasePage):
 
     def fill_contact_form(self, contact_info: dict):
         """Fill and submit contact form"""
-        self.fill(self.CONTACT_NAME, contact_info["name"])
-        self.fill(self.CONTACT_EMAIL, contact_info["email"])
-        self.fill(self.CONTACT_SUBJECT, contact_info["subject"])
-        self.fill(self.CONTACT_MESSAGE, contact_info["message"])
+        self.fill_form("contact form", self.contact_form(contact_info))
         self.click(self.CONTACT_SUBMIT)
 
     def verify_contact_success(self) -> bool:
@@ -101,7 +87,7 @@ class HomePage(BasePage):
 
     def click_scroll_up_button(self):
         """Click scroll up button"""
-        self.click(self.SCROLL_UP_BUTTON)
+        self.click(self.SCROLL_UP_BUTTON, wait=NoWait())
 
     def verify_logged_in_as(self, username: str) -> bool:
         """Verify logged in as specific user"""
@@ -109,7 +95,7 @@ class HomePage(BasePage):
 
     def click_delete_account(self):
         """Click delete account button"""
-        self.click(self.DELETE_ACCOUNT)
+        self.click(self.DELETE_ACCOUNT, wait=UrlChange("**/delete_account"))
 
     def verify_account_deleted(self) -> bool:
         """Verify account deleted message"""
@@ -121,4 +107,4 @@ class HomePage(BasePage):
 
     def click_logout(self):
         """Click logout button"""
-        self.click(self.LOGOUT_BUTTON) 
\ No newline at end of file
+        self.click(self.LOGOUT_BUTTON, wait=UrlChange("**/login")) 
\ No newline at end of file
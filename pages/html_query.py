@@ -0,0 +1,221 @@
+import functools
+import re
+from html.parser import HTMLParser
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Elements that never have children, so their start tag also ends them
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+IDENT = r"-?[_a-zA-Z][\w-]*"
+SIMPLE_PATTERNS = (
+    ("tag", re.compile(rf"\*|{IDENT}")),
+    ("id", re.compile(rf"#({IDENT})")),
+    ("class", re.compile(rf"\.({IDENT})")),
+    ("attr", re.compile(rf"""\[\s*({IDENT})\s*(?:([~^$*|]?=)\s*(?:"([^"]*)"|'([^']*)'|([^\]\s]+))\s*)?\]""")),
+)
+
+
+class UnsupportedSelector(ValueError):
+    """A selector outside the plain CSS subset queried offline"""
+
+
+class Node:
+    """Element of a parsed HTML document"""
+    __slots__ = ("tag", "attrs", "classes", "parent", "children", "content")
+
+    def __init__(self, tag: str, attrs: Dict[str, str], parent: Optional["Node"]):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = set(attrs.get("class", "").split())
+        self.parent = parent
+        self.children: List[Node] = []
+        # Text and child elements in document order
+        self.content: List[Union[str, Node]] = []
+
+    def descendants(self):
+        for child in self.children:
+            yield child
+            yield from child.descendants()
+
+    def text_content(self) -> str:
+        return "".join(part if isinstance(part, str) else part.text_content() for part in self.content)
+
+
+class _SnapshotParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node("#document", {}, None)
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = self._append(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self._append(tag, attrs)
+
+    def _append(self, tag, attrs) -> Node:
+        node = Node(tag, {name: value or "" for name, value in attrs}, self.current)
+        self.current.children.append(node)
+        self.current.content.append(node)
+        return node
+
+    def handle_endtag(self, tag):
+        # Close up to the matching open element, tolerating unclosed children
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.content.append(data)
+
+
+def parse_html(html: str) -> Node:
+    """Parse fetched HTML into a tree select() can query"""
+    parser = _SnapshotParser()
+    parser.feed(html)
+    parser.close()
+    return parser.root
+
+
+class Simple(NamedTuple):
+    kind: str
+    name: str
+    operator: Optional[str] = None
+    value: Optional[str] = None
+
+
+def _first(*values):
+    return next((value for value in values if value is not None), None)
+
+
+def _parse_compound(text: str, pos: int) -> Tuple[List[Simple], int]:
+    simples = []
+    while pos < len(text) and text[pos] not in " \t\n>+~,":
+        for kind, pattern in SIMPLE_PATTERNS:
+            match = pattern.match(text, pos)
+            if not match or (kind == "tag" and simples):
+                continue
+            if kind == "tag":
+                simples.append(Simple("tag", match.group().lower()))
+            elif kind in ("id", "class"):
+                simples.append(Simple(kind, match.group(1)))
+            else:
+                simples.append(Simple("attr", match.group(1).lower(), match.group(2),
+                                      _first(match.group(3), match.group(4), match.group(5))))
+            pos = match.end()
+            break
+        else:
+            raise UnsupportedSelector(f"Unexpected {text[pos]!r} at {pos} in {text!r}")
+    if not simples:
+        raise UnsupportedSelector(f"Expected a selector at {pos} in {text!r}")
+    return simples, pos
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_css(text: str) -> List[List[Tuple[str, List[Simple]]]]:
+    """Selector list of (combinator, compound) steps, left to right, parsed once per process"""
+    alternatives, steps, pos, combinator = [], [], 0, " "
+    text = text.strip()
+    if not text:
+        raise UnsupportedSelector("Empty selector")
+    while pos < len(text):
+        compound, pos = _parse_compound(text, pos)
+        steps.append((combinator, compound))
+        start = pos
+        while pos < len(text) and text[pos] in " \t\n":
+            pos += 1
+        if pos == len(text):
+            break
+        if text[pos] == ",":
+            alternatives.append(steps)
+            steps, combinator, pos = [], " ", pos + 1
+            while pos < len(text) and text[pos] in " \t\n":
+                pos += 1
+            continue
+        if text[pos] in ">+~":
+            combinator = text[pos]
+            pos += 1
+            while pos < len(text) and text[pos] in " \t\n":
+                pos += 1
+        elif pos > start:
+            combinator = " "
+        if pos == len(text):
+            raise UnsupportedSelector(f"Selector ends with a combinator: {text!r}")
+    if not steps:
+        raise UnsupportedSelector(f"Selector ends with a comma: {text!r}")
+    alternatives.append(steps)
+    return alternatives
+
+
+def select(root: Node, selector: str) -> List[Node]:
+    """Descendants of root matching a CSS selector, in document order, like querySelectorAll
+
+    Only plain CSS is supported: type, id, class and attribute selectors with descendant,
+    child and sibling combinators, which is what the extraction column schemas use. Playwright
+    selectors such as :has-text() or >> chains raise UnsupportedSelector; the locators are
+    checked against Playwright itself by LocatorRegistry.validate().
+    """
+    alternatives = _parse_css(selector)
+    return [node for node in root.descendants() if any(_matches(node, steps) for steps in alternatives)]
+
+
+def _matches_compound(node: Node, compound: List[Simple]) -> bool:
+    if node.parent is None:
+        # The document itself is not an element
+        return False
+    for simple in compound:
+        if simple.kind == "tag":
+            if simple.name != "*" and node.tag != simple.name:
+                return False
+        elif simple.kind == "id":
+            if node.attrs.get("id") != simple.name:
+                return False
+        elif simple.kind == "class":
+            if simple.name not in node.classes:
+                return False
+        else:
+            actual = node.attrs.get(simple.name)
+            if actual is None:
+                return False
+            if simple.operator and not _compare(actual, simple.operator, simple.value):
+                return False
+    return True
+
+
+def _compare(actual: str, operator: str, expected: str) -> bool:
+    if operator == "=":
+        return actual == expected
+    if operator == "~=":
+        return expected in actual.split()
+    if operator == "^=":
+        return actual.startswith(expected)
+    if operator == "$=":
+        return actual.endswith(expected)
+    if operator == "*=":
+        return expected in actual
+    return actual == expected or actual.startswith(f"{expected}-")
+
+
+def _matches(node: Node, steps: List[Tuple[str, List[Simple]]]) -> bool:
+    """Whether node matches the steps, matched right to left like querySelectorAll does"""
+    combinator, compound = steps[-1]
+    if not _matches_compound(node, compound):
+        return False
+    if len(steps) == 1:
+        return True
+    rest = steps[:-1]
+    if combinator == ">":
+        return node.parent is not None and _matches(node.parent, rest)
+    if combinator in "+~":
+        siblings = node.parent.children if node.parent else []
+        previous = siblings[:siblings.index(node)]
+        return any(_matches(sibling, rest) for sibling in (previous[-1:] if combinator == "+" else previous))
+    ancestor = node.parent
+    while ancestor is not None:
+        if _matches(ancestor, rest):
+            return True
+        ancestor = ancestor.parent
+    return False
@@ -0,0 +1,219 @@
+from typing import List
+
+from .extraction import Column, labelled, price
+from .forms import Field
+from .registry import locator_registry
+
+
+@locator_registry.register
+class SubscriptionLocators:
+    """Newsletter subscription in the footer of every page"""
+    SUBSCRIPTION_EMAIL = "input#susbscribe_email"
+    SUBSCRIPTION_BUTTON = "button#subscribe"
+    SUBSCRIPTION_SUCCESS = "div#success-subscribe"
+
+
+@locator_registry.register
+class AccountStatusLocators:
+    """Account created / deleted confirmation page"""
+    CONTINUE_BUTTON = "a[data-qa='continue-button']"
+
+
+@locator_registry.register
+class HomeLocators(SubscriptionLocators, AccountStatusLocators):
+    """Selectors of the Home page, shared by the sync and async page objects"""
+    PRODUCTS_LINK = "header a[href='/products']"
+    SIGNUP_LOGIN_LINK = "header a[href='/login']"
+    CART_LINK = "header a[href='/view_cart']"
+    TEST_CASES_LINK = "header a[href='/test_cases']"
+    CONTACT_US_LINK = "header a[href='/contact_us']"
+    CATEGORY_WOMEN = "a[href='#Women']"
+    CATEGORY_MEN = "a[href='#Men']"
+    CATEGORY_KIDS = "a[href='#Kids']"
+    CONTACT_NAME = "input[data-qa='name']"
+    CONTACT_EMAIL = "input[data-qa='email']"
+    CONTACT_SUBJECT = "input[data-qa='subject']"
+    CONTACT_MESSAGE = "textarea[data-qa='message']"
+    CONTACT_SUBMIT = "input[data-qa='submit-button']"
+    CONTACT_SUCCESS = "div.alert-success"
+    SCROLL_UP_BUTTON = "i.fa-angle-up"
+    LOGGED_IN_USER = "header a:has-text('Logged in as')"
+    DELETE_ACCOUNT = "header a[href='/delete_account']"
+    ACCOUNT_DELETED = "h2[data-qa='account-deleted']"
+    LOGOUT_BUTTON = "header a[href='/logout']"
+    
+    @classmethod
+    def contact_form(cls, contact_info: dict) -> List[Field]:
+        """Fields of the Contact Us form"""
+        return [
+            Field(cls.CONTACT_NAME, contact_info["name"]),
+            Field(cls.CONTACT_EMAIL, contact_info["email"]),
+            Field(cls.CONTACT_SUBJECT, contact_info["subject"]),
+            Field(cls.CONTACT_MESSAGE, contact_info["message"])
+        ]
+
+
+@locator_registry.register
+class LoginLocators:
+    """Selectors of the Login page, shared by the sync and async page objects"""
+    LOGIN_FORM = "div.login-form"
+    SIGNUP_FORM = "div.signup-form"
+    LOGIN_EMAIL = "input[data-qa='login-email']"
+    LOGIN_PASSWORD = "input[data-qa='login-password']"
+    LOGIN_BUTTON = "button[data-qa='login-button']"
+    SIGNUP_NAME = "input[data-qa='signup-name']"
+    SIGNUP_EMAIL = "input[data-qa='signup-email']"
+    SIGNUP_BUTTON = "button[data-qa='signup-button']"
+    ERROR_MESSAGE = "p[style='color: red;']"
+    LOGIN_HEADER = "div.login-form h2"
+    SIGNUP_HEADER = "div.signup-form h2"
+
+
+@locator_registry.register
+class SignupLocators(AccountStatusLocators):
+    """Selectors of the Signup page, shared by the sync and async page objects"""
+    ACCOUNT_INFO_HEADER = "h2.title >> nth=0"
+    TITLE_MR = "input#id_gender1"
+    TITLE_MRS = "input#id_gender2"
+    PASSWORD = "input[type='password']"
+    DAYS = "select#days"
+    MONTHS = "select#months"
+    YEARS = "select#years"
+    NEWSLETTER = "input#newsletter"
+    SPECIAL_OFFERS = "input#optin"
+    FIRST_NAME = "input#first_name"
+    LAST_NAME = "input#last_name"
+    COMPANY = "input#company"
+    ADDRESS1 = "input#address1"
+    ADDRESS2 = "input#address2"
+    COUNTRY = "select#country"
+    STATE = "input#state"
+    CITY = "input#city"
+    ZIPCODE = "input#zipcode"
+    MOBILE_NUMBER = "input#mobile_number"
+    CREATE_ACCOUNT_BUTTON = "button[data-qa='create-account']"
+    ACCOUNT_CREATED_MESSAGE = "h2[data-qa='account-created']"
+    
+    @classmethod
+    def account_form(cls, user_data: dict) -> List[Field]:
+        """Fields of the account information form; optional details are left out when missing"""
+        fields = [
+            Field(cls.TITLE_MR if user_data.get('title') == 'Mr' else cls.TITLE_MRS, True, kind="check"),
+            Field(cls.PASSWORD, user_data['password'])
+        ]
+        for selector, key in ((cls.DAYS, 'dob_day'), (cls.MONTHS, 'dob_month'), (cls.YEARS, 'dob_year')):
+            if key in user_data:
+                fields.append(Field(selector, user_data[key], kind="select"))
+        fields += [
+            Field(cls.NEWSLETTER, user_data.get('newsletter', True), kind="check"),
+            Field(cls.SPECIAL_OFFERS, user_data.get('special_offers', True), kind="check"),
+            Field(cls.FIRST_NAME, user_data['first_name']),
+            Field(cls.LAST_NAME, user_data['last_name'])
+        ]
+        if 'company' in user_data:
+            fields.append(Field(cls.COMPANY, user_data['company']))
+        fields.append(Field(cls.ADDRESS1, user_data['address']))
+        if 'address2' in user_data:
+            fields.append(Field(cls.ADDRESS2, user_data['address2']))
+        return fields + [
+            Field(cls.COUNTRY, user_data['country'], kind="select"),
+            Field(cls.STATE, user_data['state']),
+            Field(cls.CITY, user_data['city']),
+            Field(cls.ZIPCODE, user_data['zipcode']),
+            Field(cls.MOBILE_NUMBER, user_data['mobile_number'])
+        ]
+
+
+@locator_registry.register
+class ProductsLocators:
+    """Selectors of the Products page, shared by the sync and async page objects"""
+    ALL_PRODUCTS_HEADER = "h2.title.text-center"
+    SEARCH_INPUT = "input#search_product"
+    SEARCH_BUTTON = "button#submit_search"
+    PRODUCT_LIST = "div.features_items"
+    PRODUCT_ITEMS = "div.product-image-wrapper"
+    VIEW_PRODUCT_BUTTONS = "a.view-product"
+    ADD_TO_CART_BUTTONS = "div.productinfo a.add-to-cart"
+    CONTINUE_SHOPPING_BUTTON = "button.close-modal"
+    CART_MODAL = "div#cartModal"
+    VIEW_CART_BUTTON = "p.text-center a"
+    PRODUCT_INFORMATION = "div.product-information"
+    QUANTITY_INPUT = "input#quantity"
+    SEARCHED_PRODUCTS_HEADER = ALL_PRODUCTS_HEADER
+    WRITE_REVIEW_HEADER = "a[href='#reviews']"
+    REVIEW_NAME = "input#name"
+    REVIEW_EMAIL = "input#email"
+    REVIEW_TEXT = "textarea#review"
+    SUBMIT_REVIEW_BUTTON = "button#button-review"
+    REVIEW_SUCCESS_MESSAGE = "div.alert-success"
+    # The listing heading reads "ALL PRODUCTS" or "SEARCHED PRODUCTS"
+    ALIASES = {"SEARCHED_PRODUCTS_HEADER": "ALL_PRODUCTS_HEADER"}
+    LISTS = ("PRODUCT_ITEMS", "VIEW_PRODUCT_BUTTONS", "ADD_TO_CART_BUTTONS")
+    
+    PRODUCT_COLUMNS = {
+        "id": Column("a.add-to-cart", attr="data-product-id", parse=int),
+        "name": Column("div.productinfo p"),
+        "price": Column("div.productinfo h2"),
+        "price_value": Column("div.productinfo h2", parse=price, default=0)
+    }
+    PRODUCT_DETAIL_COLUMNS = {
+        "name": Column("h2"),
+        "price": Column("span span"),
+        "category": Column("p", nth=0, parse=labelled),
+        "availability": Column("p", nth=1, parse=labelled),
+        "condition": Column("p", nth=2, parse=labelled),
+        "brand": Column("p", nth=3, parse=labelled)
+    }
+
+
+@locator_registry.register
+class CartLocators(SubscriptionLocators):
+    """Selectors of the Cart page, shared by the sync and async page objects"""
+    CART_ITEMS = "tr.cart_item"
+    PRODUCT_NAMES = "h4 a"
+    PRODUCT_PRICES = "td.cart_price p"
+    PRODUCT_QUANTITIES = "td.cart_quantity button"
+    PRODUCT_TOTALS = "td.cart_total p"
+    REMOVE_BUTTONS = "td.cart_delete a"
+    PROCEED_CHECKOUT_BUTTON = "a.check_out"
+    REGISTER_LOGIN_BUTTON = "#checkoutModal a[href='/login']"
+    CART_INFO = "div#cart_info"
+    DOWNLOAD_INVOICE_BUTTON = "a.download-invoice"
+    LISTS = ("CART_ITEMS", "PRODUCT_NAMES", "PRODUCT_PRICES", "PRODUCT_QUANTITIES", "PRODUCT_TOTALS",
+             "REMOVE_BUTTONS")
+    
+    CART_ITEM_COLUMNS = {
+        "name": Column(PRODUCT_NAMES),
+        "price": Column(PRODUCT_PRICES),
+        "quantity": Column(PRODUCT_QUANTITIES),
+        "total": Column(PRODUCT_TOTALS)
+    }
+
+
+@locator_registry.register
+class CheckoutLocators:
+    """Selectors of the Checkout page, shared by the sync and async page objects"""
+    DELIVERY_ADDRESS = "ul#address_delivery"
+    BILLING_ADDRESS = "ul#address_billing"
+    ORDER_REVIEW = "div.order-review"
+    COMMENT_TEXTAREA = "textarea.form-control"
+    PLACE_ORDER_BUTTON = "a.check_out"
+    PAYMENT_FORM = "form.payment-form"
+    NAME_ON_CARD = "input[data-qa='name-on-card']"
+    CARD_NUMBER = "input[data-qa='card-number']"
+    CVC = "input[data-qa='cvc']"
+    EXPIRY_MONTH = "input[data-qa='expiry-month']"
+    EXPIRY_YEAR = "input[data-qa='expiry-year']"
+    PAY_BUTTON = "button[data-qa='pay-button']"
+    SUCCESS_MESSAGE = "div.alert-success"
+    
+    @classmethod
+    def payment_form(cls, payment_info: dict) -> List[Field]:
+        """Fields of the payment form"""
+        return [
+            Field(cls.NAME_ON_CARD, payment_info['name_on_card']),
+            Field(cls.CARD_NUMBER, payment_info['card_number']),
+            Field(cls.CVC, payment_info['cvc']),
+            Field(cls.EXPIRY_MONTH, payment_info['expiry_month']),
+            Field(cls.EXPIRY_YEAR, payment_info['expiry_year'])
+        ]
@@ -1,19 +1,8 @@
 from .base_page import BasePage
+from .locators import LoginLocators
+from .wait_strategies import Navigation
 
-class LoginPage(BasePage):
-    # Locators
-    LOGIN_FORM = "div.login-form"
-    SIGNUP_FORM = "div.signup-form"
-    LOGIN_EMAIL = "input[data-qa='login-email']"
-    LOGIN_PASSWORD = "input[data-qa='login-password']"
-    LOGIN_BUTTON = "button[data-qa='login-button']"
-    SIGNUP_NAME = "input[data-qa='signup-name']"
-    SIGNUP_EMAIL = "input[data-qa='signup-email']"
-    SIGNUP_BUTTON = "button[data-qa='signup-button']"
-    ERROR_MESSAGE = "p[style='color: red;']"
-    LOGIN_HEADER = "div.login-form h2"
-    SIGNUP_HEADER = "div.signup-form h2"
-    
+class LoginPage(LoginLocators, BasePage):
     def enter_login_credentials(self, email: str, password: str):
         """Enter login credentials"""
         self.fill(self.LOGIN_EMAIL, email)
@@ -21,8 +10,7 @@ class LoginPage(BasePage):
     
     def click_login(self):
         """Click login button"""
-        self.click(self.LOGIN_BUTTON)
-        self.wait_for_navigation()
+        self.click(self.LOGIN_BUTTON, wait=Navigation())
     
     def enter_signup_details(self, name: str, email: str):
         """Enter signup details"""
@@ -31,8 +19,7 @@ class LoginPage(BasePage):
     
     def click_signup(self):
         """Click signup button"""
-        self.click(self.SIGNUP_BUTTON)
-        self.wait_for_navigation()
+        self.click(self.SIGNUP_BUTTON, wait=Navigation())
     
     def verify_login_form_visible(self) -> bool:
         """Verify login form is visible"""
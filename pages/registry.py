@@ -0,0 +1,205 @@
+import gzip
+import sys
+import weakref
+from typing import Dict, List, NamedTuple, Optional
+
+from playwright.sync_api import Browser, Error, Page, sync_playwright
+
+
+class LocatorError(ValueError):
+    """A locator class with a malformed selector or an undeclared duplicate"""
+
+
+class Finding(NamedTuple):
+    """A selector that does not resolve to exactly what its page object expects"""
+    page: str
+    name: str
+    selector: str
+    problem: str
+    detail: str
+
+
+def check_syntax(selector: str):
+    """Raise ValueError for a selector Playwright cannot parse: unbalanced quotes or brackets, or an empty >> part
+
+    Only the syntax is checked without a browser; whether a selector matches is left to validate().
+    """
+    parts, depth, quote, start, i = [], 0, None, 0, 0
+    while i < len(selector):
+        char = selector[i]
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"":
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+            if depth < 0:
+                raise ValueError(f"Unbalanced {char!r} in {selector!r}")
+        elif selector.startswith(">>", i) and depth == 0:
+            parts.append(selector[start:i].strip())
+            start = i = i + 2
+            continue
+        i += 1
+    if quote or depth:
+        raise ValueError(f"Unterminated quote or bracket in {selector!r}")
+    parts.append(selector[start:].strip())
+    if not all(parts):
+        raise ValueError(f"Empty part in {selector!r}")
+
+
+def snapshot_page(browser: Browser) -> Page:
+    """Page to load snapshots in: scripts are off and every request is aborted, so only the snapshot's DOM is queried"""
+    context = browser.new_context(java_script_enabled=False)
+    context.route("**/*", lambda route: route.abort())
+    return context.new_page()
+
+
+def selectors_of(cls) -> Dict[str, str]:
+    """Selector constants of a locator class, including those of its mixins"""
+    selectors = {}
+    for klass in reversed(cls.__mro__):
+        for name, value in vars(klass).items():
+            if name.isupper() and isinstance(value, str):
+                selectors[name] = value
+    return selectors
+
+
+class LocatorRegistry:
+    """Selectors of every locator class, syntax-checked when the class is defined, and Locators interned per page
+
+    Within a class, two names for one selector are an error unless the second is declared in
+    the class's ALIASES; elements shared by several pages belong in a mixin. Selectors listed
+    in LISTS are expected to match several elements.
+    """
+
+    def __init__(self):
+        self.pages: Dict[str, type] = {}
+        self.owners: Dict[str, List[str]] = {}
+        self.built = 0
+        self.reused = 0
+        self._locators: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+    def register(self, cls):
+        """Class decorator checking the selectors of a locator class"""
+        page = cls.__name__[:-len("Locators")] if cls.__name__.endswith("Locators") else cls.__name__
+        selectors = selectors_of(cls)
+        aliases = getattr(cls, "ALIASES", {})
+        for alias, name in aliases.items():
+            if selectors.get(alias) is None or selectors.get(alias) != selectors.get(name):
+                raise LocatorError(f"{cls.__name__}.{alias} is declared an alias of {name} but has another selector")
+        names_by_selector: Dict[str, str] = {}
+        for name, selector in selectors.items():
+            try:
+                check_syntax(selector)
+            except ValueError as e:
+                raise LocatorError(f"{cls.__name__}.{name}: {str(e)}") from None
+            first = names_by_selector.setdefault(selector, name)
+            if first != name and aliases.get(name) != first:
+                raise LocatorError(
+                    f"{cls.__name__}.{name} duplicates {first} ({selector!r}); declare it in ALIASES to keep both names"
+                )
+            if name in vars(cls) and name not in aliases:
+                self.owners.setdefault(selector, []).append(f"{page}.{name}")
+        self.pages[page] = cls
+        return cls
+
+    def shared(self) -> Dict[str, List[str]]:
+        """Selectors defined by more than one page; fine for look-alike elements, else a mixin candidate"""
+        return {selector: owners for selector, owners in self.owners.items() if len(owners) > 1}
+
+    def locator(self, page, selector: str, nth: Optional[int] = None):
+        """The Locator of a selector on a page, built on first use and reused after that"""
+        try:
+            locators = self._locators.setdefault(page, {})
+        except TypeError:
+            # Pages that cannot be weakly referenced are not cached
+            locators = {}
+        locator = locators.get((selector, nth))
+        if locator is not None:
+            self.reused += 1
+            return locator
+        locator = page.locator(selector)
+        if nth is not None:
+            locator = locator.nth(nth)
+        locators[(selector, nth)] = locator
+        self.built += 1
+        return locator
+
+    def validate(self, page: Page, snapshots: Dict[str, List[str]]) -> List[Finding]:
+        """Check the selectors of each page against HTML snapshots of that page, loaded one by one in page
+
+        Matches are counted with page.locator(selector).count(), so they are what the tests'
+        Locators resolve to. A selector is missing when it matches nothing in any snapshot of
+        its page, and ambiguous when it matches several elements of one snapshot without being
+        listed in LISTS, which Playwright's strict mode would reject.
+        """
+        findings = []
+        for page_name, documents in snapshots.items():
+            cls = self.pages[page_name]
+            selectors = selectors_of(cls)
+            counts: Dict[str, List[int]] = {name: [] for name in selectors}
+            invalid: Dict[str, str] = {}
+            for document in documents:
+                page.set_content(document)
+                for name, selector in selectors.items():
+                    if name in invalid:
+                        continue
+                    try:
+                        counts[name].append(page.locator(selector).count())
+                    except Error as e:
+                        invalid[name] = e.message.splitlines()[0]
+            lists = set(getattr(cls, "LISTS", ()))
+            for name, selector in selectors.items():
+                if name in invalid:
+                    findings.append(Finding(page_name, name, selector, "invalid", invalid[name]))
+                elif not any(counts[name]):
+                    findings.append(Finding(page_name, name, selector, "missing",
+                                            f"no match in {len(documents)} snapshots"))
+                elif max(counts[name]) > 1 and name not in lists:
+                    findings.append(Finding(page_name, name, selector, "ambiguous",
+                                            f"up to {max(counts[name])} matches"))
+        return findings
+
+
+locator_registry = LocatorRegistry()
+
+
+def read_snapshot(path: str) -> str:
+    """HTML of a snapshot file, such as a gzipped DOM snapshot from the failure artifacts"""
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return f.read()
+
+
+def main(args: List[str]) -> int:
+    """Validate the locators in headless Chromium against PAGE=FILE snapshots, or the mock site's pages by default"""
+    # Relative imports, so `python -m pages.registry` uses the registry the locator classes register with
+    from . import locators  # noqa: F401
+    from .registry import locator_registry as registry
+    if args:
+        snapshots: Dict[str, List[str]] = {}
+        for arg in args:
+            page, _, path = arg.partition("=")
+            snapshots.setdefault(page, []).append(read_snapshot(path))
+    else:
+        from mock_site.snapshots import capture_snapshots
+        snapshots = capture_snapshots()
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch()
+        try:
+            findings = registry.validate(snapshot_page(browser), snapshots)
+        finally:
+            browser.close()
+    for finding in findings:
+        print(f"{finding.problem:<11} {finding.page}.{finding.name} {finding.selector!r}: {finding.detail}")
+    for selector, owners in sorted(registry.shared().items()):
+        print(f"{'shared':<11} {selector!r} in {', '.join(owners)}")
+    print(f"{sum(len(selectors_of(registry.pages[page])) for page in snapshots)} selectors checked "
+          f"against {sum(len(documents) for documents in snapshots.values())} snapshots, {len(findings)} findings")
+    return 1 if findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,230 @@
+import asyncio
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from typing import Callable, Dict, FrozenSet, Iterable, List, Tuple
+
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from config.config import Config
+from .timing import action_timer
+
+# Failure classes
+TIMEOUT = "timeout"
+DETACHED = "detached"
+NAVIGATION = "navigation"
+ASSERTION = "assertion"
+OTHER = "other"
+
+# Lower-cased message fragments of Playwright errors, checked before the exception type
+FAILURE_PATTERNS = (
+    (DETACHED, ("not attached to the dom", "element is detached", "element was detached", "node is detached")),
+    (NAVIGATION, ("net::err_", "ns_error_", "navigation failed", "interrupted by another navigation",
+                  "execution context was destroyed", "frame was detached", "connection refused")),
+)
+
+logger = logging.getLogger(__name__)
+
+
+def first_line(error: BaseException) -> str:
+    """First line of an error message; Playwright appends long call logs"""
+    message = str(error).strip()
+    return message.splitlines()[0] if message else repr(error)
+
+
+def classify(error: BaseException) -> str:
+    """Failure class of an exception raised by a page-object call or a test"""
+    if isinstance(error, AssertionError):
+        return ASSERTION
+    message = str(error).lower()
+    for failure, fragments in FAILURE_PATTERNS:
+        if any(fragment in message for fragment in fragments):
+            return failure
+    if isinstance(error, (PlaywrightTimeoutError, TimeoutError, asyncio.TimeoutError)):
+        return TIMEOUT
+    return OTHER
+
+
+class RetryPolicy:
+    """Which failures a level retries, how often, and the jittered exponential backoff between attempts"""
+
+    def __init__(self, retry_on: Iterable[str], attempts: int = 3, base_delay: float = Config.RETRY_BASE_DELAY,
+                 max_delay: float = Config.RETRY_MAX_DELAY):
+        self.retry_on: FrozenSet[str] = frozenset(retry_on)
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, retry: int) -> float:
+        """Backoff before the given retry (0-based): uniform in [0, min(max_delay, base_delay * 2^retry)]"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+    def __repr__(self) -> str:
+        return f"RetryPolicy({sorted(self.retry_on)}, attempts={self.attempts})"
+
+
+# Navigation errors and timeouts of page.goto usually clear up on a second try
+NAVIGATION_POLICY = RetryPolicy({NAVIGATION, TIMEOUT})
+# Auto-waiting locators re-resolve elements, so an action only needs retrying when its element was swapped out
+ACTION_POLICY = RetryPolicy({DETACHED}, attempts=2)
+# An idempotent page-object flow can be replayed as a whole after any transient failure
+STEP_POLICY = RetryPolicy({TIMEOUT, DETACHED, NAVIGATION}, attempts=2)
+# Rerunning a whole test is the most expensive level, so assertions and unknown errors never get there;
+# how often is up to pytest-rerunfailures (--reruns or the flaky marker)
+TEST_RETRY_ON = frozenset({TIMEOUT, DETACHED, NAVIGATION})
+
+
+class RetryBudget:
+    """Retries left in this session, shared by every level so a broken environment cannot retry forever"""
+
+    def __init__(self, total: int = Config.RETRY_BUDGET):
+        self.total = total
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return max(self.total - self.used, 0)
+
+    def take(self) -> bool:
+        """Spend one retry, if any are left"""
+        with self._lock:
+            if self.used >= self.total:
+                return False
+            self.used += 1
+            return True
+
+    def reset(self, total: int):
+        """Start over with a new total"""
+        with self._lock:
+            self.total = total
+            self.used = 0
+
+
+class RetryStats:
+    """Retries per level and failure class: how many were attempted, recovered, exhausted or denied by the budget"""
+    FIELDS = ("retries", "recovered", "exhausted", "denied", "backoff_seconds")
+
+    def __init__(self):
+        self.counts: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, level: str, failure: str, field: str, amount: float = 1):
+        with self._lock:
+            counts = self.counts.setdefault((level, failure), dict.fromkeys(self.FIELDS, 0))
+            counts[field] += amount
+
+    def rows(self) -> List[dict]:
+        """Stats as JSON-friendly rows"""
+        return [
+            {"level": level, "failure": failure, **counts}
+            for (level, failure), counts in sorted(self.counts.items())
+        ]
+
+    def merge(self, rows: List[dict]):
+        """Add rows produced by another process, e.g. an xdist worker"""
+        for row in rows:
+            for field in self.FIELDS:
+                if row[field]:
+                    self.record(row["level"], row["failure"], field, row[field])
+
+    def summary_lines(self) -> List[str]:
+        return [
+            f"{row['level']:<7} {row['failure']:<11} {row['retries']:>4} retried, {row['recovered']:>4} recovered, "
+            f"{row['exhausted']:>4} exhausted, {row['denied']:>4} over budget, {row['backoff_seconds']:.1f}s backoff"
+            for row in self.rows()
+        ]
+
+    def reset(self):
+        with self._lock:
+            self.counts.clear()
+
+
+class Retrier:
+    """Runs calls under a retry policy, spending the shared budget and recording stats"""
+
+    def __init__(self, budget: RetryBudget, stats: RetryStats):
+        self.budget = budget
+        self.stats = stats
+
+    def should_retry(self, level: str, policy: RetryPolicy, failure: str, retry: int) -> bool:
+        """Whether a failure gets another attempt; retry is the number of retries made so far"""
+        if failure not in policy.retry_on:
+            return False
+        if retry + 1 >= policy.attempts:
+            self.stats.record(level, failure, "exhausted")
+            return False
+        if not self.budget.take():
+            self.stats.record(level, failure, "denied")
+            return False
+        self.stats.record(level, failure, "retries")
+        action_timer.count_retry()
+        return True
+
+    def backoff(self, level: str, policy: RetryPolicy, failure: str, retry: int) -> float:
+        delay = policy.delay(retry)
+        self.stats.record(level, failure, "backoff_seconds", delay)
+        return delay
+
+    def call(self, level: str, policy: RetryPolicy, function: Callable, *args, **kwargs):
+        """Call function, retrying the failures the policy covers"""
+        retry = 0
+        failure = None
+        while True:
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                failure = classify(e)
+                if not self.should_retry(level, policy, failure, retry):
+                    raise
+                logger.warning(f"Retrying {level} after {failure} failure: {first_line(e)}")
+                time.sleep(self.backoff(level, policy, failure, retry))
+                retry += 1
+                continue
+            if retry:
+                self.stats.record(level, failure, "recovered")
+            return result
+
+    async def acall(self, level: str, policy: RetryPolicy, function: Callable, *args, **kwargs):
+        """Async counterpart of call() for coroutine functions"""
+        retry = 0
+        failure = None
+        while True:
+            try:
+                result = await function(*args, **kwargs)
+            except Exception as e:
+                failure = classify(e)
+                if not self.should_retry(level, policy, failure, retry):
+                    raise
+                logger.warning(f"Retrying {level} after {failure} failure: {first_line(e)}")
+                await asyncio.sleep(self.backoff(level, policy, failure, retry))
+                retry += 1
+                continue
+            if retry:
+                self.stats.record(level, failure, "recovered")
+            return result
+
+
+retry_budget = RetryBudget()
+retry_stats = RetryStats()
+retrier = Retrier(retry_budget, retry_stats)
+
+
+def retry_step(function: Callable = None, policy: RetryPolicy = STEP_POLICY):
+    """Replay an idempotent page-object flow as a whole after a transient failure"""
+    if function is None:
+        return functools.partial(retry_step, policy=policy)
+
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def async_wrapper(*args, **kwargs):
+            return await retrier.acall("step", policy, function, *args, **kwargs)
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        return retrier.call("step", policy, function, *args, **kwargs)
+    return wrapper
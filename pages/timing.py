@@ -0,0 +1,144 @@
+import contextvars
+import functools
+import inspect
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from config.config import Config
+from .wait_strategies import wait_stats
+
+# Retry counter of the innermost timed call, per thread / asyncio task
+_current_retries = contextvars.ContextVar("current_retries", default=None)
+
+# Builders that return immediately are not worth timing
+UNTIMED_METHODS = {"locator"}
+# Parameters naming what an action targets, reported next to the action
+TARGET_PARAMETERS = ("selector", "locator", "url")
+
+
+class ActionStats:
+    """Accumulated timings of one page-object method on one selector"""
+    __slots__ = ("calls", "seconds", "max_seconds", "wait_seconds", "retries")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.wait_seconds = 0.0
+        self.retries = 0
+
+
+class ActionTimer:
+    """Collects per-action timings: total, wait strategy time and retries"""
+
+    def __init__(self):
+        self.stats: Dict[Tuple[str, str], ActionStats] = {}
+
+    def record(self, action: str, selector: Optional[str], seconds: float, wait_seconds: float = 0.0,
+               retries: int = 0, calls: int = 1, max_seconds: Optional[float] = None):
+        """Add a timed call (or an aggregate of several) to the stats"""
+        stats = self.stats.get((action, selector or ""))
+        if stats is None:
+            stats = self.stats[(action, selector or "")] = ActionStats()
+        stats.calls += calls
+        stats.seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds if max_seconds is None else max_seconds)
+        stats.wait_seconds += wait_seconds
+        stats.retries += retries
+
+    def count_retry(self):
+        """Count a retry of the action currently being timed"""
+        retries = _current_retries.get()
+        if retries is not None:
+            retries[0] += 1
+
+    def rows(self) -> List[dict]:
+        """Stats as JSON-friendly rows, slowest total first"""
+        rows = [
+            {
+                "action": action,
+                "selector": selector,
+                "calls": stats.calls,
+                "seconds": round(stats.seconds, 4),
+                "avg_ms": round(stats.seconds / stats.calls * 1000, 2),
+                "max_ms": round(stats.max_seconds * 1000, 2),
+                "wait_seconds": round(stats.wait_seconds, 4),
+                "action_seconds": round(stats.seconds - stats.wait_seconds, 4),
+                "retries": stats.retries,
+            }
+            for (action, selector), stats in self.stats.items()
+        ]
+        return sorted(rows, key=lambda row: row["seconds"], reverse=True)
+
+    def merge(self, rows: List[dict]):
+        """Add rows produced by another process, e.g. an xdist worker"""
+        for row in rows:
+            self.record(row["action"], row["selector"], row["seconds"], row["wait_seconds"], row["retries"],
+                        calls=row["calls"], max_seconds=row["max_ms"] / 1000)
+
+    def reset(self):
+        """Clear all recorded timings"""
+        self.stats.clear()
+
+
+action_timer = ActionTimer()
+
+
+def timed(function: Callable, action: str) -> Callable:
+    """Wrap a page-object method so every call is recorded in action_timer"""
+    parameters = list(inspect.signature(function).parameters)
+    target = next((name for name in TARGET_PARAMETERS if name in parameters), None)
+    # Index among the positional arguments after self
+    target_index = parameters.index(target) - 1 if target else None
+
+    def selector_of(args, kwargs) -> Optional[str]:
+        if target is None:
+            return None
+        return args[target_index] if len(args) > target_index else kwargs.get(target)
+
+    if inspect.iscoroutinefunction(function):
+        @functools.wraps(function)
+        async def async_wrapper(self, *args, **kwargs):
+            retries = [0]
+            token = _current_retries.set(retries)
+            waited = wait_stats.total
+            start = time.perf_counter()
+            try:
+                return await function(self, *args, **kwargs)
+            finally:
+                _current_retries.reset(token)
+                action_timer.record(action, selector_of(args, kwargs), time.perf_counter() - start,
+                                    wait_stats.total - waited, retries[0])
+        return async_wrapper
+
+    @functools.wraps(function)
+    def wrapper(self, *args, **kwargs):
+        retries = [0]
+        token = _current_retries.set(retries)
+        waited = wait_stats.total
+        start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            _current_retries.reset(token)
+            action_timer.record(action, selector_of(args, kwargs), time.perf_counter() - start,
+                                wait_stats.total - waited, retries[0])
+    return wrapper
+
+
+def instrument(cls):
+    """Time the public methods a page class defines"""
+    if not Config.ACTION_TIMING:
+        return cls
+    for name, member in list(vars(cls).items()):
+        if inspect.isfunction(member) and not name.startswith("_") and name not in UNTIMED_METHODS:
+            setattr(cls, name, timed(member, f"{cls.__name__}.{name}"))
+    return cls
+
+
+class Instrumented:
+    """Base of the page objects: every class deriving from it has its public methods timed when defined"""
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        instrument(cls)
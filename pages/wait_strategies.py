@@ -0,0 +1,296 @@
+from playwright.sync_api import Page, Error as PlaywrightError
+from playwright.async_api import Page as AsyncPage
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Awaitable, Callable, Dict, List, Optional, Union
+
+from config.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Resolves once the DOM has been quiet for `quiet` ms, or after `max` ms at the latest
+DOM_SETTLED_SCRIPT = """
+([quiet, max]) => new Promise(resolve => {
+    let timer;
+    const observer = new MutationObserver(() => {
+        clearTimeout(timer);
+        timer = setTimeout(done, quiet);
+    });
+    function done() {
+        observer.disconnect();
+        resolve();
+    }
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    timer = setTimeout(done, quiet);
+    setTimeout(done, max);
+})
+"""
+
+
+class WaitStats:
+    """Accumulates time spent in wait strategies"""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def record(self, name: str, seconds: float):
+        """Record a single wait"""
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    @property
+    def total(self) -> float:
+        """Total seconds spent waiting"""
+        return sum(self.seconds.values())
+
+    def reset(self):
+        """Clear all recorded waits"""
+        self.seconds.clear()
+        self.counts.clear()
+
+    def rows(self) -> List[dict]:
+        """Waits per strategy, JSON-friendly"""
+        return [{"strategy": name, "count": self.counts[name], "seconds": round(seconds, 4)}
+                for name, seconds in self.seconds.items()]
+
+    def merge(self, rows: List[dict]):
+        """Add rows produced by another process, e.g. an xdist worker"""
+        for row in rows:
+            self.seconds[row["strategy"]] = self.seconds.get(row["strategy"], 0.0) + row["seconds"]
+            self.counts[row["strategy"]] = self.counts.get(row["strategy"], 0) + row["count"]
+
+    def summary_lines(self) -> list:
+        """Human readable summary, slowest strategy first"""
+        lines = []
+        for name, seconds in sorted(self.seconds.items(), key=lambda kv: kv[1], reverse=True):
+            count = self.counts[name]
+            lines.append(f"{name:<14} {count:>6} waits {seconds:>9.2f}s total {seconds / count * 1000:>8.1f}ms avg")
+        lines.append(f"{'total':<14} {sum(self.counts.values()):>6} waits {self.total:>9.2f}s")
+        return lines
+
+
+wait_stats = WaitStats()
+
+
+class WaitStrategy(ABC):
+    """Policy describing what to wait for after an action"""
+    name = "base"
+
+    @abstractmethod
+    def run(self, page: Page, action: Callable[[], None], timeout: int = Config.DEFAULT_TIMEOUT):
+        """Perform action and wait according to the policy"""
+
+    @abstractmethod
+    async def arun(self, page: AsyncPage, action: Callable[[], Awaitable], timeout: int = Config.DEFAULT_TIMEOUT):
+        """Async counterpart of run() for pages.aio"""
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class PostActionWait(WaitStrategy):
+    """Strategy that performs the action first and then waits for a condition of the page"""
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int = Config.DEFAULT_TIMEOUT):
+        action()
+        start = time.perf_counter()
+        try:
+            self.wait(page, timeout)
+        finally:
+            wait_stats.record(self.name, time.perf_counter() - start)
+
+    @abstractmethod
+    def wait(self, page: Page, timeout: int):
+        """Wait after the action has been performed"""
+
+    async def arun(self, page: AsyncPage, action: Callable[[], Awaitable], timeout: int = Config.DEFAULT_TIMEOUT):
+        await action()
+        start = time.perf_counter()
+        try:
+            await self.async_wait(page, timeout)
+        finally:
+            wait_stats.record(self.name, time.perf_counter() - start)
+
+    @abstractmethod
+    async def async_wait(self, page: AsyncPage, timeout: int):
+        """Async counterpart of wait()"""
+
+
+class NoWait(WaitStrategy):
+    """Do not wait at all; the next locator action auto-waits"""
+    name = "none"
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int = Config.DEFAULT_TIMEOUT):
+        action()
+
+    async def arun(self, page: AsyncPage, action: Callable[[], Awaitable], timeout: int = Config.DEFAULT_TIMEOUT):
+        await action()
+
+
+class LoadState(PostActionWait):
+    """Wait for a page load state (domcontentloaded, load, networkidle)"""
+    name = "load_state"
+
+    def __init__(self, state: str = "domcontentloaded"):
+        self.state = state
+
+    def wait(self, page: Page, timeout: int):
+        page.wait_for_load_state(self.state, timeout=timeout)
+
+    async def async_wait(self, page: AsyncPage, timeout: int):
+        await page.wait_for_load_state(self.state, timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"LoadState({self.state!r})"
+
+
+class UrlChange(WaitStrategy):
+    """Wait until the URL matches a pattern, or simply differs from the one before the action"""
+    name = "url_change"
+
+    def __init__(self, url: Optional[Union[str, Callable[[str], bool]]] = None, wait_until: str = "domcontentloaded"):
+        self.url = url
+        self.wait_until = wait_until
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int = Config.DEFAULT_TIMEOUT):
+        before = page.url
+        action()
+        start = time.perf_counter()
+        try:
+            url = self.url if self.url is not None else (lambda current: current != before)
+            page.wait_for_url(url, timeout=timeout, wait_until=self.wait_until)
+        finally:
+            wait_stats.record(self.name, time.perf_counter() - start)
+
+    async def arun(self, page: AsyncPage, action: Callable[[], Awaitable], timeout: int = Config.DEFAULT_TIMEOUT):
+        before = page.url
+        await action()
+        start = time.perf_counter()
+        try:
+            url = self.url if self.url is not None else (lambda current: current != before)
+            await page.wait_for_url(url, timeout=timeout, wait_until=self.wait_until)
+        finally:
+            wait_stats.record(self.name, time.perf_counter() - start)
+
+    def __repr__(self) -> str:
+        return f"UrlChange({self.url!r})"
+
+
+class Navigation(WaitStrategy):
+    """Wait for the main frame to navigate, including form posts back to the same URL"""
+    name = "navigation"
+
+    def __init__(self, wait_until: str = "domcontentloaded"):
+        self.wait_until = wait_until
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int = Config.DEFAULT_TIMEOUT):
+        start = None
+        try:
+            with page.expect_navigation(timeout=timeout, wait_until=self.wait_until):
+                action()
+                start = time.perf_counter()
+        finally:
+            if start is not None:
+                wait_stats.record(self.name, time.perf_counter() - start)
+
+    async def arun(self, page: AsyncPage, action: Callable[[], Awaitable], timeout: int = Config.DEFAULT_TIMEOUT):
+        start = None
+        try:
+            async with page.expect_navigation(timeout=timeout, wait_until=self.wait_until):
+                await action()
+                start = time.perf_counter()
+        finally:
+            if start is not None:
+                wait_stats.record(self.name, time.perf_counter() - start)
+
+
+class ResponseWait(WaitStrategy):
+    """Wait for a specific network response triggered by the action"""
+    name = "response"
+
+    def __init__(self, url_or_predicate: Union[str, Callable]):
+        self.url_or_predicate = url_or_predicate
+
+    def run(self, page: Page, action: Callable[[], None], timeout: int = Config.DEFAULT_TIMEOUT):
+        start = None
+        try:
+            with page.expect_response(self.url_or_predicate, timeout=timeout):
+                action()
+                start = time.perf_counter()
+        finally:
+            if start is not None:
+                wait_stats.record(self.name, time.perf_counter() - start)
+
+    async def arun(self, page: AsyncPage, action: Callable[[], Awaitable], timeout: int = Config.DEFAULT_TIMEOUT):
+        start = None
+        try:
+            async with page.expect_response(self.url_or_predicate, timeout=timeout):
+                await action()
+                start = time.perf_counter()
+        finally:
+            if start is not None:
+                wait_stats.record(self.name, time.perf_counter() - start)
+
+    def __repr__(self) -> str:
+        return f"ResponseWait({self.url_or_predicate!r})"
+
+
+class DomSettled(PostActionWait):
+    """Wait until no DOM mutations happened for a quiet period"""
+    name = "dom_settled"
+
+    def __init__(self, quiet_ms: int = Config.DOM_SETTLE_QUIET_MS, max_ms: int = Config.DOM_SETTLE_MAX_MS):
+        self.quiet_ms = quiet_ms
+        self.max_ms = max_ms
+
+    def wait(self, page: Page, timeout: int):
+        try:
+            page.evaluate(DOM_SETTLED_SCRIPT, [self.quiet_ms, min(self.max_ms, timeout)])
+        except PlaywrightError as e:
+            # The action started a navigation and destroyed the execution context
+            logger.debug(f"DOM settle interrupted ({e}), waiting for domcontentloaded")
+            page.wait_for_load_state("domcontentloaded", timeout=timeout)
+
+    async def async_wait(self, page: AsyncPage, timeout: int):
+        try:
+            await page.evaluate(DOM_SETTLED_SCRIPT, [self.quiet_ms, min(self.max_ms, timeout)])
+        except PlaywrightError as e:
+            logger.debug(f"DOM settle interrupted ({e}), waiting for domcontentloaded")
+            await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+
+
+class ElementState(PostActionWait):
+    """Wait for an element to reach a state (visible, hidden, attached, detached)"""
+    name = "element_state"
+
+    def __init__(self, selector: str, state: str = "visible"):
+        self.selector = selector
+        self.state = state
+
+    def wait(self, page: Page, timeout: int):
+        page.locator(self.selector).first.wait_for(state=self.state, timeout=timeout)
+
+    async def async_wait(self, page: AsyncPage, timeout: int):
+        await page.locator(self.selector).first.wait_for(state=self.state, timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"ElementState({self.selector!r}, {self.state!r})"
+
+
+WAIT_STRATEGIES = {
+    "none": NoWait,
+    "load_state": LoadState,
+    "navigation": Navigation,
+    "url_change": UrlChange,
+    "dom_settled": DomSettled,
+}
+
+
+def get_wait_strategy(name: str) -> WaitStrategy:
+    """Build a parameterless wait strategy by name"""
+    try:
+        return WAIT_STRATEGIES[name]()
+    except KeyError:
+        raise ValueError(f"Unknown wait strategy: {name}. Choose from {', '.join(WAIT_STRATEGIES)}")
@@ -4,6 +4,9 @@ setup(
     name="automation-exercise",
     version="0.1",
     packages=find_packages(),
+    package_data={
+        "mock_site": ["templates/*.html", "fixtures/*.json", "static/css/*", "static/js/*"]
+    },
     install_requires=[
         "playwright>=1.42.0",
         "pytest>=8.0.2",
@@ -1,11 +1,46 @@
+import time
+# Measured from here: importing the page objects and plugins is part of every worker's start-up
+CONFTEST_IMPORT_STARTED = time.perf_counter()
+
 import pytest
-from playwright.sync_api import Page, Browser, BrowserContext
+from playwright.sync_api import Page, Browser, BrowserContext, Error as PlaywrightError
 from typing import Generator
+import inspect
+import logging
 import os
-from datetime import datetime
+import tempfile
 
 from config.config import Config
+from mock_site.app import create_server
+from utils.context_pool import ContextPool
+from utils.perf_metrics import PerfCollector, new_run_id
+from utils.multiplexer import BrowserMultiplexer, MultiplexPlugin, MuxPage, MuxSession
+from pages.budgets import budget_tracker
+from pages.forms import form_stats
 from pages.home_page import HomePage
+from pages.retry import retrier, retry_budget
+from pages.timing import action_timer
+from pages.wait_strategies import wait_stats
+from utils.action_report import ActionReportPlugin
+from utils.artifacts import ArtifactPlugin, ConsoleLog
+from utils.budget_report import BudgetPlugin
+from utils.catalog import CatalogError, CatalogIndex, load_catalog
+from utils.checkout_stages import CheckoutStager, StagedOrder
+from utils.form_report import FormReportPlugin
+from utils.retry_report import RetryPlugin
+from utils.har_router import HarMergePlugin, HarRouter, NETWORK_MODES, HAR_SCOPES, UNMATCHED_POLICIES
+from utils.tracing import TraceRecorder
+from utils.wait_report import WaitReportPlugin
+from utils.scheduling import DurationHistory, DurationPlugin
+from utils.request_router import (
+    RequestRouter, RouterStats, DEFAULT_BLOCKED_RESOURCE_TYPES, DEFAULT_BLOCKED_DOMAINS
+)
+from utils.testdata import testdata
+from utils.startup import StartupPlugin, startup_timer, tuned_launch_args, warm_up
+from utils.user_factory import UserFactory
+from utils.user_pool import UserPool, get_worker_id
+
+startup_timer.record("imports", time.perf_counter() - CONFTEST_IMPORT_STARTED)
 
 def pytest_addoption(parser):
     """Add custom command line options"""
@@ -21,14 +56,205 @@ def pytest_addoption(parser):
         default=False,
         help="Run browser in headless mode"
     )
+    parser.addoption(
+        "--mock-site",
+        action="store_true",
+        default=Config.MOCK_SITE,
+        help="Run against the bundled local mock site instead of BASE_URL"
+    )
+    parser.addoption(
+        "--network-mode",
+        action="store",
+        default="live",
+        choices=NETWORK_MODES,
+        help="live: real network, record: capture HAR archives, replay: serve traffic from HAR archives"
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default=Config.HAR_DIR,
+        help="Directory holding HAR archives"
+    )
+    parser.addoption(
+        "--har-scope",
+        action="store",
+        default="test",
+        choices=HAR_SCOPES,
+        help="Record one HAR archive per test or per page type"
+    )
+    parser.addoption(
+        "--har-unmatched",
+        action="store",
+        default="abort",
+        choices=UNMATCHED_POLICIES,
+        help="In replay mode, abort requests missing from the HAR or let them through to the network"
+    )
+    parser.addoption(
+        "--full-fidelity",
+        action="store_true",
+        default=not Config.BLOCK_RESOURCES,
+        help="Do not block ads, trackers, images and fonts"
+    )
+    parser.addoption(
+        "--no-context-pool",
+        action="store_false",
+        dest="context_pool",
+        default=Config.CONTEXT_POOL,
+        help="Create a new browser context for every test instead of reusing pooled ones"
+    )
+    parser.addoption(
+        "--duration-history",
+        action="store",
+        default=Config.DURATION_HISTORY,
+        help="File of per-test durations recorded by previous runs"
+    )
+    parser.addoption(
+        "--no-duration-scheduling",
+        action="store_false",
+        dest="duration_scheduling",
+        default=True,
+        help="Use xdist's default load scheduling instead of packing tests by recorded duration"
+    )
+    parser.addoption(
+        "--no-warm-up",
+        action="store_false",
+        dest="warm_up",
+        default=Config.WARM_UP,
+        help="Do not load the site once in a pooled context before the first test"
+    )
+    parser.addoption(
+        "--no-tracing",
+        action="store_false",
+        dest="context_tracing",
+        default=Config.CONTEXT_TRACING,
+        help="Do not trace test contexts (traces are otherwise kept for failed and slow tests)"
+    )
+    parser.addoption(
+        "--multiplex-contexts",
+        action="store",
+        type=int,
+        default=Config.MULTIPLEX_CONTEXTS,
+        help="How many multiplexed async tests a worker runs at the same time"
+    )
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=Config.PERF_METRICS,
+        help="Record Navigation Timing, paint/LCP, transfer size and CDP metrics of every page load"
+    )
+    parser.addoption(
+        "--no-batch-forms",
+        action="store_false",
+        dest="batch_forms",
+        default=Config.BATCH_FORMS,
+        help="Fill forms field by field instead of in one round-trip (measures the per-field cost)"
+    )
+    parser.addoption(
+        "--budgets",
+        action="store_true",
+        dest="perf_budgets",
+        default=Config.PERF_BUDGETS,
+        help="Check page-object methods against their performance budgets and fail tests that exceed them"
+    )
+    parser.addoption(
+        "--update-budget-baseline",
+        action="store_true",
+        default=False,
+        help="Record the measurements of budgeted page-object methods as the new baseline instead of checking them"
+    )
+    parser.addoption(
+        "--refresh-catalog",
+        action="store_true",
+        default=False,
+        help="Re-scrape the product catalog index even if it is fresh"
+    )
+    parser.addoption(
+        "--resume-crawl",
+        action="store_true",
+        default=False,
+        help="Continue an interrupted product crawl, only visiting products without a result yet"
+    )
+    parser.addoption(
+        "--refresh-auth",
+        action="store_true",
+        default=False,
+        help="Discard cached storage states and provision new pooled users"
+    )
+
+def pytest_configure(config):
+    """Capture failure artifacts, report page-object action timings, wait time, form filling, budgets and retries, record test durations and balance xdist workers with them"""
+    config.pluginmanager.register(ActionReportPlugin(action_timer), "action_report")
+    config.pluginmanager.register(WaitReportPlugin(wait_stats), "wait_report")
+    config.pluginmanager.register(ArtifactPlugin(), "artifacts")
+    config.pluginmanager.register(StartupPlugin(startup_timer, get_worker_id()), "startup")
+    config.pluginmanager.register(MultiplexPlugin(get_worker_id()), "multiplex_report")
+    Config.BATCH_FORMS = config.getoption("batch_forms")
+    config.pluginmanager.register(FormReportPlugin(form_stats), "form_report")
+    budget_tracker.updating_baseline = config.getoption("update_budget_baseline")
+    budget_tracker.enabled = config.getoption("perf_budgets") or budget_tracker.updating_baseline
+    config.pluginmanager.register(BudgetPlugin(budget_tracker), "budget_report")
+    # TEST_RERUNS opts into test reruns like --reruns; the retry budget is shared out between xdist workers
+    if config.getoption("reruns", None) is None and Config.TEST_RERUNS and not config.getoption("usepdb"):
+        config.option.reruns = Config.TEST_RERUNS
+    retry_budget.reset(max(Config.RETRY_BUDGET // int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1")), 1))
+    config.pluginmanager.register(RetryPlugin(retrier), "retry_report")
+    # Workers send their reports to the controller, which owns the history file
+    if hasattr(config, "workerinput"):
+        return
+    # xdist workers are started after this and inherit the seed, each deriving its own stream from it
+    os.environ["TESTDATA_SEED"] = str(testdata.seed)
+    # Likewise the run id tagging page load samples, so one run's samples share it across workers
+    os.environ.setdefault("PERF_RUN_ID", new_run_id())
+    # Page-scoped recordings are made per test and merged here once every worker has finished
+    if config.getoption("network_mode") == "record" and config.getoption("har_scope") == "page":
+        router = HarRouter("record", har_dir=config.getoption("har_dir"), scope="page")
+        config.pluginmanager.register(HarMergePlugin(router), "har_merge")
+    prepare_catalog(config)
+    history = DurationHistory.load(config.getoption("duration_history"))
+    plugin = DurationPlugin(history, schedule=config.getoption("duration_scheduling"))
+    config.pluginmanager.register(plugin, "duration_plugin")
+
+def prepare_catalog(config):
+    """Refresh the catalog index once, before xdist starts the workers; the catalog fixture only loads it"""
+    if config.option.collectonly:
+        return
+    server = None
+    base_url, refresh = Config.BASE_URL, config.getoption("refresh_catalog")
+    if config.getoption("mock_site"):
+        # The mock site's catalog is fixed, but its index belongs to the session like its accounts;
+        # workers inherit its path like the seed
+        catalog_dir = tempfile.TemporaryDirectory(prefix="catalog-")
+        config.add_cleanup(catalog_dir.cleanup)
+        Config.CATALOG_PATH = os.environ["CATALOG_PATH"] = os.path.join(catalog_dir.name, "catalog_index.json")
+        server = create_server()
+        base_url, refresh = server.start(), True
+    try:
+        load_catalog(Config.CATALOG_PATH, base_url=base_url, refresh=refresh)
+    except (CatalogError, PlaywrightError, OSError) as e:
+        logging.getLogger(__name__).warning(f"Failed to refresh the catalog index: {str(e)}")
+    finally:
+        if server:
+            server.stop()
+
+def pytest_report_header(config):
+    """Show the test data seed, so a run's data can be reproduced"""
+    return f"testdata seed: {testdata.seed} (reproduce with TESTDATA_SEED={testdata.seed})"
 
 @pytest.fixture(scope="session")
-def browser_type_launch_args(pytestconfig) -> dict:
-    """Get browser launch arguments"""
-    return {
+def browser_type_launch_args(pytestconfig, browser_name: str) -> dict:
+    """Get browser launch arguments, with start-up flags for the browser"""
+    return tuned_launch_args(browser_name, {
         "headless": pytestconfig.getoption("headless"),
         **Config.get_browser_config()
-    }
+    })
+
+@pytest.fixture(scope="session")
+def browser(launch_browser) -> Generator[Browser, None, None]:
+    """One browser per worker, launched when the first test needs it"""
+    with startup_timer.phase("browser launch"):
+        browser = launch_browser()
+    yield browser
+    browser.close()
 
 @pytest.fixture(scope="session")
 def browser_context_args() -> dict:
@@ -46,12 +272,324 @@ def browser_name(pytestconfig) -> str:
     """Get browser name from command line options"""
     return pytestconfig.getoption("browser-type")
 
+@pytest.fixture(scope="session", autouse=True)
+def site_url(pytestconfig) -> Generator[str, None, None]:
+    """Base URL of the site under test, starting the local mock site if requested"""
+    if not pytestconfig.getoption("mock_site"):
+        yield Config.BASE_URL
+        return
+    server = create_server()
+    original_url = Config.BASE_URL
+    Config.BASE_URL = server.start()
+    yield Config.BASE_URL
+    server.stop()
+    Config.BASE_URL = original_url
+
+@pytest.fixture(scope="module")
+def mock_site() -> Generator[str, None, None]:
+    """URL of a local mock site of the test module's own, so helpers that talk to the site are tested offline"""
+    server = create_server()
+    yield server.start()
+    server.stop()
+
+class FakeTracing:
+    """Records tracing calls; stop_chunk(path) writes a placeholder archive"""
+
+    def __init__(self):
+        self.calls = []
+
+    def start(self, **kwargs):
+        self.calls.append(("start", kwargs))
+
+    def start_chunk(self, title: str = None):
+        self.calls.append(("start_chunk", title))
+
+    def stop_chunk(self, path: str = None):
+        self.calls.append(("stop_chunk", path))
+        if path:
+            with open(path, "wb") as f:
+                f.write(b"PK")
+
+
+class FakeBrowserContext:
+    """Browser context double of the offline tests"""
+
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+class FakeBrowserPage:
+    """Playwright page double of the offline tests of page objects, waits, budgets and failure artifacts
+
+    Calls are recorded in `calls`, listeners added with on() are fired by emit(), and evaluate(),
+    screenshot() and content() return `evaluate_result`, `image` and `html`. evaluate() raises
+    `evaluate_error` instead when it is set. Exposed bindings are kept in `bindings`, so a test
+    can call them the way a page's scripts would.
+    """
+
+    def __init__(self):
+        self.context = FakeBrowserContext()
+        self.url = "http://shop.test/"
+        self.calls = []
+        self.listeners = {}
+        self.bindings = {}
+        self.init_scripts = []
+        self.evaluate_result = None
+        self.evaluate_error: Exception = None
+        self.image = b""
+        self.html = "<html></html>"
+
+    def on(self, event: str, listener):
+        self.listeners.setdefault(event, []).append(listener)
+
+    def emit(self, event: str, payload=None):
+        for listener in self.listeners.get(event, []):
+            listener(payload)
+
+    def expose_binding(self, name: str, callback):
+        self.bindings[name] = callback
+
+    def add_init_script(self, script: str):
+        self.init_scripts.append(script)
+
+    def goto(self, url: str, timeout: int = None, wait_until: str = None):
+        self.calls.append(("goto", url, wait_until))
+        self.url = url
+
+    def evaluate(self, script: str, arg=None):
+        self.calls.append(("evaluate", arg))
+        if self.evaluate_error:
+            raise self.evaluate_error
+        return self.evaluate_result
+
+    def wait_for_load_state(self, state: str = "load", timeout: int = None):
+        self.calls.append(("load_state", state))
+
+    def wait_for_url(self, url, timeout: int = None, wait_until: str = None):
+        self.calls.append(("wait_for_url", url(self.url) if callable(url) else url))
+
+    def is_closed(self) -> bool:
+        return False
+
+    def screenshot(self, **kwargs) -> bytes:
+        self.calls.append(("screenshot", kwargs))
+        return self.image
+
+    def content(self) -> str:
+        return self.html
+
+@pytest.fixture
+def fake_page() -> FakeBrowserPage:
+    """Playwright page double, for page objects and helpers tested without a browser"""
+    return FakeBrowserPage()
+
+@pytest.fixture
+def fake_context() -> FakeBrowserContext:
+    """Browser context double, for helpers tested without a browser"""
+    return FakeBrowserContext()
+
+@pytest.fixture(scope="session")
+def user_factory(playwright, site_url: str) -> Generator[UserFactory, None, None]:
+    """Session-wide HTTP account factory; leftover accounts are deleted at teardown"""
+    factory = UserFactory(playwright, base_url=site_url)
+    yield factory
+    factory.close()
+
+@pytest.fixture
+def new_user(user_factory: UserFactory) -> Generator[dict, None, None]:
+    """Account created over HTTP and deleted after the test, even if it fails"""
+    user_data = user_factory.create()
+    yield user_data
+    if user_data["email"] in user_factory.created:
+        user_factory.delete(user_data)
+
+@pytest.fixture(scope="session")
+def user_pool(pytestconfig, tmp_path_factory, user_factory: UserFactory) -> UserPool:
+    """Session-wide pool of provisioned users with cached storage states"""
+    # Mock site accounts only live as long as the session, so never reuse their states
+    state_dir = str(tmp_path_factory.mktemp("auth")) if pytestconfig.getoption("mock_site") else Config.STORAGE_STATE_DIR
+    pool = UserPool(user_factory, state_dir=state_dir)
+    if pytestconfig.getoption("refresh_auth"):
+        pool.invalidate()
+    return pool
+
+@pytest.fixture(scope="session")
+def catalog() -> CatalogIndex:
+    """Index of the site's products, refreshed by the controller before the session when missing or stale"""
+    index = CatalogIndex.load(Config.CATALOG_PATH)
+    if index is None:
+        pytest.fail(f"No catalog index at {Config.CATALOG_PATH}; refreshing it before the session failed")
+    return index
+
+@pytest.fixture
+def auth_user(request, user_pool: UserPool) -> dict:
+    """Credentials of the pooled user the test is logged in as"""
+    marker = request.node.get_closest_marker("authenticated")
+    role = marker.kwargs.get("role", "default") if marker else "default"
+    return user_pool.acquire(role)
+
+@pytest.fixture
+def checkout_stager(page: Page) -> CheckoutStager:
+    """Sets up the page's session, login and cart over HTTP"""
+    return CheckoutStager(page.context)
+
+@pytest.fixture
+def checkout_user(request, checkout_stager: CheckoutStager, user_pool: UserPool) -> dict:
+    """Pooled user the page is logged in as, with an empty cart"""
+    marker = request.node.get_closest_marker("authenticated")
+    user_data = user_pool.acquire(marker.kwargs.get("role", "default") if marker else "default")
+    # Authenticated tests start with the user's storage state, the others log in here
+    if not marker:
+        checkout_stager.login(user_data)
+    checkout_stager.clear_cart()
+    return user_data
+
+@pytest.fixture
+def cart_products(request, catalog: CatalogIndex) -> list:
+    """Catalog products the staged checkout fixtures put in the cart, as many as the cart marker asks for"""
+    marker = request.node.get_closest_marker("cart")
+    count = marker.kwargs.get("items", 1) if marker else 1
+    products = list(catalog)[:count]
+    if len(products) < count:
+        pytest.fail(f"The catalog only has {len(products)} products, the cart marker asks for {count}")
+    return products
+
+def stage_checkout(page: Page, stager: CheckoutStager, stage: str, user_data, products: list) -> StagedOrder:
+    """Advance the page's session to a checkout stage and open the page of that stage"""
+    card = testdata.card() if stage == "order_placed" else None
+    order = StagedOrder(user_data, products, stager.stage(stage, products, card))
+    HomePage(page).navigate(order.url)
+    return order
+
+@pytest.fixture
+def guest_cart(page: Page, checkout_stager: CheckoutStager, cart_products: list) -> StagedOrder:
+    """Guest with the cart products in the cart, on the cart page"""
+    return stage_checkout(page, checkout_stager, "cart", None, cart_products)
+
+@pytest.fixture
+def user_cart(page: Page, checkout_stager: CheckoutStager, checkout_user: dict, cart_products: list) -> StagedOrder:
+    """Logged-in user with the cart products in the cart, on the cart page"""
+    return stage_checkout(page, checkout_stager, "cart", checkout_user, cart_products)
+
 @pytest.fixture
-def page(browser: Browser, browser_context_args) -> Generator[Page, None, None]:
+def on_checkout(page: Page, checkout_stager: CheckoutStager, checkout_user: dict, cart_products: list) -> StagedOrder:
+    """Logged-in user with the cart products in the cart, on the checkout page"""
+    return stage_checkout(page, checkout_stager, "checkout", checkout_user, cart_products)
+
+@pytest.fixture
+def on_payment(page: Page, checkout_stager: CheckoutStager, checkout_user: dict, cart_products: list) -> StagedOrder:
+    """Logged-in user with the cart products in the cart, on the payment page"""
+    return stage_checkout(page, checkout_stager, "payment", checkout_user, cart_products)
+
+@pytest.fixture
+def order_placed(page: Page, checkout_stager: CheckoutStager, checkout_user: dict, cart_products: list) -> StagedOrder:
+    """Logged-in user who has paid for the cart products, on the order confirmation"""
+    return stage_checkout(page, checkout_stager, "order_placed", checkout_user, cart_products)
+
+@pytest.fixture(scope="session")
+def har_router(pytestconfig) -> HarRouter:
+    """Network record/replay configuration for browser contexts"""
+    return HarRouter(
+        mode=pytestconfig.getoption("network_mode"),
+        har_dir=pytestconfig.getoption("har_dir"),
+        scope=pytestconfig.getoption("har_scope"),
+        unmatched=pytestconfig.getoption("har_unmatched")
+    )
+
+@pytest.fixture(scope="session")
+def context_pool(browser: Browser) -> Generator[ContextPool, None, None]:
+    """Session-wide pool of browser contexts reset between tests"""
+    pool = ContextPool(browser)
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="session")
+def warm_browser(request, browser: Browser, browser_context_args: dict, har_router: HarRouter,
+                 router_stats: RouterStats) -> Browser:
+    """Browser whose first pooled context has loaded the site, so DNS, TLS and HTTP cache are warm"""
+    config = request.config
+    if not config.getoption("warm_up") or not config.getoption("context_pool") or har_router.mode != "live":
+        return browser
+    context_pool: ContextPool = request.getfixturevalue("context_pool")
+    with startup_timer.phase("warm-up"):
+        context = context_pool.acquire(dict(browser_context_args))
+        router = RequestRouter(DEFAULT_BLOCKED_RESOURCE_TYPES, DEFAULT_BLOCKED_DOMAINS, stats=router_stats)
+        router.install(context)
+        reusable = True
+        try:
+            warm_up(context, Config.BASE_URL)
+        except Exception as e:
+            # Warming up is an optimisation; the first test reports real connection problems
+            print(f"\nBrowser warm-up failed: {str(e)}")
+            reusable = False
+        router.uninstall(context)
+        context_pool.release(context, reusable=reusable)
+    return browser
+
+@pytest.fixture(scope="session")
+def trace_recorder() -> TraceRecorder:
+    """Session-wide tracing of test contexts with bounded retention"""
+    return TraceRecorder()
+
+@pytest.fixture(scope="session")
+def router_stats() -> RouterStats:
+    """Blocked request counters and learned response sizes shared by all contexts"""
+    return RouterStats()
+
+@pytest.fixture
+def page(request, warm_browser: Browser, browser_name: str, browser_context_args, har_router: HarRouter,
+         router_stats: RouterStats) -> Generator[Page, None, None]:
     """Create a new page for each test"""
-    context = browser.new_context(**browser_context_args)
+    context_args = dict(browser_context_args)
+    marker = request.node.get_closest_marker("authenticated")
+    if marker:
+        pool: UserPool = request.getfixturevalue("user_pool")
+        context_args["storage_state"] = pool.storage_state(marker.kwargs.get("role", "default"))
+    # Recording needs its own context: the HAR is only written when the context closes
+    pooled = (request.config.getoption("context_pool") and har_router.mode != "record"
+              and not request.node.get_closest_marker("fresh_context"))
+    if pooled:
+        context_pool: ContextPool = request.getfixturevalue("context_pool")
+        context = context_pool.acquire(context_args)
+    else:
+        context = warm_browser.new_context(**context_args)
+    har_router.install(context, request.node.nodeid)
+    router = RequestRouter.for_node(request.node, router_stats)
+    if request.config.getoption("full_fidelity") or request.node.get_closest_marker("full_fidelity"):
+        router.learn_sizes(context)
+    else:
+        router.install(context)
+    tracer = None
+    if request.config.getoption("context_tracing"):
+        tracer: TraceRecorder = request.getfixturevalue("trace_recorder")
+        tracer.start(context, request.node.nodeid)
     page = context.new_page()
+    request.node.console_log = ConsoleLog(page)
+    perf = None
+    if request.config.getoption("perf_metrics"):
+        perf = PerfCollector(page, request.node.nodeid, browser_name).install()
+    waited_before = wait_stats.total
     yield page
+    request.node.user_properties.append(("wait_seconds", round(wait_stats.total - waited_before, 3)))
+    request.node.user_properties.append(("blocked_requests", router.blocked_requests))
+    request.node.user_properties.append(("estimated_blocked_bytes", router.estimated_bytes))
+    if perf:
+        perf.export()
+        request.node.user_properties.append(("page_loads", len(perf.samples)))
+        request.node.user_properties.append(("server_seconds", round(perf.server_seconds, 3)))
+    report = getattr(request.node, "rep_call", None)
+    if tracer:
+        trace = tracer.stop(context, request.node.nodeid, keep=tracer.should_keep(report))
+        if trace:
+            request.node.user_properties.append(("trace", trace))
+    if pooled:
+        # A failed test may have left the context in an odd state, so do not hand it to the next one
+        try:
+            router.uninstall(context)
+        except:
+            pass
+        context_pool.release(context, reusable=report is not None and report.passed)
+        return
     try:
         page.close()
     except:
@@ -61,6 +599,80 @@ def page(browser: Browser, browser_context_args) -> Generator[Page, None, None]:
     except:
         pass
 
+@pytest.fixture(scope="session")
+def multiplexer(pytestconfig, browser_name: str, browser_type_launch_args: dict, browser_context_args: dict,
+                router_stats: RouterStats) -> Generator[BrowserMultiplexer, None, None]:
+    """One browser per worker driven through the async API for tests marked multiplex"""
+    mux = BrowserMultiplexer(browser_name, browser_type_launch_args, browser_context_args,
+                             max_contexts=pytestconfig.getoption("multiplex_contexts"), stats=router_stats)
+    mux.start()
+    yield mux
+    pytestconfig.pluginmanager.get_plugin("multiplex_report").record(mux)
+    mux.stop()
+
+# Fixtures the multiplexer replaces with objects of the shared async browser
+MUX_FIXTURES = {"mux_page": MuxPage, "async_pages": MuxSession}
+
+def make_mux_placeholder(name: str, node, mux: BrowserMultiplexer) -> MuxPage:
+    """Placeholder for a multiplexer fixture of a test, with the test's request blocking"""
+    placeholder_class = MUX_FIXTURES[name]
+    if node.config.getoption("full_fidelity") or node.get_closest_marker("full_fidelity"):
+        return placeholder_class(mux)
+    return placeholder_class(mux, RequestRouter.for_node(node, mux.stats))
+
+@pytest.fixture
+def mux_page(request, multiplexer: BrowserMultiplexer) -> MuxPage:
+    """Async page in its own context of the shared browser; only for `async def` tests marked multiplex"""
+    return make_mux_placeholder("mux_page", request.node, multiplexer)
+
+@pytest.fixture
+def async_pages(request, multiplexer: BrowserMultiplexer) -> MuxSession:
+    """pages.aio AsyncSession (home, login, cart, ...) in its own context; for `async def` tests marked multiplex"""
+    return make_mux_placeholder("async_pages", request.node, multiplexer)
+
+def uses_only_mux_fixtures(function) -> bool:
+    """Whether a test can be started without setting up any regular fixture"""
+    parameters = set(inspect.signature(function).parameters)
+    return bool(parameters) and parameters <= set(MUX_FIXTURES)
+
+# Marks pytest evaluates when a test's own turn comes; tests carrying them are never started early
+OWN_TURN_MARKERS = ("skip", "skipif", "xfail")
+
+def multiplexed_siblings(item) -> list:
+    """Later tests of the same module that can start before their turn"""
+    # Under plain load scheduling other workers may run them, so only prefetch when the module stays here
+    if hasattr(item.config, "workerinput") and item.config.getoption("dist") not in ("loadfile", "loadscope"):
+        return []
+    # With -x or --maxfail the session may stop before their turn, so they must not have run by then
+    if item.config.getoption("maxfail"):
+        return []
+    items = item.session.items
+    return [
+        sibling for sibling in items[items.index(item) + 1:]
+        if sibling.module is item.module and sibling.get_closest_marker("multiplex")
+        and inspect.iscoroutinefunction(sibling.obj)
+        and uses_only_mux_fixtures(sibling.obj)
+        and not any(sibling.get_closest_marker(name) for name in OWN_TURN_MARKERS)
+    ]
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run `async def` tests marked multiplex on the browser multiplexer, overlapping them with their siblings"""
+    if not pyfuncitem.get_closest_marker("multiplex") or not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    kwargs = {name: pyfuncitem.funcargs[name] for name in inspect.signature(pyfuncitem.obj).parameters}
+    placeholders = [value for value in kwargs.values() if isinstance(value, MuxPage)]
+    if not placeholders:
+        pytest.fail("Tests marked multiplex must use the mux_page or async_pages fixture")
+    mux = placeholders[0].multiplexer
+    mux.submit(pyfuncitem.nodeid, pyfuncitem.obj, kwargs)
+    for sibling in multiplexed_siblings(pyfuncitem):
+        mux.submit(sibling.nodeid, sibling.obj, {
+            name: make_mux_placeholder(name, sibling, mux) for name in inspect.signature(sibling.obj).parameters
+        })
+    mux.result(pyfuncitem.nodeid)
+    return True
+
 @pytest.fixture
 def home_page(page: Page) -> HomePage:
     """Create HomePage instance"""
@@ -68,24 +680,54 @@ def home_page(page: Page) -> HomePage:
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Take screenshot on test failure"""
+    """Keep each phase's report on the item for fixtures to inspect"""
     outcome = yield
     report = outcome.get_result()
-    
-    if report.when == "call" and report.failed and "page" in item.funcargs:
-        page: Page = item.funcargs["page"]
-        screenshot_dir = Config.SCREENSHOT_PATH
-        os.makedirs(screenshot_dir, exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        screenshot_path = os.path.join(
-            screenshot_dir,
-            f"failure_{item.name}_{timestamp}.png"
+    setattr(item, f"rep_{report.when}", report)
+
+def pytest_terminal_summary(terminalreporter):
+    """Report requests blocked, kept traces and, with --perf-metrics, time spent on the server"""
+    # Summed from the teardown reports, so it also covers tests run on xdist workers
+    blocked_requests = estimated_bytes = tests = 0
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            properties = dict(getattr(report, "user_properties", ()))
+            if getattr(report, "when", None) == "teardown" and "blocked_requests" in properties:
+                tests += 1
+                blocked_requests += properties["blocked_requests"]
+                estimated_bytes += properties["estimated_blocked_bytes"]
+    if blocked_requests:
+        terminalreporter.write_sep("-", "blocked requests")
+        terminalreporter.write_line(
+            f"{blocked_requests} requests blocked in {tests} tests, an estimated {estimated_bytes / 1024 / 1024:.1f} MB "
+            f"not downloaded (from sizes observed on full-fidelity loads, else typical sizes per resource type)"
         )
-        
-        try:
-            if not page.is_closed():
-                page.screenshot(path=screenshot_path)
-                print(f"\nScreenshot saved to: {screenshot_path}")
-        except Exception as e:
-            print(f"\nFailed to take screenshot: {str(e)}") 
\ No newline at end of file
+
+    server_seconds = page_loads = 0
+    test_seconds = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            properties = dict(getattr(report, "user_properties", ()))
+            if getattr(report, "when", None) == "teardown" and "server_seconds" in properties:
+                server_seconds += properties["server_seconds"]
+                page_loads += properties["page_loads"]
+            if getattr(report, "when", None) in ("setup", "call", "teardown"):
+                test_seconds[report.nodeid] = test_seconds.get(report.nodeid, 0.0) + report.duration
+    if page_loads:
+        total_seconds = sum(test_seconds.values())
+        terminalreporter.write_sep("-", "page load performance")
+        terminalreporter.write_line(
+            f"{page_loads} page loads, {server_seconds:.1f}s waiting for the server "
+            f"({server_seconds / total_seconds:.0%} of {total_seconds:.1f}s test time); "
+            f"time series in {Config.PERF_METRICS_FILE}"
+        )
+
+    traces = [
+        value for reports in terminalreporter.stats.values() for report in reports
+        if getattr(report, "when", None) == "teardown"
+        for name, value in getattr(report, "user_properties", ()) if name == "trace"
+    ]
+    if traces:
+        terminalreporter.write_sep("-", "traces of failed and slow tests")
+        for trace in traces:
+            terminalreporter.write_line(f"playwright show-trace {trace}")
@@ -0,0 +1,72 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pages.timing import ActionTimer, action_timer
+from pages.base_page import BasePage
+from utils.action_report import ActionReportPlugin
+
+
+class FakePage(BasePage):
+    """Page object whose methods never touch a browser"""
+    attempts = 0
+
+    def open_section(self, selector: str):
+        """Simulated action that needs one retry"""
+        self.attempts += 1
+        if self.attempts == 1:
+            action_timer.count_retry()
+
+    async def load_async(self, url: str):
+        """Simulated async action"""
+        await asyncio.sleep(0)
+
+
+def run_async(coroutine):
+    """Run a coroutine on a thread of its own; the sync Playwright fixtures keep an event loop running on this one"""
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+def stats_for(action: str) -> dict:
+    return next(row for row in action_timer.rows() if row["action"] == action)
+
+def test_subclass_methods_are_timed(fake_page):
+    """Page classes are instrumented on definition, recording selector, calls and retries"""
+    action_timer.reset()
+    page = FakePage(fake_page)
+    page.open_section("div#cart_info")
+    page.open_section(selector="div#cart_info")
+    run_async(page.load_async("http://localhost/"))
+
+    row = stats_for("FakePage.open_section")
+    assert (row["selector"], row["calls"], row["retries"]) == ("div#cart_info", 2, 1)
+    assert stats_for("FakePage.load_async")["selector"] == "http://localhost/"
+    assert "locator" not in {row["action"].split(".")[-1] for row in action_timer.rows()}
+
+def test_methods_are_timed_once_from_the_base_class_down():
+    """BasePage's own methods and those of its subclasses are each wrapped by one timer"""
+    for method in (BasePage.navigate, BasePage.click, FakePage.open_section):
+        assert not hasattr(method.__wrapped__, "__wrapped__")
+    assert "open_section" not in vars(BasePage) and "navigate" not in vars(FakePage)
+
+def test_merge_worker_rows():
+    """Timings from xdist workers add up on the controller"""
+    worker = ActionTimer()
+    worker.record("HomePage.click_products", None, 1.5, wait_seconds=1.0)
+    worker.record("BasePage.click", "a.check_out", 0.5, retries=1)
+    controller = ActionTimer()
+    controller.record("HomePage.click_products", None, 0.5)
+    controller.merge(worker.rows())
+    controller.merge(worker.rows())
+
+    rows = controller.rows()
+    assert rows[0]["action"] == "HomePage.click_products"
+    assert (rows[0]["calls"], rows[0]["seconds"], rows[0]["wait_seconds"]) == (3, 3.5, 2.0)
+    assert rows[1]["retries"] == 2
+
+def test_html_table_escapes_selectors():
+    """Selectors are escaped in the pytest-html section"""
+    timer = ActionTimer()
+    timer.record("CartPage.click", "a[href='/login'] >> text=<b>", 0.1)
+    table = ActionReportPlugin.html_table(timer.rows())
+    assert "text=&lt;b&gt;" in table
+    assert "text=<b>" not in table
@@ -0,0 +1,40 @@
+import gzip
+import os
+import time
+
+from utils.artifacts import ArtifactPlugin, ArtifactWriter
+
+
+def test_identical_screenshots_are_written_once(tmp_path, fake_page):
+    """Screenshots are stored by content hash; DOM snapshots are gzipped"""
+    writer = ArtifactWriter(str(tmp_path), quota_bytes=10 ** 6)
+    plugin = ArtifactPlugin(lambda: writer)
+    fake_page.image, fake_page.html = b"\xff\xd8 same error page", "<html><body>Error</body></html>"
+
+    first = plugin.capture("test_one", fake_page)
+    second = plugin.capture("test_two", fake_page)
+    writer.close()
+
+    assert first == second and len(first) == 2
+    assert first[0].endswith(".jpg") and first[1].endswith(".html.gz")
+    assert fake_page.calls[0] == ("screenshot", {"type": "jpeg", "quality": 70, "full_page": False})
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in first)
+    with gzip.open(first[1]) as f:
+        assert f.read() == b"<html><body>Error</body></html>"
+    assert writer.duplicates == 2
+
+def test_quota_evicts_oldest_first(tmp_path):
+    """Beyond the quota the oldest artifacts go first, including those of earlier runs; other files are kept"""
+    old = tmp_path / "test_old_0123456789ab.jpg"
+    foreign = tmp_path / "notes.jpg"
+    for path in (old, foreign):
+        path.write_bytes(b"x" * 400)
+        os.utime(path, (time.time() - 3600, time.time() - 3600))
+    writer = ArtifactWriter(str(tmp_path), quota_bytes=1000)
+
+    paths = [writer.submit(f"test_{i}", "screenshot.png", bytes([i]) * 300) for i in range(3)]
+    writer.close()
+
+    assert not old.exists() and foreign.exists()
+    assert [os.path.exists(path) for path in paths] == [True, True, True]
+    assert writer.evicted == 1 and writer.total_bytes == 900
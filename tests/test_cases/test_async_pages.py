@@ -0,0 +1,49 @@
+import inspect
+import pytest
+
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage
+from pages.home_page import HomePage
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from pages.signup_page import SignupPage
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.checkout_page import AsyncCheckoutPage
+from pages.aio.home_page import AsyncHomePage
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.products_page import AsyncProductsPage
+from pages.aio.signup_page import AsyncSignupPage
+
+PAGE_PAIRS = [
+    (HomePage, AsyncHomePage),
+    (LoginPage, AsyncLoginPage),
+    (SignupPage, AsyncSignupPage),
+    (ProductsPage, AsyncProductsPage),
+    (CartPage, AsyncCartPage),
+    (CheckoutPage, AsyncCheckoutPage),
+]
+
+
+def public_methods(page_class) -> dict:
+    return {
+        name: member for name, member in inspect.getmembers(page_class, inspect.isfunction)
+        if not name.startswith("_")
+    }
+
+@pytest.mark.parametrize("sync_class, async_class", PAGE_PAIRS, ids=[cls.__name__ for cls, _ in PAGE_PAIRS])
+def test_async_page_mirrors_sync_page(sync_class, async_class):
+    """Every sync page-object method has an async counterpart with the same parameters"""
+    sync_methods, async_methods = public_methods(sync_class), public_methods(async_class)
+    assert set(sync_methods) == set(async_methods)
+    for name, method in sync_methods.items():
+        if name == "locator":
+            continue
+        assert inspect.iscoroutinefunction(async_methods[name]), name
+        assert inspect.signature(async_methods[name]) == inspect.signature(method), name
+
+@pytest.mark.parametrize("sync_class, async_class", PAGE_PAIRS, ids=[cls.__name__ for cls, _ in PAGE_PAIRS])
+def test_async_page_shares_locators(sync_class, async_class):
+    """Locators come from the same mixin, so the two layers cannot drift"""
+    locators = sync_class.__mro__[1]
+    assert locators.__module__ == "pages.locators"
+    assert async_class.__mro__[1] is locators
@@ -0,0 +1,103 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from pages.base_page import BasePage
+from pages.budgets import Budget, BudgetTracker, budget_tracker
+from utils.budget_report import BUDGET_CATEGORY, BudgetPlugin
+
+
+class FakePage(BasePage):
+    BUDGETS = {
+        "open": Budget(dom_content_loaded_ms=1000),
+        "search": Budget(max_requests=2),
+    }
+
+    def open(self):
+        """Simulated navigation"""
+        self.page.emit("request", object())
+
+    def search(self, requests: int):
+        """Simulated search issuing some requests"""
+        for _ in range(requests):
+            self.page.emit("request", object())
+
+
+@pytest.fixture
+def tracker(monkeypatch):
+    """The global tracker, switched on and emptied before and after the test"""
+    monkeypatch.setattr(budget_tracker, "enabled", True)
+    budget_tracker.pop_violations()
+    budget_tracker.measurements.clear()
+    yield budget_tracker
+    budget_tracker.pop_violations()
+    budget_tracker.measurements.clear()
+
+def test_budgeted_methods_report_violations(tracker, fake_page):
+    """Requests and navigation timing of budgeted calls are checked against their limits"""
+    fake_page.evaluate_result = {"dom_content_loaded_ms": 1500, "load_ms": 0}
+    page = FakePage(fake_page)
+    page.search(2)
+    assert tracker.pop_violations() == []
+    page.search(3)
+    page.open()
+
+    violations = tracker.pop_violations()
+    assert violations[0].startswith("FakePage.search: requests 3 > 2")
+    assert violations[1].startswith("FakePage.open: dom_content_loaded_ms 1500 > 1000")
+    # load_ms is 0 until the load event finished, so it is not measured
+    assert tracker.measurements["FakePage.open"].keys() == {"duration_ms", "requests", "dom_content_loaded_ms"}
+    assert tracker.measurements["FakePage.search"]["requests"] == 3
+
+def test_baseline_tightens_limits(tmp_path):
+    """A recorded baseline lowers the limit to baseline * (1 + tolerance) + slack"""
+    path = tmp_path / "baseline.json"
+    path.write_text(json.dumps({"Page.load": {"duration_ms": 1000, "requests": 10}}))
+    tracker = BudgetTracker(str(path), tolerance=0.5, slack_ms=100)
+    budget = Budget(duration_ms=5000, max_requests=12)
+    assert tracker.limit("Page.load", "duration_ms", budget) == 1600
+    assert tracker.limit("Page.load", "requests", budget) == 12
+    assert tracker.limit("Page.other", "duration_ms", budget) == 5000
+
+    tracker.check("Page.load", budget, {"duration_ms": 1700, "requests": 11})
+    assert len(tracker.pop_violations()) == 1
+
+def test_update_baseline_records_worst_measurements(tmp_path):
+    """While updating the baseline nothing fails and the worst values of all processes are written"""
+    path = tmp_path / "baseline.json"
+    tracker = BudgetTracker(str(path))
+    tracker.updating_baseline = True
+    budget = Budget(duration_ms=10)
+    tracker.check("Page.load", budget, {"duration_ms": 40})
+    tracker.check("Page.load", budget, {"duration_ms": 20})
+    tracker.merge({"Page.load": {"duration_ms": 60}, "Page.search": {"requests": 3}})
+    tracker.save_baseline()
+
+    assert tracker.pop_violations() == []
+    assert json.loads(path.read_text()) == {"Page.load": {"duration_ms": 60}, "Page.search": {"requests": 3}}
+
+def make_report(tracker: BudgetTracker, outcome: str, violations: list):
+    """Run the plugin's makereport wrapper around a call report with the given outcome"""
+    tracker.violations.extend(violations)
+    report = SimpleNamespace(when="call", outcome=outcome, passed=outcome == "passed", longrepr=None, sections=[])
+    plugin = BudgetPlugin(tracker)
+    wrapper = plugin.pytest_runtest_makereport(item=None, call=None)
+    next(wrapper)
+    with pytest.raises(StopIteration):
+        wrapper.send(SimpleNamespace(get_result=lambda: report))
+    return plugin, report
+
+def test_budget_failures_are_a_separate_outcome(tmp_path):
+    """Passing tests over budget fail as "budget exceeded"; functional failures keep their outcome"""
+    tracker = BudgetTracker(str(tmp_path / "baseline.json"))
+    plugin, report = make_report(tracker, "passed", ["Page.load: duration_ms 900 > 500 (budget 500)"])
+    assert report.outcome == "failed"
+    assert plugin.pytest_report_teststatus(report, None)[0] == BUDGET_CATEGORY
+
+    plugin, report = make_report(tracker, "failed", ["Page.load: duration_ms 900 > 500 (budget 500)"])
+    assert plugin.pytest_report_teststatus(report, None) is None
+    assert report.sections == [("performance budgets", "Page.load: duration_ms 900 > 500 (budget 500)")]
+
+    plugin, report = make_report(tracker, "passed", [])
+    assert report.outcome == "passed" and not hasattr(report, "budget_violations")
@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from mock_site.app import CATALOG_PATH, create_server
+from utils.catalog import CatalogIndex, CatalogScraper, Product, load_catalog
+
+
+@pytest.fixture
+def server():
+    server = create_server()
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_catalog_is_scraped_into_an_index_matching_the_site(server, tmp_path):
+    """Grid and detail pages become one entry per product, saved compactly and looked up by attribute"""
+    path = str(tmp_path / "catalog.json")
+    index = load_catalog(path, base_url=server.url)
+    with open(CATALOG_PATH) as f:
+        expected = json.load(f)["products"]
+
+    assert len(index) == len(expected)
+    blue_top = index.by_name("blue top")
+    assert blue_top == Product(1, "Blue Top", 500, "Women > Tops", "Polo")
+    assert index.pick(category="Women > Tops", brand="Polo") == blue_top
+    assert all(product.brand == "Madame" for product in index.where(brand="Madame"))
+    assert CatalogIndex.load(path).products == index.products
+
+def test_refresh_only_fetches_new_and_changed_products(server):
+    """Unchanged grid entries are reused; changed ones refetched and removed ones dropped"""
+    scraper = CatalogScraper(server.url, workers=4)
+    index, stats = scraper.refresh()
+    assert (stats.added, stats.reused) == (len(index), 0)
+
+    server.app.products[1]["price"] = "Rs. 550"
+    del server.app.products[2]
+    refreshed, stats = scraper.refresh(index)
+
+    assert (stats.added, stats.changed, stats.removed, stats.reused) == (0, 1, 1, len(index) - 2)
+    assert refreshed.get(1).price == 550 and refreshed.get(2) is None
+    assert refreshed.search("madame") == refreshed.where(brand="Madame")
@@ -6,13 +6,7 @@ from pages.checkout_page import CheckoutPage
 from pages.login_page import LoginPage
 from pages.signup_page import SignupPage
 from config.config import Config
-import random
-import string
-
-def generate_random_email():
-    """Generate random email for testing"""
-    random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-    return f"test_{random_str}@example.com"
+from utils.testdata import testdata
 
 @pytest.fixture
 def checkout_pages(page):
@@ -26,41 +20,30 @@ def checkout_pages(page):
         "signup": SignupPage(page)
     }
 
-def add_product_to_cart(pages):
-    """Helper function to add a product to cart"""
-    pages["home"].click_products()
-    pages["products"].add_to_cart(0)
-    pages["products"].click_view_cart()
-
 def register_new_user(pages, email=None):
     """Helper function to register a new user"""
-    if not email:
-        email = generate_random_email()
+    user_data = testdata.user(email=email) if email else testdata.user()
     
     pages["home"].click_signup_login()
-    pages["login"].enter_signup_details("Test User", email)
+    pages["login"].enter_signup_details(user_data.name, user_data.email)
     pages["login"].click_signup()
     
-    user_data = {
-        **Config.TEST_USER,
-        "email": email,
-        "dob_day": "1",
-        "dob_month": "1",
-        "dob_year": "1990"
-    }
     pages["signup"].fill_account_details(user_data)
     pages["signup"].click_create_account()
     pages["signup"].click_continue()
     
     return user_data
 
-def test_place_order_register_while_checkout(checkout_pages):
+def pay_for_order(pages):
+    """Helper function to place the order on the checkout page and pay for it"""
+    pages["checkout"].add_comment("Test order")
+    pages["checkout"].click_place_order()
+    pages["checkout"].fill_payment_details(testdata.card())
+    pages["checkout"].click_pay_button()
+
+def test_place_order_register_while_checkout(checkout_pages, guest_cart):
     """Test Case 14: Place Order: Register while Checkout"""
-    # Load home page and add product to cart
-    checkout_pages["home"].load()
-    add_product_to_cart(checkout_pages)
-    
-    # Proceed to checkout and register
+    # Start as a guest on the cart page with a product in the cart
     checkout_pages["cart"].click_proceed_to_checkout()
     checkout_pages["cart"].click_register_login()
     
@@ -68,57 +51,33 @@ def test_place_order_register_while_checkout(checkout_pages):
     user_data = register_new_user(checkout_pages)
     
     # Proceed with checkout
+    checkout_pages["home"].navigate(guest_cart.url)
     checkout_pages["cart"].click_proceed_to_checkout()
     assert checkout_pages["checkout"].verify_order_review()
     
-    # Add comment and place order
-    checkout_pages["checkout"].add_comment("Test order")
-    checkout_pages["checkout"].click_place_order()
-    
-    # Fill payment details
-    payment_info = {
-        "name_on_card": "Test User",
-        "card_number": "4111111111111111",
-        "cvc": "123",
-        "expiry_month": "12",
-        "expiry_year": "2025"
-    }
-    checkout_pages["checkout"].fill_payment_details(payment_info)
-    checkout_pages["checkout"].click_pay_button()
+    # Place order and pay
+    pay_for_order(checkout_pages)
     
     # Verify success
     assert checkout_pages["checkout"].verify_success_message()
 
-def test_place_order_register_before_checkout(checkout_pages):
+def test_place_order_register_before_checkout(checkout_pages, checkout_stager, cart_products):
     """Test Case 15: Place Order: Register before Checkout"""
     # Load home page and register
     checkout_pages["home"].load()
     user_data = register_new_user(checkout_pages)
     
-    # Add product to cart
-    add_product_to_cart(checkout_pages)
-    
-    # Proceed with checkout
+    # Fill the cart over HTTP and proceed with checkout
+    checkout_pages["home"].navigate(checkout_stager.stage("cart", cart_products))
     checkout_pages["cart"].click_proceed_to_checkout()
     assert checkout_pages["checkout"].verify_order_review()
     
     # Complete order
-    checkout_pages["checkout"].add_comment("Test order")
-    checkout_pages["checkout"].click_place_order()
-    
-    payment_info = {
-        "name_on_card": "Test User",
-        "card_number": "4111111111111111",
-        "cvc": "123",
-        "expiry_month": "12",
-        "expiry_year": "2025"
-    }
-    checkout_pages["checkout"].fill_payment_details(payment_info)
-    checkout_pages["checkout"].click_pay_button()
+    pay_for_order(checkout_pages)
     
     assert checkout_pages["checkout"].verify_success_message()
 
-def test_place_order_login_before_checkout(checkout_pages):
+def test_place_order_login_before_checkout(checkout_pages, checkout_stager, cart_products):
     """Test Case 16: Place Order: Login before Checkout"""
     # Load home page and login
     checkout_pages["home"].load()
@@ -129,64 +88,37 @@ def test_place_order_login_before_checkout(checkout_pages):
     )
     checkout_pages["login"].click_login()
     
-    # Add product and checkout
-    add_product_to_cart(checkout_pages)
+    # Fill the cart over HTTP and proceed with checkout
+    checkout_pages["home"].navigate(checkout_stager.stage("cart", cart_products))
     checkout_pages["cart"].click_proceed_to_checkout()
     assert checkout_pages["checkout"].verify_order_review()
     
     # Complete order
-    checkout_pages["checkout"].add_comment("Test order")
-    checkout_pages["checkout"].click_place_order()
-    
-    payment_info = {
-        "name_on_card": "Test User",
-        "card_number": "4111111111111111",
-        "cvc": "123",
-        "expiry_month": "12",
-        "expiry_year": "2025"
-    }
-    checkout_pages["checkout"].fill_payment_details(payment_info)
-    checkout_pages["checkout"].click_pay_button()
+    pay_for_order(checkout_pages)
     
     assert checkout_pages["checkout"].verify_success_message()
 
-def test_verify_address_details(checkout_pages):
+@pytest.mark.authenticated
+def test_verify_address_details(checkout_pages, on_checkout):
     """Test Case 23: Verify address details in checkout page"""
-    # Register new user
-    checkout_pages["home"].load()
-    user_data = register_new_user(checkout_pages)
-    
-    # Add product and proceed to checkout
-    add_product_to_cart(checkout_pages)
-    checkout_pages["cart"].click_proceed_to_checkout()
-    
-    # Verify address details
+    # Start logged in as a pooled user on the checkout page
     address_details = checkout_pages["checkout"].verify_address_details()
-    assert user_data["address"] in address_details["delivery"]
-    assert user_data["address"] in address_details["billing"]
+    assert on_checkout.user["address"] in address_details["delivery"]
+    assert on_checkout.user["address"] in address_details["billing"]
 
-def test_download_invoice(checkout_pages):
-    """Test Case 24: Download Invoice after purchase order"""
-    # Register and place order
-    checkout_pages["home"].load()
-    user_data = register_new_user(checkout_pages)
-    
-    add_product_to_cart(checkout_pages)
-    checkout_pages["cart"].click_proceed_to_checkout()
-    
-    checkout_pages["checkout"].add_comment("Test order")
-    checkout_pages["checkout"].click_place_order()
+@pytest.mark.cart(items=2)
+def test_pay_for_order(checkout_pages, on_payment):
+    """Pay for an order from the payment page"""
+    assert checkout_pages["checkout"].verify_payment_form()
     
-    payment_info = {
-        "name_on_card": "Test User",
-        "card_number": "4111111111111111",
-        "cvc": "123",
-        "expiry_month": "12",
-        "expiry_year": "2025"
-    }
-    checkout_pages["checkout"].fill_payment_details(payment_info)
+    checkout_pages["checkout"].fill_payment_details(testdata.card())
     checkout_pages["checkout"].click_pay_button()
     
-    # Download and verify invoice
+    assert checkout_pages["checkout"].verify_success_message()
+
+@pytest.mark.authenticated
+def test_download_invoice(checkout_pages, order_placed):
+    """Test Case 24: Download Invoice after purchase order"""
+    # Start logged in as a pooled user on the order confirmation
     download = checkout_pages["cart"].download_invoice()
-    assert download is not None 
\ No newline at end of file
+    assert download is not None
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils.catalog import CatalogScraper
+from utils.checkout_stages import CheckoutStager, StagedOrder, StagingError
+from utils.testdata import testdata
+from utils.user_factory import UserFactory
+
+
+@pytest.fixture
+def stager(playwright, mock_site):
+    """Stager on a request context of its own, standing in for a browser context's"""
+    request = playwright.request.new_context(base_url=mock_site)
+    yield CheckoutStager(SimpleNamespace(request=request), base_url=mock_site)
+    request.dispose()
+
+@pytest.fixture
+def user_data(playwright, mock_site):
+    with UserFactory(playwright, base_url=mock_site) as factory:
+        yield factory.create()
+
+def test_stage_payment_with_items(stager, user_data, mock_site):
+    """A logged-in session reaches the payment page with the products in its cart, without any UI step"""
+    products = list(CatalogScraper(mock_site).refresh()[0])[:2]
+    stager.login(user_data)
+    stager.add_to_cart(products[:1])
+    stager.clear_cart()
+    assert stager.cart() == []
+
+    url = stager.stage("payment", products)
+    assert url == f"{mock_site}/payment"
+    assert stager.cart() == [product.id for product in products]
+    assert "Pay and Confirm Order" in stager.request.get(url).text()
+
+def test_stage_placed_order(stager, user_data, mock_site):
+    """Staging a placed order pays for the cart and returns the order confirmation"""
+    products = list(CatalogScraper(mock_site).refresh()[0])[:3]
+    stager.login(user_data)
+    order = StagedOrder(user_data, products, stager.stage("order_placed", products, testdata.card()))
+
+    assert order.url.endswith(f"/payment_done/{order.total}")
+    assert stager.cart() == []
+
+def test_staging_errors(stager, user_data):
+    """Wrong credentials, unknown stages and a payment without a card are reported before any test step"""
+    with pytest.raises(StagingError):
+        stager.login({"email": user_data["email"], "password": "wrong"})
+    with pytest.raises(ValueError):
+        stager.stage("shipping")
+    with pytest.raises(ValueError):
+        stager.stage("order_placed")
+    # The payment page redirects a session that is not logged in to the login page
+    with pytest.raises(StagingError):
+        stager.pay(testdata.card())
@@ -0,0 +1,139 @@
+import json
+import os
+
+from utils.context_pool import RESET_PATH, ContextPool
+
+
+class FakeResetPage:
+    """Page the pool opens to clear an origin's storage"""
+
+    def __init__(self, context: "FakeContext"):
+        self.context = context
+
+    def route(self, pattern: str, handler):
+        pass
+
+    def goto(self, url: str):
+        self.context.visited.append(url)
+
+    def evaluate(self, script: str, items: list):
+        self.context.restored_storage.append(items)
+
+    def close(self):
+        pass
+
+
+class FakeContext:
+    """Browser context recording what the pool does to it"""
+
+    def __init__(self, **context_args):
+        self.context_args = context_args
+        self.pages = []
+        self.cookies = []
+        self.visited = []
+        self.restored_storage = []
+        self.closed = False
+
+    def on(self, event: str, listener):
+        pass
+
+    def unroute_all(self, behavior: str = None):
+        pass
+
+    def clear_cookies(self):
+        self.cookies = []
+
+    def clear_permissions(self):
+        pass
+
+    def add_cookies(self, cookies: list):
+        self.cookies.extend(cookies)
+
+    def new_page(self) -> FakeResetPage:
+        return FakeResetPage(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **context_args) -> FakeContext:
+        context = FakeContext(**context_args)
+        self.contexts.append(context)
+        return context
+
+
+def write_state(path, email: str, mtime: int) -> str:
+    path.write_text(json.dumps({
+        "cookies": [{"name": "sessionid", "value": email, "domain": "shop.test", "path": "/"}],
+        "origins": [{"origin": "http://shop.test", "localStorage": [{"name": "user", "value": email}]}]
+    }))
+    os.utime(path, ns=(mtime, mtime))
+    return str(path)
+
+
+def test_released_contexts_are_reset_and_reused_per_arguments():
+    """A released context is handed out again for the same arguments only, with the state it was created in"""
+    pool = ContextPool(FakeBrowser())
+    context = pool.acquire({"viewport": {"width": 1280, "height": 720}})
+    context.cookies.append({"name": "cart", "value": "1"})
+    pool.release(context)
+
+    assert context.cookies == [] and not context.closed
+    assert pool.acquire({"viewport": {"height": 720, "width": 1280}}) is context
+    assert pool.acquire({"viewport": {"width": 800, "height": 600}}) is not context
+    assert (pool.created, pool.reused) == (2, 1)
+
+
+def test_worn_out_crashed_and_failed_contexts_are_closed():
+    """Contexts are closed instead of pooled once used max_uses times, after a crash or when not reusable"""
+    pool = ContextPool(FakeBrowser(), max_uses=2)
+    context = pool.acquire({})
+    pool.release(context)
+    assert pool.acquire({}) is context
+    pool.release(context)
+    assert context.closed
+
+    crashed = pool.acquire({})
+    pool.in_use[id(crashed)].crashed = True
+    pool.release(crashed)
+    failed = pool.acquire({})
+    pool.release(failed, reusable=False)
+    assert crashed.closed and failed.closed
+    assert pool.idle == {}
+
+
+def test_reset_restores_the_storage_state_baseline(tmp_path):
+    """Cookies and local storage of the storage state are put back after every test"""
+    state = write_state(tmp_path / "user.state.json", "first@example.com", 1_000_000_000)
+    pool = ContextPool(FakeBrowser())
+    context = pool.acquire({"storage_state": state})
+    context.clear_cookies()
+    pool.release(context)
+
+    assert [cookie["value"] for cookie in context.cookies] == ["first@example.com"]
+    assert context.visited == [f"http://shop.test{RESET_PATH}"]
+    assert context.restored_storage == [[{"name": "user", "value": "first@example.com"}]]
+
+
+def test_reprovisioned_storage_state_gets_new_contexts(tmp_path):
+    """Contexts of a user replaced at the same storage state path are evicted, not reused"""
+    path = tmp_path / "user.state.json"
+    state = write_state(path, "first@example.com", 1_000_000_000)
+    pool = ContextPool(FakeBrowser())
+    first = pool.acquire({"storage_state": state})
+    pool.release(first)
+    in_use = pool.acquire({"storage_state": state, "locale": "en-GB"})
+
+    write_state(path, "second@example.com", 2_000_000_000)
+    second = pool.acquire({"storage_state": state})
+    assert second is not first and first.closed
+    pool.release(second)
+    assert [cookie["value"] for cookie in second.cookies] == ["second@example.com"]
+    # A context still in use when the user was replaced is closed on release
+    pool.release(in_use)
+    assert in_use.closed
+    assert pool.acquire({"storage_state": state}) is second
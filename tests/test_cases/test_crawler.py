@@ -0,0 +1,105 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.crawler import ProductCrawler, RateLimiter, percentile
+
+
+def run_async(coroutine):
+    """Run a coroutine on a thread of its own; the sync Playwright fixtures keep an event loop running on this one"""
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+class FakePage:
+    async def close(self):
+        pass
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = 0
+
+    async def new_page(self):
+        self.pages += 1
+        return FakePage()
+
+
+class FakeProductsPage:
+    """Stands in for AsyncProductsPage, recording the products visited; product 3 fails to load"""
+    visited = []
+    active = peak = 0
+
+    def __init__(self, page):
+        self.page = page
+        self.url = None
+
+    async def navigate(self, url: str):
+        FakeProductsPage.active += 1
+        FakeProductsPage.peak = max(FakeProductsPage.peak, FakeProductsPage.active)
+        await asyncio.sleep(0.01)
+        FakeProductsPage.active -= 1
+        if url.endswith("/3"):
+            raise TimeoutError("Timeout 30000ms exceeded.\n=== logs ===")
+        self.url = url
+
+    async def get_product_details(self) -> dict:
+        product_id = int(self.url.rsplit("/", 1)[1])
+        FakeProductsPage.visited.append(product_id)
+        return {"name": f"Product {product_id}"}
+
+
+def make_crawler(tmp_path, **kwargs) -> ProductCrawler:
+    FakeProductsPage.visited, FakeProductsPage.peak = [], 0
+    return ProductCrawler(FakeContext(), str(tmp_path / "crawl.jsonl"), base_url="http://shop.test",
+                          page_object=FakeProductsPage, **kwargs)
+
+
+def test_crawl_streams_results_and_bounds_concurrency(tmp_path):
+    """Every product gets a line, at most `concurrency` pages are busy and failures are recorded, not raised"""
+    crawler = make_crawler(tmp_path, concurrency=2, rate=0,
+                           check=lambda product_id, details: ["odd"] if product_id % 2 else [])
+    stats = run_async(crawler.crawl(range(1, 7)))
+
+    results = [json.loads(line) for line in open(crawler.output_path)]
+    assert sorted(result["id"] for result in results) == [1, 2, 3, 4, 5, 6]
+    assert crawler.context.pages == 2 and FakeProductsPage.peak == 2
+    assert stats.products == 6 and stats.failed == [3]
+    assert next(result for result in results if result["id"] == 3)["error"] == "Timeout 30000ms exceeded."
+    assert sorted(stats.problems) == [1, 5]
+    assert stats.per_second > 0 and "6 products" in stats.summary()
+
+
+def test_resume_skips_completed_products(tmp_path):
+    """Products with a successful result are not visited again; failed ones and a cut-off line are retried"""
+    crawler = make_crawler(tmp_path, rate=0)
+    with open(crawler.output_path, "w") as f:
+        f.write(json.dumps({"id": 1, "error": None}) + "\n")
+        f.write(json.dumps({"id": 2, "error": "Timeout"}) + "\n")
+        f.write('{"id": 4, "err')
+    stats = run_async(crawler.crawl([1, 2, 4, 5], resume=True))
+
+    assert sorted(FakeProductsPage.visited) == [2, 4, 5]
+    assert stats.resumed == 1
+    assert crawler.completed() == {1, 2, 4, 5}
+    # Without resume the file is started afresh
+    run_async(make_crawler(tmp_path, rate=0).crawl([5]))
+    assert [json.loads(line)["id"] for line in open(crawler.output_path)] == [5]
+
+
+def test_rate_limiter_and_percentiles():
+    """Requests beyond the burst are spaced at the rate; percentiles use the nearest rank"""
+    async def acquire_all(limiter: RateLimiter, count: int) -> float:
+        start = time.monotonic()
+        for _ in range(count):
+            await limiter.acquire()
+        return time.monotonic() - start
+
+    assert run_async(acquire_all(RateLimiter(rate=50, burst=2), 2)) < 0.015
+    assert 0.09 <= run_async(acquire_all(RateLimiter(rate=50, burst=2), 7)) < 0.3
+
+    latencies = [0.1 * n for n in range(1, 21)]
+    assert percentile(latencies, 50) == latencies[9]
+    assert percentile(latencies, 95) == latencies[18]
+    assert percentile([], 95) == 0.0
@@ -0,0 +1,86 @@
+from config.config import Config
+from pages import forms
+from pages.forms import FILL_FORM_SCRIPT, Field, FormStats, fill_form
+
+
+class FakeLocator:
+    def __init__(self, calls: list, selector: str):
+        self.calls = calls
+        self.selector = selector
+
+    def select_option(self, value, timeout=None):
+        self.calls.append(("select", self.selector, value))
+
+    def set_checked(self, checked, timeout=None):
+        self.calls.append(("check", self.selector, checked))
+
+
+class FakePageObject:
+    """Page object whose batch script returns canned per-field results"""
+
+    def __init__(self, results=None, error: Exception = None):
+        self.calls = []
+        self.results = results
+        self.error = error
+        self.page = self
+
+    def evaluate(self, script, fields):
+        assert script == FILL_FORM_SCRIPT
+        self.calls.append(("evaluate", [field["selector"] for field in fields]))
+        if self.error:
+            raise self.error
+        return self.results
+
+    def fill(self, selector, text):
+        self.calls.append(("fill", selector, text))
+
+    def locator(self, selector):
+        return FakeLocator(self.calls, selector)
+
+
+def test_fields_the_batch_could_not_set_are_filled_one_by_one(monkeypatch):
+    """One evaluate sets the form; rejected, missing and per-field controls follow in form order"""
+    monkeypatch.setattr(Config, "BATCH_FORMS", True)
+    monkeypatch.setattr(forms, "form_stats", FormStats())
+    fields = [
+        Field("#name", "Alex"),
+        Field("#country", "Canada", kind="select"),
+        Field("#zip", 12345, per_field=True),
+        Field("#newsletter", 1, kind="check"),
+    ]
+    page_object = FakePageObject(results=[None, "no option", "missing"])
+    fill_form(page_object, "signup", fields)
+
+    assert page_object.calls == [
+        ("evaluate", ["#name", "#country", "#newsletter"]),
+        ("select", "#country", "Canada"),
+        ("fill", "#zip", "12345"),
+        ("check", "#newsletter", True),
+    ]
+    row = forms.form_stats.rows()[0]
+    assert row["form"] == "signup" and (row["fills"], row["batched"], row["fallbacks"]) == (1, 1, 3)
+
+def test_failed_or_disabled_batching_fills_every_field(monkeypatch):
+    """A failing script, or batching turned off, falls back to the per-field path for the whole form"""
+    fields = [Field("#card", "4111"), Field("#cvc", "123")]
+    monkeypatch.setattr(forms, "form_stats", FormStats())
+    monkeypatch.setattr(Config, "BATCH_FORMS", True)
+    failing = FakePageObject(error=RuntimeError("Execution context was destroyed"))
+    fill_form(failing, "payment", fields)
+    assert [call[0] for call in failing.calls] == ["evaluate", "fill", "fill"]
+
+    monkeypatch.setattr(Config, "BATCH_FORMS", False)
+    unbatched = FakePageObject()
+    fill_form(unbatched, "payment", fields)
+    assert [call[0] for call in unbatched.calls] == ["fill", "fill"]
+
+def test_saved_time_uses_measured_per_field_cost():
+    """Savings are batched fields at the measured one-by-one cost minus the time the batch took"""
+    stats = FormStats()
+    stats.record("signup", batched=16, fallbacks=1, batch_seconds=0.05, field_seconds=0.2)
+    stats.merge([{"form": "contact", "fills": 2, "batched": 8, "fallbacks": 0, "batch_seconds": 0.04,
+                  "field_seconds": 0.0}])
+    assert stats.field_cost() == 0.2 and stats.fields_timed == 1
+    rows = {row["form"]: row for row in stats.rows()}
+    assert rows["signup"]["estimated_saved_seconds"] == 3.15
+    assert rows["contact"]["estimated_saved_ms_per_fill"] == 780.0
@@ -0,0 +1,106 @@
+import os
+
+import pytest
+
+from utils.har_router import (PAGE_TYPE_PATTERNS, SHARED_HAR, HarNotFoundError, HarRouter, page_type, read_har,
+                              write_har)
+
+NODEID = "tests/test_cases/test_products.py::test_search_product[chromium]"
+
+
+class FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    def route_from_har(self, path: str, url=None, **options):
+        self.routes.append((os.path.basename(path), url, options))
+
+
+def har_entry(url: str, body: str) -> dict:
+    return {
+        "pageref": "page@1",
+        "request": {"method": "GET", "url": url},
+        "response": {"status": 200, "content": {"mimeType": "text/html", "_file": f"{body}.html"}},
+    }
+
+
+def record(router: HarRouter, test_id: str, *entries: dict):
+    """Write the archive Playwright would record for a test"""
+    path = router.recording_path(test_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    files = {entry["response"]["content"]["_file"]: entry["response"]["content"]["_file"].encode()
+             for entry in entries}
+    write_har(path, {"log": {"version": "1.2", "pages": [{"id": "page@1"}], "entries": list(entries)}}, files)
+
+
+def test_invalid_options_are_rejected(tmp_path):
+    for options in ({"mode": "offline"}, {"scope": "suite"}, {"unmatched": "ignore"}):
+        with pytest.raises(ValueError):
+            HarRouter(har_dir=str(tmp_path), **options)
+
+def test_archive_path_derives_from_the_nodeid(tmp_path):
+    """A nodeid becomes one file name inside the HAR directory, whatever its path separators and brackets"""
+    router = HarRouter(har_dir=str(tmp_path))
+    path = router.har_path(NODEID)
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.path.basename(path) == "tests_test_cases_test_products.py_test_search_product_chromium_.har.zip"
+    assert router.har_path(NODEID.replace("chromium", "firefox")) != path
+
+def test_scope_picks_the_archives_of_a_test(tmp_path):
+    """Test scope uses the test's own archive; page scope the shared one first, then one per page type"""
+    assert HarRouter(har_dir=str(tmp_path)).archives(NODEID) == [(NODEID, None)]
+    archives = HarRouter(har_dir=str(tmp_path), scope="page").archives(NODEID)
+    assert archives[0] == (SHARED_HAR, None) and archives[1:] == PAGE_TYPE_PATTERNS
+    assert page_type("https://shop.test/") == "home"
+    assert page_type("https://shop.test/product_details/3") == "product_details"
+    assert page_type("https://shop.test/add_to_cart/3") == "cart"
+    assert page_type("https://shop.test/css/main.css") == SHARED_HAR
+
+def test_record_and_replay_routes(tmp_path):
+    """A test records to an archive of its own in either scope; replay routes the recorded ones, least specific first"""
+    context = FakeContext()
+    HarRouter("live", har_dir=str(tmp_path)).install(context, NODEID)
+    assert context.routes == []
+
+    recorder = HarRouter("record", har_dir=str(tmp_path / "record"), scope="page")
+    recorder.install(context, NODEID)
+    assert os.path.isdir(tmp_path / "record" / "recording")
+    assert context.routes == [(os.path.basename(recorder.har_path(NODEID)), None,
+                               {"update": True, "update_content": "attach", "update_mode": "minimal"})]
+    assert recorder.recording_path(NODEID) != HarRouter("record", har_dir=str(tmp_path / "record")).recording_path(NODEID)
+
+    replay = HarRouter("replay", har_dir=str(tmp_path), unmatched="fallback")
+    context = FakeContext()
+    replay.install(context, NODEID)
+    assert context.routes == []
+    open(replay.har_path(NODEID), "w").close()
+    replay.install(context, NODEID)
+    assert context.routes == [(os.path.basename(replay.har_path(NODEID)), None, {"not_found": "fallback"})]
+
+def test_strict_replay_requires_a_recording(tmp_path):
+    with pytest.raises(HarNotFoundError):
+        HarRouter("replay", har_dir=str(tmp_path)).install(FakeContext(), NODEID)
+
+def test_page_scoped_recordings_merge_into_page_type_archives(tmp_path):
+    """Entries go to the archive of their page type; a request recorded again replaces the archived entry"""
+    router = HarRouter("record", har_dir=str(tmp_path), scope="page")
+    record(router, "test_a", har_entry("https://shop.test/products", "products"),
+           har_entry("https://shop.test/css/main.css", "css"))
+    record(router, "test_b", har_entry("https://shop.test/view_cart", "cart"))
+    assert router.merge_recordings() == 2
+    assert not os.path.exists(tmp_path / "recording")
+
+    har, files = read_har(router.har_path("products"))
+    assert [entry["request"]["url"] for entry in har["log"]["entries"]] == ["https://shop.test/products"]
+    assert "pageref" not in har["log"]["entries"][0] and files == {"products.html": b"products.html"}
+    assert [entry["request"]["url"] for entry in read_har(router.har_path(SHARED_HAR))[0]["log"]["entries"]] == \
+        ["https://shop.test/css/main.css"]
+
+    record(router, "test_a", har_entry("https://shop.test/products", "products-v2"),
+           har_entry("https://shop.test/brand_products/Polo", "polo"))
+    assert router.merge_recordings() == 1
+    har, files = read_har(router.har_path("products"))
+    assert [entry["response"]["content"]["_file"] for entry in har["log"]["entries"]] == \
+        ["products-v2.html", "polo.html"]
+    assert set(files) == {"products-v2.html", "polo.html"}
+    assert router.merge_recordings() == 0
@@ -0,0 +1,78 @@
+import pytest
+
+from mock_site.snapshots import capture_snapshots
+from pages import locators  # noqa: F401 - registers the locator classes
+from pages.html_query import UnsupportedSelector, parse_html, select
+from pages.registry import LocatorError, LocatorRegistry, check_syntax, locator_registry, snapshot_page
+
+
+def test_locators_resolve_on_mock_site_snapshots(browser):
+    """Every registered selector matches its page, once unless it is a list, as Playwright resolves it"""
+    snapshots = capture_snapshots()
+    assert set(snapshots) == set(locator_registry.pages)
+    page = snapshot_page(browser)
+    try:
+        assert locator_registry.validate(page, snapshots) == []
+    finally:
+        page.context.close()
+
+def test_duplicate_and_malformed_selectors_fail_at_definition():
+    """A second name for a selector must be a declared alias; selectors must parse"""
+    registry = LocatorRegistry()
+    with pytest.raises(LocatorError, match="duplicates HEADER"):
+        @registry.register
+        class DuplicateLocators:
+            HEADER = "h2.title"
+            RESULTS_HEADER = "h2.title"
+
+    @registry.register
+    class AliasedLocators:
+        HEADER = "h2.title"
+        RESULTS_HEADER = HEADER
+        ALIASES = {"RESULTS_HEADER": "HEADER"}
+
+    with pytest.raises(LocatorError, match="BUTTON"):
+        @registry.register
+        class MalformedLocators:
+            BUTTON = "button[data-qa='pay'"
+    assert list(registry.pages) == ["Aliased"]
+
+def test_locators_are_built_once_per_page():
+    """Repeated lookups on a page reuse its Locator; another page gets its own"""
+    class FakePage:
+        def locator(self, selector):
+            return FakeLocator(selector)
+
+    class FakeLocator:
+        def __init__(self, selector, index=None):
+            self.selector, self.index = selector, index
+
+        def nth(self, index):
+            return FakeLocator(self.selector, index)
+
+    registry = LocatorRegistry()
+    page, other = FakePage(), FakePage()
+    first = registry.locator(page, "a.view-product", 2)
+    assert registry.locator(page, "a.view-product", 2) is first and first.index == 2
+    assert registry.locator(page, "a.view-product") is not first
+    assert registry.locator(other, "a.view-product", 2) is not first
+    assert (registry.built, registry.reused) == (3, 1)
+
+def test_selector_syntax_is_checked_offline():
+    """Chains, quotes and brackets are checked without a browser; matching is left to Playwright"""
+    check_syntax("header a:has-text('a >> b') >> nth=0")
+    check_syntax("xpath=//h2[@class='title']")
+    for selector in ("h2.title >>", "a[href='/x']]", "a:has-text('x)"):
+        with pytest.raises(ValueError):
+            check_syntax(selector)
+
+def test_html_query_selects_plain_css_like_query_selector_all():
+    """Fetched HTML is queried with the plain CSS the column schemas use; Playwright selectors are refused"""
+    root = parse_html("<header><a href='/x'>Logged in as <b>Sam</b></a><a href='/y'>Cart</a></header>"
+                      "<h2 class='title'>A</h2><h2 class='title text-center'>B</h2>")
+    assert [node.text_content() for node in select(root, "h2.title")] == ["A", "B"]
+    assert len(select(root, "header > a[href='/y'], h2.text-center")) == 2
+    assert len(select(root, "a + a")) == 1 and len(select(root, "* b")) == 1
+    for selector in ("header a:has-text('Cart')", "h2.title >> nth=0"):
+        with pytest.raises(UnsupportedSelector):
+            select(root, selector)
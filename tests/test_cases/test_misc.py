@@ -2,6 +2,7 @@ import pytest
 from pages.home_page import HomePage
 from pages.cart_page import CartPage
 from config.config import Config
+from utils.testdata import testdata
 
 @pytest.fixture
 def misc_pages(page):
@@ -19,12 +20,7 @@ def test_contact_us_form(misc_pages):
     misc_pages["home"].click_contact_us()
     
     # Fill contact form
-    contact_info = {
-        "name": "Test User",
-        "email": "test@example.com",
-        "subject": "Test Subject",
-        "message": "This is a test message"
-    }
+    contact_info = testdata.contact_message()
     misc_pages["home"].fill_contact_form(contact_info)
     
     # Upload file
@@ -0,0 +1,76 @@
+import pytest
+
+from config.config import Config
+
+
+@pytest.fixture
+def client(playwright, mock_site):
+    """HTTP client with its own cookie jar"""
+    context = playwright.request.new_context(base_url=mock_site)
+    yield context
+    context.dispose()
+
+def test_pages_render_page_object_locators(client):
+    """Pages contain the elements the page objects rely on"""
+    home = client.get("/").text()
+    assert "href=\"/products\"" in home and "id=\"susbscribe_email\"" in home
+    assert "class=\"features_items\"" in home
+
+    products = client.get("/products").text()
+    assert "ALL PRODUCTS" in products and "id=\"search_product\"" in products
+
+    login = client.get("/login").text()
+    assert "data-qa=\"login-email\"" in login and "New User Signup!" in login
+
+def test_search_filters_products(client):
+    """Searching shows only matching products"""
+    body = client.get("/products", params={"search": "Blue Top"}).text()
+    assert "SEARCHED PRODUCTS" in body
+    assert "Blue Top" in body
+    assert "Men Tshirt" not in body
+
+def test_cart_is_kept_per_session(client, playwright, mock_site):
+    """Products added to the cart show up for the same session only"""
+    assert client.get("/add_to_cart/1", params={"quantity": "4"}).ok
+    cart = client.get("/view_cart").text()
+    assert "id=\"product-1\"" in cart and "Rs. 2000" in cart
+
+    other = playwright.request.new_context(base_url=mock_site)
+    try:
+        assert "Cart is empty!" in other.get("/view_cart").text()
+    finally:
+        other.dispose()
+
+def test_checkout_requires_login(client):
+    """Anonymous users are sent to the login page"""
+    response = client.get("/checkout")
+    assert response.url.endswith("/login")
+
+def test_fixed_test_user_exists(client):
+    """Config.TEST_USER can log in and its email cannot sign up again"""
+    user = Config.TEST_USER
+    client.post("/login", form={"email": user["email"], "password": user["password"]})
+    checkout = client.get("/checkout").text()
+    assert user["address"] in checkout and f"Logged in as <b>{user['name']}</b>" in checkout
+
+    signup = client.post("/signup", form={"name": user["name"], "email": user["email"], "form_type": "signup"})
+    assert "Email Address already exist!" in signup.text()
+
+def test_signup_and_order_flow(client):
+    """A user can register through the forms and place an order"""
+    client.post("/signup", form={"name": "Test User", "email": "flow@example.com", "form_type": "signup"})
+    created = client.post("/signup", form={
+        "form_type": "create_account", "name": "Test User", "email": "flow@example.com",
+        "password": "testpass123", "title": "Mr", "first_name": "Test", "last_name": "User",
+        "address1": "123 Test St", "country": "United States", "state": "Test State",
+        "city": "Test City", "zipcode": "12345", "mobile_number": "1234567890"
+    })
+    assert "ACCOUNT CREATED!" in created.text()
+
+    client.get("/add_to_cart/1")
+    checkout = client.get("/checkout").text()
+    assert "123 Test St" in checkout and "Logged in as <b>Test User</b>" in checkout
+
+    done = client.post("/payment", form={"name_on_card": "Test User", "card_number": "4111111111111111"})
+    assert "/payment_done/500" in done.url
+    assert "Your order has been placed successfully" in done.text()
@@ -0,0 +1,63 @@
+import asyncio
+import pytest
+
+from pages.aio.session import AsyncSession
+from utils.crawler import ProductCrawler
+
+# These tests run concurrently in separate contexts of one browser (see the multiplex marker)
+pytestmark = pytest.mark.multiplex
+
+
+async def test_subscription_in_home(async_pages: AsyncSession):
+    """Test Case 10: Verify Subscription in home page"""
+    await async_pages.home.load()
+    assert await async_pages.home.verify_page_loaded()
+
+    await async_pages.home.scroll_to_bottom()
+    await async_pages.home.subscribe_newsletter("test@example.com")
+    assert await async_pages.home.is_subscription_successful()
+
+async def test_search_product(async_pages: AsyncSession):
+    """Test Case 9: Search Product"""
+    await async_pages.home.load()
+    assert await async_pages.home.verify_page_loaded()
+
+    await async_pages.home.click_products()
+    assert await async_pages.products.verify_products_page()
+
+    await async_pages.products.search_product("Blue Top")
+    assert await async_pages.products.verify_search_results()
+    assert await async_pages.products.get_product_count() > 0
+
+async def test_concurrent_carts_are_isolated(async_pages: AsyncSession):
+    """Two users shopping at the same time only see their own cart"""
+    second_user = await async_pages.new_session()
+
+    async def add_and_view_cart(session: AsyncSession, index: int) -> list:
+        await session.home.load()
+        await session.home.click_products()
+        await session.products.add_to_cart(index)
+        await session.products.click_view_cart()
+        return await session.cart.get_cart_items()
+
+    first_items, second_items = await asyncio.gather(
+        add_and_view_cart(async_pages, 0),
+        add_and_view_cart(second_user, 1)
+    )
+    assert len(first_items) == 1 and len(second_items) == 1
+    assert first_items[0]["name"] != second_items[0]["name"]
+
+async def test_product_details_match_catalog(mux_page, catalog, pytestconfig):
+    """Every product's detail page shows the name, category and brand it has in the catalog"""
+    def check(product_id: int, details: dict) -> list:
+        expected = catalog.get(product_id)
+        return [
+            f"{field} {details[field]!r} != {getattr(expected, field)!r}"
+            for field in ("name", "category", "brand") if details[field] != getattr(expected, field)
+        ]
+
+    crawler = ProductCrawler(mux_page.context, check=check)
+    stats = await crawler.crawl((product.id for product in catalog), resume=pytestconfig.getoption("resume_crawl"))
+    print(f"\nCrawled {stats.summary()}")
+    assert not stats.failed, f"Detail pages failed to load, see {crawler.output_path}: {stats.failed}"
+    assert not stats.problems
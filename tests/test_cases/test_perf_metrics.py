@@ -0,0 +1,49 @@
+import json
+
+from utils.perf_metrics import CDP_METRICS, PERF_INIT_SCRIPT, REPORT_BINDING, PerfCollector
+
+LOAD = {"url": "http://shop.test/products", "ttfb": 120.0, "load": 480.0, "transfer_bytes": 2048, "requests": 9}
+
+
+class FakeCDPSession:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, method: str):
+        self.sent.append(method)
+        if method == "Performance.getMetrics":
+            return {"metrics": [{"name": "Nodes", "value": 310}, {"name": "Timestamp", "value": 1.5}]}
+
+
+def test_page_loads_become_tagged_samples(monkeypatch, fake_page):
+    """Each reported load is tagged with the test and the run id the controller exported, plus CDP metrics"""
+    monkeypatch.setenv("PERF_RUN_ID", "run-1")
+    cdp = FakeCDPSession()
+    fake_page.context.new_cdp_session = lambda page: cdp
+    collector = PerfCollector(fake_page, "tests/test_home.py::test_home", "chromium").install()
+    assert fake_page.init_scripts == [PERF_INIT_SCRIPT]
+    fake_page.bindings[REPORT_BINDING](None, LOAD)
+    fake_page.bindings[REPORT_BINDING](None, {**LOAD, "ttfb": 380.0})
+
+    sample = collector.samples[0]
+    assert (sample["test"], sample["run"], sample["url"]) == ("tests/test_home.py::test_home", "run-1", LOAD["url"])
+    assert sample["cdp"] == {"Nodes": 310} and set(sample["cdp"]) <= set(CDP_METRICS)
+    assert cdp.sent[0] == "Performance.enable"
+    assert collector.server_seconds == 0.5
+
+def test_samples_are_appended_as_json_lines(tmp_path, monkeypatch, fake_page):
+    """Samples of every test append to one time series; a test without page loads writes nothing"""
+    monkeypatch.delenv("PERF_RUN_ID", raising=False)
+    path = tmp_path / "perf" / "perf_metrics.jsonl"
+    PerfCollector(fake_page, "test_none", "firefox").export(str(path))
+    assert not path.exists()
+
+    for test_id in ("test_a", "test_b"):
+        collector = PerfCollector(fake_page, test_id, "firefox", run_id="run-2").install()
+        fake_page.bindings[REPORT_BINDING](None, LOAD)
+        collector.export(str(path))
+
+    samples = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(sample["test"], sample["run"]) for sample in samples] == [("test_a", "run-2"), ("test_b", "run-2")]
+    # Only Chromium has CDP metrics
+    assert "cdp" not in samples[0]
@@ -13,7 +13,7 @@ def shop_pages(page):
         "cart": CartPage(page)
     }
 
-def test_verify_all_products(shop_pages):
+def test_verify_all_products(shop_pages, catalog):
     """Test Case 8: Verify All Products and product detail page"""
     shop_pages["home"].load()
     assert shop_pages["home"].verify_page_loaded()
@@ -22,11 +22,14 @@ def test_verify_all_products(shop_pages):
     assert shop_pages["products"].verify_products_page()
     assert shop_pages["products"].get_product_count() > 0
     
+    first = shop_pages["products"].get_products()[0]
     shop_pages["products"].click_view_product()
     details = shop_pages["products"].get_product_details()
     assert all(key in details for key in ["name", "category", "price", "availability", "condition", "brand"])
+    expected = catalog.get(first["id"])
+    assert (details["name"], details["category"], details["brand"]) == (expected.name, expected.category, expected.brand)
 
-def test_search_product(shop_pages):
+def test_search_product(shop_pages, catalog):
     """Test Case 9: Search Product"""
     shop_pages["home"].load()
     assert shop_pages["home"].verify_page_loaded()
@@ -34,9 +37,12 @@ def test_search_product(shop_pages):
     shop_pages["home"].click_products()
     assert shop_pages["products"].verify_products_page()
     
-    shop_pages["products"].search_product("Blue Top")
+    product = catalog.pick(category="Women > Tops")
+    shop_pages["products"].search_product(product.name)
     assert shop_pages["products"].verify_search_results()
-    assert shop_pages["products"].get_product_count() > 0
+    results = [catalog.get(row["id"]) for row in shop_pages["products"].get_products()]
+    assert product in results
+    assert all(match in catalog.search(product.name) for match in results)
 
 def test_add_products_to_cart(shop_pages):
     """Test Case 12: Add Products in Cart"""
@@ -0,0 +1,76 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils.request_router import TYPICAL_SIZES, RequestRouter, RouterStats, host_matches
+
+
+class FakeRoute:
+    def __init__(self, url: str, resource_type: str):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.outcome = None
+
+    def abort(self, error_code: str):
+        self.outcome = error_code
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+
+class FakeNode:
+    """Test item carrying resource blocking markers"""
+
+    def __init__(self, *markers):
+        self.markers = [marker.mark for marker in markers]
+
+    def iter_markers(self, name: str):
+        return (marker for marker in self.markers if marker.name == name)
+
+
+def test_blocking_rules():
+    """Blocked types and domains, subdomains included, are dropped; allowed domains always win"""
+    router = RequestRouter(["image"], ["doubleclick.net"], allow_domains=["cdn.shop.test"])
+    assert router.should_block("https://shop.test/logo.png", "image")
+    assert router.should_block("https://ad.doubleclick.net/pixel", "script")
+    assert not router.should_block("https://shop.test/app.js", "script")
+    assert not router.should_block("https://cdn.shop.test/logo.png", "image")
+    assert not host_matches("notdoubleclick.net", ["doubleclick.net"])
+
+def test_markers_tune_the_default_rules():
+    """block_resources adds types and domains to the defaults; allow_resources takes them away"""
+    plain = RequestRouter.for_node(FakeNode(), RouterStats())
+    assert plain.should_block("https://shop.test/logo.png", "image")
+    assert not plain.should_block("https://shop.test/app.css", "stylesheet")
+
+    tuned = RequestRouter.for_node(FakeNode(
+        pytest.mark.block_resources(types=["stylesheet"], domains=["tracker.test"]),
+        pytest.mark.allow_resources(types=["image"], domains=["fonts.gstatic.com"]),
+    ), RouterStats())
+    assert tuned.should_block("https://shop.test/app.css", "stylesheet")
+    assert tuned.should_block("https://tracker.test/t.js", "script")
+    assert not tuned.should_block("https://shop.test/logo.png", "image")
+    assert not tuned.should_block("https://fonts.gstatic.com/font.woff2", "font")
+
+def test_blocked_requests_are_aborted_and_counted():
+    """Blocked requests are aborted and counted on the router and the shared stats; others fall through"""
+    stats = RouterStats()
+    router = RequestRouter(["image"], [], stats=stats)
+    blocked, allowed = FakeRoute("https://shop.test/a.png", "image"), FakeRoute("https://shop.test/", "document")
+    router._handle(blocked)
+    router._handle(allowed)
+    assert (blocked.outcome, allowed.outcome) == ("blockedbyclient", "fallback")
+    assert (router.blocked_requests, stats.blocked_requests) == (1, 1)
+    assert router.estimated_bytes == stats.estimated_bytes == TYPICAL_SIZES["image"]
+    assert stats.blocked_by_type == {"image": 1}
+
+def test_sizes_are_estimated_from_what_was_observed():
+    """A blocked request counts the size seen for its URL, else its type's average, else a typical size"""
+    stats = RouterStats()
+    assert stats.estimate_size("https://shop.test/a.woff2", "font") == TYPICAL_SIZES["font"]
+    assert stats.estimate_size("https://shop.test/a.ogg", "unknown") == 0
+    stats.record_size("https://shop.test/a.png", "image", 1000)
+    stats.record_size("https://shop.test/b.png", "image", 3000)
+    assert stats.estimate_size("https://shop.test/a.png", "image") == 1000
+    assert stats.estimate_size("https://shop.test/c.png", "image") == 2000
+    assert stats.record_blocked("https://shop.test/b.png", "image") == 3000
+    assert stats.estimated_bytes == 3000
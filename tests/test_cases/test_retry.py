@@ -0,0 +1,166 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from pages.retry import (
+    ASSERTION, DETACHED, NAVIGATION, OTHER, TIMEOUT, Retrier, RetryBudget, RetryPolicy, RetryStats, classify,
+    retry_step
+)
+from pytest_rerunfailures import get_reruns_condition
+from utils import retry_report
+from utils.retry_report import RetryPlugin
+
+
+class Flaky:
+    """Callable that raises the given errors in turn, then returns "ok" """
+
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+def run_async(coroutine):
+    """Run a coroutine on a thread of its own; the sync Playwright fixtures keep an event loop running on this one"""
+    with ThreadPoolExecutor(1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+def make_retrier(total: int = 10) -> Retrier:
+    return Retrier(RetryBudget(total), RetryStats())
+
+def counts(retrier: Retrier, level: str, failure: str) -> dict:
+    return retrier.stats.counts[(level, failure)]
+
+NO_DELAY = dict(base_delay=0, max_delay=0)
+
+@pytest.mark.parametrize("error, failure", [
+    (PlaywrightTimeoutError("Timeout 30000ms exceeded."), TIMEOUT),
+    (PlaywrightError("Element is not attached to the DOM"), DETACHED),
+    (PlaywrightError("page.goto: net::ERR_CONNECTION_RESET at https://example.com/"), NAVIGATION),
+    (PlaywrightError("Navigation to \"/products\" is interrupted by another navigation"), NAVIGATION),
+    (AssertionError("Expected 'Blue Top'"), ASSERTION),
+    (ValueError("bad value"), OTHER),
+])
+def test_classify(error, failure):
+    """Playwright errors are classified by message first, then by type"""
+    assert classify(error) == failure
+
+def test_backoff_is_jittered_and_capped():
+    """Delays are drawn from [0, min(max_delay, base_delay * 2^retry)]"""
+    policy = RetryPolicy({TIMEOUT}, base_delay=0.5, max_delay=3)
+    delays = [policy.delay(retry) for retry in range(6) for _ in range(20)]
+    assert all(0 <= delay <= 3 for delay in delays)
+    assert max(policy.delay(0) for _ in range(50)) <= 0.5
+    assert len(set(delays)) > 1
+
+def test_transient_failure_recovers():
+    """A covered failure is retried and recorded as recovered"""
+    retrier = make_retrier()
+    function = Flaky(PlaywrightTimeoutError("Timeout"), PlaywrightTimeoutError("Timeout"))
+    assert retrier.call("action", RetryPolicy({TIMEOUT}, attempts=3, **NO_DELAY), function) == "ok"
+    assert function.calls == 3
+    assert counts(retrier, "action", TIMEOUT)["retries"] == 2
+    assert counts(retrier, "action", TIMEOUT)["recovered"] == 1
+    assert retrier.budget.remaining == 8
+
+def test_uncovered_failures_and_exhaustion_raise():
+    """Assertions are never retried; covered failures give up after the policy's attempts"""
+    retrier = make_retrier()
+    policy = RetryPolicy({TIMEOUT}, attempts=2, **NO_DELAY)
+    function = Flaky(AssertionError("wrong total"))
+    with pytest.raises(AssertionError):
+        retrier.call("step", policy, function)
+    assert function.calls == 1
+
+    function = Flaky(*[PlaywrightTimeoutError("Timeout")] * 3)
+    with pytest.raises(PlaywrightTimeoutError):
+        retrier.call("step", policy, function)
+    assert function.calls == 2
+    assert counts(retrier, "step", TIMEOUT)["exhausted"] == 1
+
+def test_budget_stops_retries():
+    """Once the session budget is spent, failures are raised without retrying"""
+    retrier = make_retrier(total=1)
+    policy = RetryPolicy({DETACHED}, attempts=5, **NO_DELAY)
+    function = Flaky(*[PlaywrightError("Element is not attached to the DOM")] * 3)
+    with pytest.raises(PlaywrightError):
+        retrier.call("action", policy, function)
+    assert function.calls == 2
+    assert counts(retrier, "action", DETACHED)["denied"] == 1
+
+def test_retry_step_replays_async_flows():
+    """retry_step wraps coroutine functions with the async retrier"""
+    attempts = []
+
+    @retry_step(policy=RetryPolicy({NAVIGATION}, **NO_DELAY))
+    async def open_products():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise PlaywrightError("net::ERR_ABORTED")
+        return "products"
+
+    assert run_async(open_products()) == "products"
+    assert len(attempts) == 2
+
+def test_stats_merge_rows():
+    """Stats from xdist workers add up on the controller"""
+    stats = RetryStats()
+    stats.record("test", TIMEOUT, "retries")
+    other = RetryStats()
+    other.record("test", TIMEOUT, "retries")
+    other.record("test", TIMEOUT, "backoff_seconds", 1.5)
+    stats.merge(other.rows())
+    assert stats.rows() == [{"level": "test", "failure": TIMEOUT, "retries": 2, "recovered": 0, "exhausted": 0,
+                             "denied": 0, "backoff_seconds": 1.5}]
+
+class RerunItem:
+    """Test item as pytest-rerunfailures sees it: its flaky markers, --reruns and the attempt number"""
+
+    def __init__(self, reruns: int):
+        self.nodeid = "tests/test_a.py::test_one"
+        self.execution_count = 1
+        self.markers = []
+        self.session = SimpleNamespace(config=SimpleNamespace(getvalue=lambda name: reruns))
+
+    def get_closest_marker(self, name: str):
+        return next((marker for marker in self.markers if marker.name == name), None)
+
+    def add_marker(self, marker, append: bool = True):
+        self.markers.insert(len(self.markers) if append else 0, marker.mark)
+
+def rerun_allowed(plugin: RetryPlugin, item: RerunItem, error: Exception) -> bool:
+    """Drive the plugin's report hook for a failed call and ask pytest-rerunfailures whether it will rerun"""
+    call = SimpleNamespace(excinfo=SimpleNamespace(value=error))
+    report = SimpleNamespace(when="call", passed=False, failed=True)
+    hook = plugin.pytest_runtest_makereport(item, call)
+    next(hook)
+    with pytest.raises(StopIteration):
+        hook.send(SimpleNamespace(get_result=lambda: report))
+    return get_reruns_condition(item)
+
+def test_plugin_only_lets_transient_failures_rerun(monkeypatch):
+    """Assertions are kept from rerunning through the flaky marker; timeouts rerun after a backoff"""
+    monkeypatch.setattr(retry_report.time, "sleep", lambda seconds: None)
+    plugin = RetryPlugin(make_retrier())
+
+    assert rerun_allowed(plugin, RerunItem(reruns=2), PlaywrightTimeoutError("Timeout 30000ms exceeded."))
+    assert not rerun_allowed(plugin, RerunItem(reruns=2), AssertionError("Expected 'Blue Top'"))
+    assert counts(plugin.retrier, "test", TIMEOUT)["retries"] == 1
+
+def test_plugin_stops_reruns_when_the_budget_is_spent(monkeypatch):
+    """An empty retry budget fails transient failures too, even for tests with their own flaky marker"""
+    monkeypatch.setattr(retry_report.time, "sleep", lambda seconds: None)
+    plugin = RetryPlugin(make_retrier(total=0))
+    item = RerunItem(reruns=0)
+    item.add_marker(pytest.mark.flaky(reruns=3))
+
+    assert not rerun_allowed(plugin, item, PlaywrightTimeoutError("Timeout 30000ms exceeded."))
+    assert counts(plugin.retrier, "test", TIMEOUT)["denied"] == 1
@@ -0,0 +1,142 @@
+import pytest
+from types import SimpleNamespace
+
+from utils.scheduling import DurationHistory, DurationPlugin, DurationScheduling, lpt_assign, makespan
+
+
+def test_lpt_beats_round_robin():
+    """Long tests are spread over workers instead of piling up on one"""
+    durations = [60, 55, 50, 5, 5, 5, 4, 4, 3, 3, 2, 2]
+    assignment = lpt_assign(durations, 3)
+    round_robin = [list(range(worker, len(durations), 3)) for worker in range(3)]
+
+    assert sorted(i for indices in assignment for i in indices) == list(range(len(durations)))
+    assert makespan(durations, assignment) < makespan(durations, round_robin)
+    assert makespan(durations, assignment) == sum(durations) / 3
+    # Each worker keeps collection order so module fixtures are still reused
+    assert all(indices == sorted(indices) for indices in assignment)
+
+def test_more_workers_than_tests():
+    """Extra workers stay idle"""
+    assert sorted(map(len, lpt_assign([3, 1], 4))) == [0, 0, 1, 1]
+
+def test_history_estimates_and_round_trip(tmp_path):
+    """Recorded durations are smoothed, unknown tests get the median and the file round-trips"""
+    path = str(tmp_path / "durations.json")
+    history = DurationHistory(path)
+    assert history.estimate("tests/test_a.py::test_new") == 1.0
+
+    history.record("tests/test_a.py::test_one", 10.0)
+    history.record("tests/test_a.py::test_one", 20.0)
+    history.record("tests/test_a.py::test_two", 2.0)
+    history.record("tests/test_a.py::test_three", 4.0)
+    assert history.estimate("tests/test_a.py::test_one") == 15.0
+    assert history.estimate("tests/test_a.py::test_new") == 4.0
+
+    history.save()
+    assert DurationHistory.load(path).durations == history.durations
+
+def test_corrupt_history_is_ignored(tmp_path):
+    """A broken history file falls back to default scheduling instead of failing the run"""
+    path = tmp_path / "durations.json"
+    path.write_text("{not json")
+    assert DurationHistory.load(str(path)).durations == {}
+
+def report(when: str, start: float, stop: float, outcome: str = "passed", nodeid: str = "tests/test_a.py::test_one"):
+    return SimpleNamespace(nodeid=nodeid, when=when, start=start, stop=stop, duration=stop - start,
+                           outcome=outcome, skipped=outcome == "skipped")
+
+@pytest.mark.parametrize("outcome, recorded", [("passed", True), ("skipped", False)])
+def test_plugin_sums_phases(tmp_path, outcome, recorded):
+    """Setup, call and teardown durations add up; skipped tests are not recorded"""
+    plugin = DurationPlugin(DurationHistory(str(tmp_path / "durations.json")))
+    plugin.pytest_runtest_logreport(report("setup", 100.0, 101.0, outcome))
+    plugin.pytest_runtest_logreport(report("call", 101.0, 103.5))
+    plugin.pytest_runtest_logreport(report("teardown", 103.5, 104.0))
+    assert plugin.history.durations == ({"tests/test_a.py::test_one": 4.0} if recorded else {})
+
+def test_plugin_counts_every_rerun_attempt(tmp_path):
+    """A rerun attempt has no teardown report, yet its time still counts towards the test"""
+    plugin = DurationPlugin(DurationHistory(str(tmp_path / "durations.json")))
+    plugin.pytest_runtest_logreport(report("setup", 100.0, 101.0))
+    plugin.pytest_runtest_logreport(report("call", 101.0, 103.0, "rerun"))
+    assert plugin.history.durations == {}
+
+    plugin.pytest_runtest_logreport(report("setup", 103.5, 104.0))
+    plugin.pytest_runtest_logreport(report("call", 104.0, 105.0))
+    plugin.pytest_runtest_logreport(report("teardown", 105.0, 105.5))
+    assert plugin.history.durations == {"tests/test_a.py::test_one": 5.5}
+
+
+class FakeNode:
+    """Worker node as the scheduler sees it: it receives test indices and a shutdown signal"""
+
+    def __init__(self, name: str):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+def make_scheduler(durations: dict, *nodes: FakeNode) -> DurationScheduling:
+    config = SimpleNamespace(getvalue=lambda name: [f"{len(nodes)}*popen"], getoption=lambda name: None)
+    scheduler = DurationScheduling(config, history=DurationHistory("unused.json", dict(durations)))
+    for node in nodes:
+        join(scheduler, node, list(durations))
+    return scheduler
+
+def join(scheduler: DurationScheduling, node: FakeNode, collection: list):
+    scheduler.add_node(node)
+    scheduler.add_node_collection(node, collection)
+
+def finish_one(scheduler: DurationScheduling, node: FakeNode, ran: list):
+    index = scheduler.node2pending[node][0]
+    ran.append(index)
+    scheduler.mark_test_complete(node, index)
+
+def test_scheduler_hands_out_longest_tests_first():
+    """Workers start on the longest tests and are only shut down once nothing is pending"""
+    durations = {f"test_{i}": float(i) for i in range(8)}
+    first, second = FakeNode("gw0"), FakeNode("gw1")
+    scheduler = make_scheduler(durations, first, second)
+    scheduler.schedule()
+
+    assert first.sent + second.sent == [7, 6, 5, 4]
+    assert not first.shutting_down and not second.shutting_down
+    ran = []
+    while scheduler.has_pending:
+        for node in (first, second):
+            if scheduler.node2pending[node]:
+                finish_one(scheduler, node, ran)
+    assert sorted(ran) == list(range(8))
+    assert first.shutting_down and second.shutting_down
+
+def test_crashed_worker_tests_go_to_other_and_restarted_workers():
+    """Tests pending on a crashed worker are run by the live worker and by its replacement"""
+    durations = {f"test_{i}": float(i) for i in range(10)}
+    first, second = FakeNode("gw0"), FakeNode("gw1")
+    scheduler = make_scheduler(durations, first, second)
+    scheduler.schedule()
+    ran = []
+    finish_one(scheduler, first, ran)
+
+    crashed = scheduler.node2pending[first][0]
+    assert scheduler.collection[crashed] == scheduler.remove_node(first)
+    assert not second.shutting_down
+    # The replacement joins mid-run and gets work right away
+    replacement = FakeNode("gw2")
+    join(scheduler, replacement, list(durations))
+    scheduler.schedule()
+    assert replacement.sent
+
+    while scheduler.has_pending:
+        for node in (second, replacement):
+            if scheduler.node2pending[node]:
+                finish_one(scheduler, node, ran)
+    assert sorted(ran + [crashed]) == list(range(10))
+    assert second.shutting_down and replacement.shutting_down
@@ -0,0 +1,32 @@
+import os
+import subprocess
+import sys
+
+from utils.startup import CHROMIUM_LAUNCH_ARGS, StartupTimer, tuned_launch_args
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_conftest_does_not_load_async_page_objects():
+    """Importing the fixtures leaves pages.aio unloaded until a multiplexed test needs it"""
+    code = "import sys, tests.conftest; print(sorted(m for m in sys.modules if m.startswith('pages.aio')))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+def test_launch_args_are_tuned_for_chromium_only():
+    """Start-up flags are appended to any configured args, and only for Chromium"""
+    args = tuned_launch_args("chromium", {"headless": True, "args": ["--lang=en"]})
+    assert args["headless"] and args["args"] == ["--lang=en", *CHROMIUM_LAUNCH_ARGS]
+    assert tuned_launch_args("firefox", {"headless": True}) == {"headless": True}
+
+def test_startup_row_reports_phases_and_first_test():
+    """The row of a worker has its time to first test and the phases before it"""
+    timer = StartupTimer()
+    timer.session_started = 10.0
+    timer.record("browser launch", 1.25)
+    with timer.phase("warm-up"):
+        pass
+    timer.first_test = 12.5
+    row = timer.row("gw0")
+    assert row["worker"] == "gw0" and row["first_test_seconds"] == 2.5
+    assert list(row["phases"]) == ["browser launch", "warm-up"]
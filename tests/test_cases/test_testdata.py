@@ -0,0 +1,32 @@
+from utils.testdata import Card, TestData, User, luhn_digit
+
+
+def test_same_seed_and_worker_reproduce_the_data():
+    """Data depends only on the seed and the worker id"""
+    first, second = TestData(seed=42, worker_id="gw0"), TestData(seed=42, worker_id="gw0")
+    assert first.users(3) == second.users(3)
+    assert first.card() == second.card()
+    assert TestData(seed=42, worker_id="gw1").users(3) != TestData(seed=42, worker_id="gw0").users(3)
+
+def test_emails_are_unique_across_workers_and_batches():
+    """Emails carry the run token, worker id and a sequence number"""
+    emails = set()
+    for worker_id in ("gw0", "gw1", "master"):
+        data = TestData(seed=7, worker_id=worker_id, batch_size=4)
+        emails |= {user.email for user in data.users(10)}
+        emails |= {message.email for message in data.contact_messages(3)}
+    assert len(emails) == 39
+    assert all(email.startswith("test_00000007_") for email in emails)
+
+def test_records_are_immutable_and_read_like_dicts():
+    """Records support the dict access page objects use, and overrides create new records"""
+    data = TestData(seed=1, worker_id="gw0")
+    user = data.user(company="Test Company")
+    assert isinstance(user, User) and user["company"] == user.company == "Test Company"
+    assert user.get("newsletter", True) is True
+    assert dict(user)["email"] == user.email and {**user}["city"] == user.city
+
+    card = data.card()
+    assert isinstance(card, Card) and len(card.card_number) == 16
+    assert luhn_digit(card.card_number[:-1]) == card.card_number[-1]
+    assert luhn_digit("411111111111111") == "1"
@@ -0,0 +1,35 @@
+import os
+from types import SimpleNamespace
+
+from utils.tracing import TraceRecorder
+
+
+def test_pooled_context_is_traced_once_with_a_chunk_per_test(tmp_path, fake_context):
+    """Tracing starts once per context without snapshots; passing chunks are discarded unwritten"""
+    recorder = TraceRecorder(str(tmp_path), screenshot_sample=0)
+    for test_id in ("test_a", "test_b"):
+        recorder.start(fake_context, test_id)
+        assert recorder.stop(fake_context, test_id, keep=False) is None
+
+    assert [call[0] for call in fake_context.tracing.calls] == [
+        "start", "start_chunk", "stop_chunk", "start_chunk", "stop_chunk"
+    ]
+    assert fake_context.tracing.calls[0][1] == {"snapshots": False, "sources": False, "screenshots": False}
+    assert os.listdir(tmp_path) == [] and recorder.discarded == 2
+
+def test_failed_and_slow_tests_keep_traces_in_a_ring(tmp_path, fake_context):
+    """Failed or slow tests write their chunk; only the newest `keep` traces remain"""
+    recorder = TraceRecorder(str(tmp_path), keep=2, slow_seconds=5)
+    assert recorder.should_keep(SimpleNamespace(failed=True, duration=1))
+    assert recorder.should_keep(SimpleNamespace(failed=False, duration=6))
+    assert recorder.should_keep(None)
+    assert not recorder.should_keep(SimpleNamespace(failed=False, duration=1))
+
+    paths = []
+    for test_id in ("tests/test_a.py::test_one", "tests/test_a.py::test_two", "tests/test_a.py::test_three"):
+        recorder.start(fake_context, test_id)
+        paths.append(recorder.stop(fake_context, test_id, keep=True))
+        os.utime(paths[-1], (len(paths), len(paths)))
+
+    assert [os.path.exists(path) for path in paths] == [False, True, True]
+    assert recorder.kept == 3
@@ -0,0 +1,55 @@
+import pytest
+import json
+
+from utils.user_factory import UserFactory, UserFactoryError
+
+
+@pytest.fixture
+def factory(playwright, mock_site):
+    """UserFactory pointed at the mock site"""
+    with UserFactory(playwright, base_url=mock_site) as factory:
+        yield factory
+
+def test_create_verify_and_delete_user(factory):
+    """Account lifecycle over HTTP"""
+    user_data = factory.create()
+    assert factory.verify(user_data["email"], user_data["password"])
+    assert not factory.verify(user_data["email"], "wrongpassword")
+
+    assert factory.delete(user_data)
+    assert not factory.verify(user_data["email"], user_data["password"])
+    assert user_data["email"] not in factory.created
+
+def test_create_existing_user_fails(factory):
+    """Creating the same account twice is rejected"""
+    user_data = factory.create()
+    with pytest.raises(UserFactoryError):
+        factory.create(user_data)
+
+def test_batch_create_and_delete(factory):
+    """Batched calls create and delete every account"""
+    users = factory.create_many(factory.build() for _ in range(5))
+    assert len({user["email"] for user in users}) == 5
+    assert all(factory.verify(user["email"], user["password"]) for user in users)
+
+    assert all(factory.delete_many(users))
+    assert not factory.created
+
+def test_teardown_after_failure(playwright, mock_site):
+    """Accounts are deleted even when the code using the factory fails halfway"""
+    with pytest.raises(RuntimeError):
+        with UserFactory(playwright, base_url=mock_site) as factory:
+            user_data = factory.create()
+            raise RuntimeError("test failed halfway")
+
+    with UserFactory(playwright, base_url=mock_site) as checker:
+        assert not checker.verify(user_data["email"], user_data["password"])
+
+def test_storage_state_is_logged_in(factory, tmp_path):
+    """Logging in over HTTP produces a storage state with a session cookie"""
+    user_data = factory.create()
+    state_path = factory.storage_state(user_data, str(tmp_path / "state.json"))
+
+    with open(state_path) as f:
+        cookies = json.load(f)["cookies"]
+    assert any(cookie["name"] == "sessionid" for cookie in cookies)
@@ -0,0 +1,77 @@
+import pytest
+from playwright.sync_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+from pages import wait_strategies
+from pages.base_page import BasePage
+from pages.wait_strategies import DomSettled, PostActionWait, UrlChange, WaitStats, WaitStrategy
+
+
+@pytest.fixture
+def stats(monkeypatch) -> WaitStats:
+    stats = WaitStats()
+    monkeypatch.setattr(wait_strategies, "wait_stats", stats)
+    return stats
+
+
+def test_strategies_must_implement_their_waits():
+    """The base classes are abstract, so a strategy that forgets its wait fails when built, not when used"""
+    class Incomplete(PostActionWait):
+        name = "incomplete"
+
+    with pytest.raises(TypeError):
+        WaitStrategy()
+    with pytest.raises(TypeError):
+        Incomplete()
+
+def test_dom_settled_waits_after_the_action(stats, fake_page):
+    """The settle script runs after the action, capped at the timeout, and its time is recorded"""
+    DomSettled(quiet_ms=50, max_ms=5000).run(fake_page, lambda: fake_page.calls.append(("action",)), timeout=1000)
+    assert fake_page.calls == [("action",), ("evaluate", [50, 1000])]
+    assert stats.counts == {"dom_settled": 1}
+
+def test_dom_settled_falls_back_to_domcontentloaded_on_navigation(stats, fake_page):
+    """A click that navigates destroys the settle script's context; the wait becomes domcontentloaded"""
+    fake_page.evaluate_error = PlaywrightError("Execution context was destroyed")
+    DomSettled().run(fake_page, lambda: None)
+    assert fake_page.calls[-1] == ("load_state", "domcontentloaded")
+    assert stats.counts == {"dom_settled": 1}
+
+def test_navigate_commits_then_waits_for_domcontentloaded(stats, fake_page):
+    """goto() returns at commit and the navigation wait takes it to domcontentloaded"""
+    BasePage(fake_page).navigate("http://shop.test/products")
+    assert fake_page.calls == [("goto", "http://shop.test/products", "commit"), ("load_state", "domcontentloaded")]
+    assert stats.counts == {"load_state": 1}
+
+def test_url_change_waits_for_a_different_url(stats, fake_page):
+    """Without a pattern the URL only has to differ from the one before the action"""
+    UrlChange().run(fake_page, lambda: fake_page.goto("http://shop.test/login"))
+    assert fake_page.calls[-1] == ("wait_for_url", True)
+
+def test_is_visible_only_treats_a_timeout_as_hidden(fake_page, monkeypatch):
+    """A timeout means the element did not show up; any other error, like a strict mode violation, propagates"""
+    class Element:
+        def __init__(self, error: Exception = None):
+            self.error = error
+
+        def wait_for(self, state: str, timeout: int):
+            if self.error:
+                raise self.error
+
+    page = BasePage(fake_page)
+    for error, visible in ((None, True), (PlaywrightTimeoutError("Timeout 10ms exceeded"), False)):
+        monkeypatch.setattr(page, "locator", lambda selector, nth=None: Element(error))
+        assert page.is_visible("div.features_items", timeout=10) is visible
+    monkeypatch.setattr(page, "locator", lambda selector, nth=None: Element(PlaywrightError("strict mode violation")))
+    with pytest.raises(PlaywrightError, match="strict mode"):
+        page.is_visible("div.features_items", timeout=10)
+
+def test_worker_stats_merge_into_the_controller():
+    """Rows shipped through workeroutput add up per strategy"""
+    worker = WaitStats()
+    worker.record("dom_settled", 0.25)
+    worker.record("dom_settled", 0.5)
+    controller = WaitStats()
+    controller.record("dom_settled", 0.25)
+    controller.merge(worker.rows())
+    assert controller.counts == {"dom_settled": 3}
+    assert controller.seconds["dom_settled"] == pytest.approx(1.0)
@@ -0,0 +1 @@
+"""Utilities package"""
\ No newline at end of file
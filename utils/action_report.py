@@ -0,0 +1,77 @@
+import html
+import json
+import logging
+import os
+from typing import List
+
+import pytest
+
+from config.config import Config
+from pages.timing import ActionTimer
+
+HTML_REPORT_ROWS = 25
+
+
+class ActionReportPlugin:
+    """Writes the ranked page-object action timings as JSON and into the pytest-html summary"""
+
+    def __init__(self, timer: ActionTimer, path: str = Config.ACTION_REPORT):
+        self.timer = timer
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        # Workers ship their timings in workeroutput; merge them on the controller
+        rows = getattr(node, "workeroutput", {}).get("action_timings")
+        if rows:
+            self.timer.merge(rows)
+
+    def pytest_sessionfinish(self, session):
+        config = session.config
+        if hasattr(config, "workerinput"):
+            config.workeroutput["action_timings"] = self.timer.rows()
+            return
+        rows = self.timer.rows()
+        if not rows:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(rows, f, indent=2)
+        except OSError as e:
+            self.logger.warning(f"Failed to write action timing report: {str(e)}")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_summary(self, prefix, summary, postfix, session):
+        rows = self.timer.rows()
+        if rows:
+            prefix.append(self.html_table(rows[:HTML_REPORT_ROWS]))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        rows = self.timer.rows()[:5]
+        if rows:
+            terminalreporter.write_sep("-", "slowest page-object actions")
+            for row in rows:
+                terminalreporter.write_line(
+                    f"{row['seconds']:>8.2f}s {row['calls']:>5}x {row['action']} {row['selector']}".rstrip()
+                )
+            terminalreporter.write_line(f"full report: {self.path}")
+
+    @staticmethod
+    def html_table(rows: List[dict]) -> str:
+        """Ranked action timings as an HTML table"""
+        header = "".join(
+            f"<th>{title}</th>" for title in
+            ("Action", "Selector", "Calls", "Total (s)", "Wait (s)", "Action (s)", "Avg (ms)", "Max (ms)", "Retries")
+        )
+        body = "".join(
+            "<tr>"
+            f"<td>{html.escape(row['action'])}</td><td><code>{html.escape(row['selector'])}</code></td>"
+            f"<td>{row['calls']}</td><td>{row['seconds']:.2f}</td><td>{row['wait_seconds']:.2f}</td>"
+            f"<td>{row['action_seconds']:.2f}</td><td>{row['avg_ms']:.1f}</td><td>{row['max_ms']:.1f}</td>"
+            f"<td>{row['retries']}</td>"
+            "</tr>"
+            for row in rows
+        )
+        return f"<h2>Slowest page-object actions</h2><table><tr>{header}</tr>{body}</table>"
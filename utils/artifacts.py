@@ -0,0 +1,207 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from playwright.sync_api import Page
+import collections
+import gzip
+import hashlib
+import logging
+import os
+import re
+import threading
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pytest
+
+from config.config import Config
+
+# Extension and whether the bytes are gzipped before writing, per artifact kind
+ARTIFACT_KINDS = {
+    "screenshot.jpeg": (".jpg", False),
+    "screenshot.png": (".png", False),
+    "dom": (".html.gz", True),
+    "console": (".log.gz", True),
+}
+UNSAFE_NAME_CHARS = re.compile(r"[^\w.-]+")
+# Files the writer names: test name, content hash and the extension of the kind
+ARTIFACT_NAME = re.compile(r"^[\w.-]{1,100}_[0-9a-f]{12}(%s)$" % "|".join(
+    sorted({re.escape(extension) for extension, _ in ARTIFACT_KINDS.values()})
+))
+
+
+class ConsoleLog:
+    """Keeps the last console messages and page errors of a page, for failure artifacts"""
+
+    def __init__(self, page: Page, max_lines: int = Config.CONSOLE_LOG_LINES):
+        self.lines: Deque[str] = collections.deque(maxlen=max_lines)
+        page.on("console", lambda message: self.lines.append(f"[{message.type}] {message.text}"))
+        page.on("pageerror", lambda error: self.lines.append(f"[pageerror] {error}"))
+
+    def text(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+class ArtifactWriter:
+    """Compresses, deduplicates and writes artifacts on a thread pool, within a disk quota
+
+    Screenshots are deduplicated by content hash: an identical image (e.g. the same error page
+    in many tests) is stored once and every test points at that file. When the directory grows
+    beyond the quota, the oldest artifacts are deleted first. Only files named like the writer
+    names them count towards the quota, so anything else kept in the directory is never deleted.
+    """
+
+    def __init__(self, root: str = Config.ARTIFACT_PATH, workers: int = Config.ARTIFACT_WORKERS,
+                 quota_bytes: int = Config.ARTIFACT_QUOTA_MB * 1024 * 1024, gzip_level: int = Config.ARTIFACT_GZIP_LEVEL):
+        self.root = root
+        self.quota_bytes = quota_bytes
+        self.gzip_level = gzip_level
+        self.logger = logging.getLogger(__name__)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifacts")
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._by_hash: Dict[str, str] = {}
+        # (mtime, path, size) oldest first, including artifacts of earlier runs
+        self._files: Deque[Tuple[float, str, int]] = collections.deque()
+        self.total_bytes = 0
+        self.raw_bytes = 0
+        self.written_bytes = 0
+        self.duplicates = 0
+        self.evicted = 0
+        self._scan()
+
+    def _scan(self):
+        os.makedirs(self.root, exist_ok=True)
+        files = []
+        for entry in os.scandir(self.root):
+            if entry.is_file() and ARTIFACT_NAME.match(entry.name):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+        files.sort()
+        self._files.extend(files)
+        self.total_bytes = sum(size for _, _, size in files)
+
+    def submit(self, name: str, kind: str, data: bytes) -> str:
+        """Queue data for writing and return the path it will have"""
+        extension, compress = ARTIFACT_KINDS[kind]
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            self.raw_bytes += len(data)
+            existing = self._by_hash.get(digest)
+            if existing is not None:
+                self.duplicates += 1
+                return existing
+            path = os.path.join(self.root, f"{UNSAFE_NAME_CHARS.sub('_', name)[:100]}_{digest[:12]}{extension}")
+            self._by_hash[digest] = path
+            self._pending.append(self._executor.submit(self._write, path, data, compress))
+        return path
+
+    def _write(self, path: str, data: bytes, compress: bool):
+        if compress:
+            data = gzip.compress(data, compresslevel=self.gzip_level)
+        with open(path, "wb") as f:
+            f.write(data)
+        with self._lock:
+            self.written_bytes += len(data)
+            self.total_bytes += len(data)
+            self._files.append((os.path.getmtime(path), path, len(data)))
+            self._evict()
+
+    def _evict(self):
+        # Called with the lock held
+        while self.total_bytes > self.quota_bytes and len(self._files) > 1:
+            _, path, size = self._files.popleft()
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= size
+            self.evicted += 1
+            for digest, known in list(self._by_hash.items()):
+                if known == path:
+                    del self._by_hash[digest]
+
+    def flush(self):
+        """Wait until everything submitted so far is on disk"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                future.result()
+            except OSError as e:
+                self.logger.warning(f"Failed to write artifact: {str(e)}")
+
+    def close(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+
+class ArtifactPlugin:
+    """Captures a screenshot, DOM snapshot and console log of failed tests and hands them to the writer"""
+    STATS = ("raw_bytes", "written_bytes", "duplicates", "evicted")
+
+    def __init__(self, writer_factory=ArtifactWriter):
+        self._writer_factory = writer_factory
+        self._writer: Optional[ArtifactWriter] = None
+        self.stats: Dict[str, int] = {}
+
+    @property
+    def writer(self) -> ArtifactWriter:
+        # Created on first failure, so passing runs never touch the artifact directory
+        if self._writer is None:
+            self._writer = self._writer_factory()
+        return self._writer
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.when != "call" or not report.failed or not Config.SCREENSHOT_ON_FAILURE:
+            return
+        page: Optional[Page] = item.funcargs.get("page")
+        if page is None:
+            return
+        paths = self.capture(item.name, page, getattr(item, "console_log", None))
+        if paths:
+            report.sections.append(("artifacts", "\n".join(paths)))
+
+    def capture(self, name: str, page: Page, console: Optional[ConsoleLog] = None) -> List[str]:
+        """Grab the artifacts on the test thread; compression and disk writes happen in the background"""
+        paths = []
+        try:
+            if page.is_closed():
+                return paths
+            if Config.SCREENSHOT_FORMAT == "jpeg":
+                image = page.screenshot(type="jpeg", quality=Config.SCREENSHOT_QUALITY,
+                                        full_page=Config.SCREENSHOT_FULL_PAGE)
+            else:
+                image = page.screenshot(type="png", full_page=Config.SCREENSHOT_FULL_PAGE)
+            paths.append(self.writer.submit(name, f"screenshot.{Config.SCREENSHOT_FORMAT}", image))
+            paths.append(self.writer.submit(name, "dom", page.content().encode()))
+        except Exception as e:
+            print(f"\nFailed to capture page artifacts: {str(e)}")
+        if console is not None and console.lines:
+            paths.append(self.writer.submit(name, "console", console.text().encode()))
+        return paths
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        stats = getattr(node, "workeroutput", {}).get("artifact_stats")
+        if stats:
+            for key, value in stats.items():
+                self.stats[key] = self.stats.get(key, 0) + value
+
+    def pytest_sessionfinish(self, session):
+        if self._writer is not None:
+            self._writer.close()
+            for key in self.STATS:
+                self.stats[key] = self.stats.get(key, 0) + getattr(self._writer, key)
+        if hasattr(session.config, "workerinput"):
+            session.config.workeroutput["artifact_stats"] = self.stats
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.stats.get("raw_bytes"):
+            return
+        terminalreporter.write_sep("-", "failure artifacts")
+        terminalreporter.write_line(
+            f"{self.stats['raw_bytes'] / 1024:.0f} KB captured, {self.stats['written_bytes'] / 1024:.0f} KB written "
+            f"to {Config.ARTIFACT_PATH} ({self.stats['duplicates']} duplicates skipped, "
+            f"{self.stats['evicted']} old files evicted by the {Config.ARTIFACT_QUOTA_MB} MB quota)"
+        )
@@ -0,0 +1,99 @@
+import html
+import logging
+
+import pytest
+
+from pages.budgets import BudgetTracker
+
+# Terminal stats category of tests that only failed their performance budgets
+BUDGET_CATEGORY = "budget exceeded"
+
+
+class BudgetPlugin:
+    """Fails tests whose page-object calls exceed their budgets, as an outcome apart from functional failures"""
+
+    def __init__(self, tracker: BudgetTracker):
+        self.tracker = tracker
+        self.logger = logging.getLogger(__name__)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        # Only calls made by the test body count; fixtures warming up pages do not
+        violations = self.tracker.pop_violations()
+        if report.when != "call" or not violations:
+            return
+        report.budget_violations = violations
+        text = "\n".join(violations)
+        if report.passed:
+            report.outcome = "failed"
+            report.budget_only = True
+            report.longrepr = f"Performance budget exceeded:\n{text}"
+        else:
+            report.sections.append(("performance budgets", text))
+
+    def pytest_report_teststatus(self, report, config):
+        if report.when == "call" and getattr(report, "budget_only", False):
+            return BUDGET_CATEGORY, "B", ("BUDGET", {"yellow": True})
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        measurements = getattr(node, "workeroutput", {}).get("budget_measurements")
+        if measurements:
+            self.tracker.merge(measurements)
+
+    def pytest_sessionfinish(self, session):
+        config = session.config
+        if hasattr(config, "workerinput"):
+            config.workeroutput["budget_measurements"] = self.tracker.measurements
+            return
+        if self.tracker.updating_baseline and self.tracker.measurements:
+            try:
+                self.tracker.save_baseline()
+            except OSError as e:
+                self.logger.warning(f"Failed to write performance baseline: {str(e)}")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_html_results_summary(self, prefix, summary, postfix, session):
+        reports = self.violating_reports(session.config.pluginmanager.get_plugin("terminalreporter"))
+        if reports:
+            prefix.append(self.html_list(reports))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.tracker.updating_baseline:
+            terminalreporter.write_sep("-", "performance baseline")
+            terminalreporter.write_line(
+                f"{len(self.tracker.measurements)} budgeted actions written to {self.tracker.baseline_path}"
+            )
+            return
+        reports = self.violating_reports(terminalreporter)
+        if not reports:
+            return
+        terminalreporter.write_sep("-", "performance budget violations")
+        for report in reports:
+            kind = "budget only" if getattr(report, "budget_only", False) else "also failed functionally"
+            terminalreporter.write_line(f"{report.nodeid} ({kind})")
+            for violation in report.budget_violations:
+                terminalreporter.write_line(f"    {violation}")
+
+    @staticmethod
+    def violating_reports(terminalreporter) -> list:
+        """Call reports carrying budget violations, in the order they finished"""
+        if terminalreporter is None:
+            return []
+        return [
+            report for reports in terminalreporter.stats.values() for report in reports
+            if getattr(report, "when", None) == "call" and getattr(report, "budget_violations", None)
+        ]
+
+    @staticmethod
+    def html_list(reports: list) -> str:
+        """Budget violations per test as HTML"""
+        items = "".join(
+            f"<li><code>{html.escape(report.nodeid)}</code><ul>"
+            + "".join(f"<li>{html.escape(violation)}</li>" for violation in report.budget_violations)
+            + "</ul></li>"
+            for report in reports
+        )
+        return f"<h2>Performance budget violations</h2><ul>{items}</ul>"
@@ -0,0 +1,209 @@
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from playwright.async_api import APIRequestContext, async_playwright
+
+from config.config import Config
+from pages.extraction import extract_html_rows
+from pages.locators import ProductsLocators
+
+INDEX_VERSION = 1
+# Fields a product can be looked up by in O(1)
+INDEXED_FIELDS = ("category", "brand", "price")
+
+
+class CatalogError(Exception):
+    """Raised when a catalog page cannot be fetched"""
+
+
+class Product(NamedTuple):
+    """Catalog entry; category is "Usertype > Category" as shown on the product page"""
+    id: int
+    name: str
+    price: int
+    category: str
+    brand: str
+
+
+class CatalogIndex:
+    """Products of the site by id, name, category, brand and price, stored as one compact JSON file"""
+
+    def __init__(self, products: Iterable[Product] = (), fetched_at: Optional[float] = None):
+        self.fetched_at = fetched_at or time.time()
+        self.products: Dict[int, Product] = {}
+        self._by_name: Dict[str, Product] = {}
+        self._by_field: Dict[Tuple[str, object], List[Product]] = {}
+        for product in products:
+            self.products[product.id] = product
+            self._by_name[product.name.lower()] = product
+            for field in INDEXED_FIELDS:
+                self._by_field.setdefault((field, getattr(product, field)), []).append(product)
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    def __iter__(self):
+        return iter(self.products.values())
+
+    def get(self, product_id: int) -> Optional[Product]:
+        return self.products.get(product_id)
+
+    def by_name(self, name: str) -> Optional[Product]:
+        return self._by_name.get(name.lower())
+
+    def where(self, **fields) -> List[Product]:
+        """Products whose indexed fields all have the given values"""
+        unknown = set(fields) - set(INDEXED_FIELDS)
+        if unknown:
+            raise ValueError(f"Not an indexed field: {', '.join(sorted(unknown))}")
+        if not fields:
+            return list(self.products.values())
+        groups = [self._by_field.get((field, value), []) for field, value in fields.items()]
+        if len(groups) == 1:
+            return list(groups[0])
+        ids = set.intersection(*({product.id for product in group} for group in groups))
+        return [product for product in groups[0] if product.id in ids]
+
+    def pick(self, **fields) -> Product:
+        """First product with the given field values"""
+        matches = self.where(**fields)
+        if not matches:
+            raise LookupError(f"No product in the catalog with {fields}")
+        return matches[0]
+
+    def search(self, term: str) -> List[Product]:
+        """Products the site's search is expected to return: term in name, brand or category"""
+        term = term.lower()
+        return [
+            product for product in self.products.values()
+            if term in product.name.lower() or term in product.brand.lower() or term in product.category.lower()
+        ]
+
+    def is_stale(self, max_age_hours: float = Config.CATALOG_MAX_AGE_HOURS) -> bool:
+        return time.time() - self.fetched_at > max_age_hours * 3600
+
+    def save(self, path: str):
+        """Write the index atomically, so concurrent xdist workers never read half a file"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump({
+                "version": INDEX_VERSION,
+                "fetched_at": self.fetched_at,
+                "fields": Product._fields,
+                "rows": [list(product) for product in self.products.values()],
+            }, f, separators=(",", ":"))
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["CatalogIndex"]:
+        """Index saved at path, or None if there is none or it has another format"""
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != INDEX_VERSION or tuple(data.get("fields", ())) != Product._fields:
+            return None
+        return cls((Product(*row) for row in data["rows"]), fetched_at=data["fetched_at"])
+
+
+class RefreshStats(NamedTuple):
+    added: int
+    changed: int
+    removed: int
+    reused: int
+    seconds: float
+
+
+class CatalogScraper:
+    """Builds the catalog index from the products grid and the detail pages, fetched over HTTP
+
+    Pages are fetched with a Playwright APIRequestContext, so they are requested the way the
+    browser tests' contexts request them, and parsed with the page objects' own selectors and
+    column schemas, so no browser is needed. Detail pages are fetched `workers` at a time, and
+    a refresh only fetches those of products that are new or whose grid entry changed.
+    """
+
+    def __init__(self, base_url: Optional[str] = None, workers: int = Config.CATALOG_WORKERS,
+                 timeout: int = Config.NAVIGATION_TIMEOUT):
+        self.base_url = (base_url or Config.BASE_URL).rstrip("/")
+        self.workers = max(workers, 1)
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+
+    async def fetch(self, request: APIRequestContext, path: str) -> str:
+        response = await request.get(f"{self.base_url}{path}", timeout=self.timeout)
+        if not response.ok:
+            raise CatalogError(f"GET {path} returned {response.status}")
+        return await response.text()
+
+    async def grid(self, request: APIRequestContext) -> List[dict]:
+        """Id, name and price of every product on the products page"""
+        return extract_html_rows(await self.fetch(request, "/products"), ProductsLocators.PRODUCT_ITEMS,
+                                 ProductsLocators.PRODUCT_COLUMNS)
+
+    async def product(self, request: APIRequestContext, row: dict) -> Product:
+        """Catalog entry of a grid row, completed from its detail page"""
+        html = await self.fetch(request, f"/product_details/{row['id']}")
+        details = extract_html_rows(html, ProductsLocators.PRODUCT_INFORMATION,
+                                    ProductsLocators.PRODUCT_DETAIL_COLUMNS)[0]
+        return Product(row["id"], row["name"], row["price_value"], details["category"], details["brand"])
+
+    async def _refresh(self, index: Optional[CatalogIndex]) -> Tuple[CatalogIndex, RefreshStats]:
+        start = time.perf_counter()
+        async with async_playwright() as playwright:
+            request = await playwright.request.new_context()
+            try:
+                rows = await self.grid(request)
+                previous = index.products if index else {}
+                reused, pending = [], []
+                for row in rows:
+                    known = previous.get(row["id"])
+                    if known and known.name == row["name"] and known.price == row["price_value"]:
+                        reused.append(known)
+                    else:
+                        pending.append(row)
+                slots = asyncio.Semaphore(self.workers)
+
+                async def product(row: dict) -> Product:
+                    async with slots:
+                        return await self.product(request, row)
+
+                fetched = await asyncio.gather(*(product(row) for row in pending))
+            finally:
+                await request.dispose()
+        seen = {row["id"] for row in rows}
+        products = sorted(reused + list(fetched), key=lambda product: product.id)
+        stats = RefreshStats(
+            added=sum(1 for row in pending if row["id"] not in previous),
+            changed=sum(1 for row in pending if row["id"] in previous),
+            removed=sum(1 for product_id in previous if product_id not in seen),
+            reused=len(reused),
+            seconds=time.perf_counter() - start,
+        )
+        self.logger.info(f"Catalog refreshed in {stats.seconds:.2f}s: {stats.added} added, {stats.changed} changed, "
+                         f"{stats.removed} removed, {stats.reused} unchanged")
+        return CatalogIndex(products), stats
+
+    def refresh(self, index: Optional[CatalogIndex] = None) -> Tuple[CatalogIndex, RefreshStats]:
+        """New index from the current grid, reusing entries of products whose name and price are unchanged"""
+        # Run on a thread of its own: a sync Playwright session keeps an event loop running on this one
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            return executor.submit(asyncio.run, self._refresh(index)).result()
+
+
+def load_catalog(path: str = Config.CATALOG_PATH, base_url: Optional[str] = None, refresh: bool = False,
+                 max_age_hours: float = Config.CATALOG_MAX_AGE_HOURS) -> CatalogIndex:
+    """The catalog index at path, refreshed first when it is missing, stale or refresh is requested"""
+    index = CatalogIndex.load(path)
+    if index is not None and not refresh and not index.is_stale(max_age_hours):
+        return index
+    index, _ = CatalogScraper(base_url).refresh(index)
+    index.save(path)
+    return index
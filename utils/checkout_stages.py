@@ -0,0 +1,104 @@
+import logging
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from playwright.sync_api import APIResponse, BrowserContext
+
+from config.config import Config
+from pages.extraction import Column, extract_html_rows
+from pages.locators import CartLocators
+from utils.catalog import Product
+from utils.user_factory import CSRF_TOKEN_PATTERN
+
+# Stages of the checkout, in order, and the page a test starts on at each of them
+CHECKOUT_STAGES = ("cart", "checkout", "payment", "order_placed")
+STAGE_PATHS = {"cart": "/view_cart", "checkout": "/checkout", "payment": "/payment"}
+CART_ROW_IDS = {"id": Column(attr="id", parse=lambda value: int(value.rsplit("-", 1)[1]))}
+
+
+class StagingError(Exception):
+    """Raised when the site does not reach the requested checkout stage"""
+
+
+class StagedOrder(NamedTuple):
+    """State a staged checkout fixture set up: who is logged in, what is in the cart and the page shown"""
+    user: Optional[Dict[str, str]]
+    products: List[Product]
+    url: str
+
+    @property
+    def total(self) -> int:
+        return sum(product.price for product in self.products)
+
+
+class CheckoutStager:
+    """Puts a browser context straight into a checkout stage over HTTP, skipping the UI steps before it
+
+    Requests go through the context's own APIRequestContext, which shares the context's
+    cookies, so its pages see the session, login and cart the stager set up.
+    """
+
+    def __init__(self, context: BrowserContext, base_url: Optional[str] = None):
+        self.request = context.request
+        self.base_url = (base_url or Config.BASE_URL).rstrip("/")
+        self.logger = logging.getLogger(__name__)
+
+    def _get(self, path: str) -> APIResponse:
+        response = self.request.get(f"{self.base_url}{path}")
+        if not response.ok:
+            raise StagingError(f"GET {path} returned {response.status}")
+        return response
+
+    def _post_form(self, path: str, form: dict) -> APIResponse:
+        """Submit a form of the page at path, with the CSRF token the page carries"""
+        match = CSRF_TOKEN_PATTERN.search(self._get(path).text())
+        return self.request.post(f"{self.base_url}{path}", form={
+            "csrfmiddlewaretoken": match.group(1) if match else "", **form
+        }, headers={"Referer": f"{self.base_url}{path}"})
+
+    def login(self, user: Dict[str, str]):
+        """Log the context in through the login form"""
+        response = self._post_form("/login", {"email": user["email"], "password": user["password"]})
+        if "Logged in as" not in response.text():
+            raise StagingError(f"Failed to log in as {user['email']}")
+
+    def cart(self) -> List[int]:
+        """Ids of the products in the cart"""
+        rows = extract_html_rows(self._get("/view_cart").text(), CartLocators.CART_ITEMS, CART_ROW_IDS)
+        return [row["id"] for row in rows]
+
+    def clear_cart(self):
+        """Empty the cart, which a pooled user's session may still hold from an earlier test"""
+        for product_id in self.cart():
+            self._get(f"/delete_cart/{product_id}")
+
+    def add_to_cart(self, products: Iterable[Product]):
+        for product in products:
+            self._get(f"/add_to_cart/{product.id}")
+
+    def pay(self, card: Dict[str, str]) -> str:
+        """Pay for the cart with a card, returning the order confirmation URL"""
+        response = self._post_form("/payment", {field: card[field] for field in (
+            "name_on_card", "card_number", "cvc", "expiry_month", "expiry_year"
+        )})
+        if "/payment_done/" not in response.url:
+            raise StagingError(f"Payment did not reach the order confirmation, ended on {response.url}")
+        return response.url
+
+    def stage(self, stage: str, products: Iterable[Product] = (), card: Optional[Dict[str, str]] = None) -> str:
+        """Add products to the context's cart and advance to a stage; returns the URL a test starts on
+
+        Stages past the cart need the context to be logged in, and order_placed needs a card.
+        """
+        if stage not in CHECKOUT_STAGES:
+            raise ValueError(f"Unknown checkout stage {stage!r}, expected one of {', '.join(CHECKOUT_STAGES)}")
+        start = time.perf_counter()
+        self.add_to_cart(products)
+        if stage == "order_placed":
+            if card is None:
+                raise ValueError("Staging a placed order needs a card to pay with")
+            url = self.pay(card)
+        else:
+            url = f"{self.base_url}{STAGE_PATHS[stage]}"
+        self.logger.info(f"Staged checkout at {stage} in {time.perf_counter() - start:.2f}s")
+        return url
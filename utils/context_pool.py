@@ -0,0 +1,170 @@
+from playwright.sync_api import Browser, BrowserContext, Page
+import json
+import logging
+import os
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+from config.config import Config
+
+RESET_PATH = "/__context_pool_reset__"
+RESET_STORAGE_SCRIPT = """
+(items) => {
+    localStorage.clear();
+    sessionStorage.clear();
+    for (const {name, value} of items) {
+        localStorage.setItem(name, value);
+    }
+}
+"""
+
+
+def state_mtime(path: str) -> Optional[int]:
+    """Modification time of a storage state file, None if it is gone"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class PooledContext:
+    """A browser context together with its pool bookkeeping"""
+
+    def __init__(self, context: BrowserContext, key: str, baseline: Optional[dict], state_path: Optional[str] = None):
+        self.context = context
+        self.key = key
+        self.baseline = baseline
+        # Storage state file the context was created from, and its version then
+        self.state_path = state_path
+        self.state_mtime = state_mtime(state_path) if state_path else None
+        self.uses = 0
+        self.crashed = False
+        self.origins: Set[str] = set()
+        context.on("page", self._watch_page)
+
+    def _watch_page(self, page: Page):
+        page.on("crash", lambda _: setattr(self, "crashed", True))
+        page.on("framenavigated", lambda frame: self._remember_origin(frame.url) if frame == page.main_frame else None)
+
+    def _remember_origin(self, url: str):
+        parts = urlsplit(url)
+        if parts.scheme in ("http", "https"):
+            self.origins.add(f"{parts.scheme}://{parts.netloc}")
+
+
+class ContextPool:
+    """Hands out warm browser contexts keyed by their creation arguments and resets them between tests"""
+
+    def __init__(self, browser: Browser, max_uses: int = Config.CONTEXT_POOL_MAX_USES):
+        self.browser = browser
+        self.max_uses = max_uses
+        self.idle: Dict[str, List[PooledContext]] = {}
+        self.in_use: Dict[int, PooledContext] = {}
+        self.created = 0
+        self.reused = 0
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def key(context_args: dict) -> str:
+        """Stable key of the arguments a context was created with
+
+        A storage state file counts with its modification time, so contexts holding the
+        cookies of a user that has since been reprovisioned at the same path are not reused.
+        """
+        args = dict(context_args)
+        state = args.get("storage_state")
+        if isinstance(state, str):
+            args["storage_state"] = {"path": state, "mtime_ns": state_mtime(state)}
+        return json.dumps(args, sort_keys=True, default=str)
+
+    def acquire(self, context_args: dict) -> BrowserContext:
+        """Get an idle context created with the same arguments, or a new one"""
+        key = self.key(context_args)
+        idle = self.idle.get(key)
+        if idle:
+            pooled = idle.pop()
+            self.reused += 1
+        else:
+            self._evict_outdated()
+            state = context_args.get("storage_state")
+            pooled = PooledContext(self.browser.new_context(**context_args), key, self._baseline(context_args),
+                                   state if isinstance(state, str) else None)
+            self.created += 1
+        pooled.uses += 1
+        self.in_use[id(pooled.context)] = pooled
+        return pooled.context
+
+    def release(self, context: BrowserContext, reusable: bool = True):
+        """Return a context to the pool, or close it if it crashed, failed or is worn out"""
+        pooled = self.in_use.pop(id(context), None)
+        if pooled is None:
+            context.close()
+            return
+        if not reusable or pooled.crashed or pooled.uses >= self.max_uses or self._outdated(pooled):
+            self._discard(pooled)
+            return
+        try:
+            self.reset(pooled)
+        except Exception as e:
+            self.logger.warning(f"Failed to reset pooled context, recycling it: {str(e)}")
+            self._discard(pooled)
+            return
+        self.idle.setdefault(pooled.key, []).append(pooled)
+
+    def reset(self, pooled: PooledContext):
+        """Bring a context back to the state it was created in"""
+        context = pooled.context
+        context.unroute_all(behavior="ignoreErrors")
+        for page in context.pages:
+            page.close()
+        context.clear_cookies()
+        context.clear_permissions()
+
+        baseline = pooled.baseline or {}
+        baseline_storage = {o["origin"]: o.get("localStorage", []) for o in baseline.get("origins", [])}
+        origins = pooled.origins | set(baseline_storage)
+        if origins:
+            # Storage can only be cleared from a page on the origin; serve an empty one locally
+            page = context.new_page()
+            page.route(f"**{RESET_PATH}", lambda route: route.fulfill(body="<html></html>", content_type="text/html"))
+            for origin in origins:
+                page.goto(f"{origin}{RESET_PATH}")
+                page.evaluate(RESET_STORAGE_SCRIPT, baseline_storage.get(origin, []))
+            page.close()
+        if baseline.get("cookies"):
+            context.add_cookies(baseline["cookies"])
+        pooled.origins.clear()
+
+    def close(self):
+        """Close every pooled context"""
+        for pooled in [p for idle in self.idle.values() for p in idle] + list(self.in_use.values()):
+            self._discard(pooled)
+        self.idle.clear()
+        self.in_use.clear()
+
+    def _evict_outdated(self):
+        """Close idle contexts created from an earlier version of their storage state file"""
+        for key, idle in list(self.idle.items()):
+            for pooled in [pooled for pooled in idle if self._outdated(pooled)]:
+                idle.remove(pooled)
+                self._discard(pooled)
+            if not idle:
+                del self.idle[key]
+
+    @staticmethod
+    def _outdated(pooled: PooledContext) -> bool:
+        return pooled.state_path is not None and state_mtime(pooled.state_path) != pooled.state_mtime
+
+    def _discard(self, pooled: PooledContext):
+        try:
+            pooled.context.close()
+        except Exception:
+            pass
+
+    def _baseline(self, context_args: dict) -> Optional[dict]:
+        """Storage state the context starts with, restored on every reset"""
+        state = context_args.get("storage_state")
+        if isinstance(state, str):
+            with open(state) as f:
+                return json.load(f)
+        return state
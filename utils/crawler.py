@@ -0,0 +1,166 @@
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from config.config import Config
+from pages.retry import first_line
+
+# Checks a product's details, returning the problems found
+DetailCheck = Callable[[int, dict], List[str]]
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile, 0.0 for no values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p / 100 * len(ordered)) - 1, 0)]
+
+
+class RateLimiter:
+    """Token bucket letting through `rate` requests per second on average, in bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated: Optional[float] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self):
+        # Created on first use, so the lock belongs to the loop the crawl runs on
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        if self.rate <= 0:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            if self.updated is not None:
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self.tokens, self.updated = 1.0, time.monotonic()
+            self.tokens -= 1
+
+
+class CrawlStats:
+    """Outcome of one crawl: products visited, failures, page latencies and throughput"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.failed: List[int] = []
+        self.problems: Dict[int, List[str]] = {}
+        self.resumed = 0
+        self.seconds = 0.0
+
+    def record(self, product_id: int, seconds: float, error: Optional[str], problems: List[str]):
+        self.latencies.append(seconds)
+        if error:
+            self.failed.append(product_id)
+        if problems:
+            self.problems[product_id] = problems
+
+    @property
+    def products(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def per_second(self) -> float:
+        return self.products / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (f"{self.products} products in {self.seconds:.1f}s ({self.per_second:.1f}/s), "
+                f"p50 {percentile(self.latencies, 50) * 1000:.0f}ms, p95 {percentile(self.latencies, 95) * 1000:.0f}ms, "
+                f"{len(self.failed)} failed, {len(self.problems)} with problems, {self.resumed} already done")
+
+
+class ProductCrawler:
+    """Visits product detail pages concurrently and streams their details to a JSONL file
+
+    Products are fanned out over a bounded pool of pages of one async browser context, paced
+    by a rate limiter. Each result is written and flushed as soon as it completes, so with
+    resume an interrupted crawl only visits the products without a successful result yet.
+    """
+
+    def __init__(self, context, output_path: str = Config.CRAWL_OUTPUT, concurrency: int = Config.CRAWL_CONCURRENCY,
+                 rate: float = Config.CRAWL_RATE, check: Optional[DetailCheck] = None, base_url: Optional[str] = None,
+                 page_object: Optional[Callable] = None):
+        self.context = context
+        self.output_path = output_path
+        self.concurrency = max(concurrency, 1)
+        self.limiter = RateLimiter(rate, burst=self.concurrency)
+        self.check = check
+        self.base_url = (base_url or Config.BASE_URL).rstrip("/")
+        if page_object is None:
+            from pages.aio.products_page import AsyncProductsPage as page_object
+        self.page_object = page_object
+        self.logger = logging.getLogger(__name__)
+
+    def completed(self) -> Set[int]:
+        """Products with a successful result in the output file; a line cut off by an interruption is ignored"""
+        done = set()
+        try:
+            with open(self.output_path) as f:
+                for line in f:
+                    try:
+                        result = json.loads(line)
+                    except ValueError:
+                        continue
+                    if result.get("error") is None:
+                        done.add(result["id"])
+        except OSError:
+            pass
+        return done
+
+    async def crawl(self, product_ids: Iterable[int], resume: bool = False) -> CrawlStats:
+        """Visit the detail page of every product, skipping those already done when resuming"""
+        stats = CrawlStats()
+        product_ids = list(product_ids)
+        done = self.completed() if resume else set()
+        pending = [product_id for product_id in product_ids if product_id not in done]
+        stats.resumed = len(product_ids) - len(pending)
+        os.makedirs(os.path.dirname(self.output_path) or ".", exist_ok=True)
+        pages: asyncio.Queue = asyncio.Queue()
+        for _ in range(min(self.concurrency, len(pending))):
+            pages.put_nowait(self.page_object(await self.context.new_page()))
+        start = time.perf_counter()
+        with open(self.output_path, "a" if resume else "w") as output:
+            if output.tell():
+                # Close off a line cut short by an interruption before appending to it
+                with open(self.output_path, "rb") as f:
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        output.write("\n")
+
+            async def visit(product_id: int):
+                await self.limiter.acquire()
+                products = await pages.get()
+                result = {"id": product_id, "url": f"{self.base_url}/product_details/{product_id}"}
+                started = time.perf_counter()
+                try:
+                    await products.navigate(result["url"])
+                    result["details"] = await products.get_product_details()
+                    result["problems"] = self.check(product_id, result["details"]) if self.check else []
+                    result["error"] = None
+                except Exception as e:
+                    result["error"] = first_line(e)
+                finally:
+                    pages.put_nowait(products)
+                result["seconds"] = round(time.perf_counter() - started, 3)
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+                stats.record(product_id, result["seconds"], result["error"], result.get("problems", []))
+
+            try:
+                await asyncio.gather(*(visit(product_id) for product_id in pending))
+            finally:
+                stats.seconds = time.perf_counter() - start
+                while not pages.empty():
+                    await pages.get_nowait().page.close()
+        self.logger.info(f"Crawled {stats.summary()}")
+        return stats
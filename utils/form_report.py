@@ -0,0 +1,36 @@
+import pytest
+
+from pages.forms import FormStats
+
+
+class FormReportPlugin:
+    """Reports per form how many fields were batched and an estimate of the time batching saved"""
+
+    def __init__(self, stats: FormStats):
+        self.stats = stats
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        rows = getattr(node, "workeroutput", {}).get("form_stats")
+        if rows:
+            self.stats.merge(rows)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(session.config, "workerinput"):
+            session.config.workeroutput["form_stats"] = self.stats.rows()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        rows = self.stats.rows()
+        if not rows:
+            return
+        terminalreporter.write_sep("-", "form filling")
+        for row in rows:
+            terminalreporter.write_line(
+                f"{row['form']}: {row['fills']} fills, {row['batched']} fields batched, "
+                f"{row['fallbacks']} filled one by one, an estimated {row['estimated_saved_ms_per_fill']:.0f}ms saved per fill"
+            )
+        if self.stats.fields_timed:
+            source = f"measured over {self.stats.fields_timed} fields filled one by one"
+        else:
+            source = "FORM_FIELD_COST_MS, as no field was filled one by one"
+        terminalreporter.write_line(f"per-field cost the estimate assumes: {self.stats.field_cost() * 1000:.0f}ms ({source})")
@@ -0,0 +1,181 @@
+from playwright.sync_api import BrowserContext
+import json
+import logging
+import os
+import re
+import shutil
+import zipfile
+from typing import Dict, List, Optional, Pattern, Tuple
+
+import pytest
+
+from config.config import Config
+
+NETWORK_MODES = ("live", "record", "replay")
+HAR_SCOPES = ("test", "page")
+UNMATCHED_POLICIES = ("abort", "fallback")
+
+# Requests are grouped into one archive per page type when recording with --har-scope=page;
+# anything else (assets, third-party scripts) goes into the shared archive
+SHARED_HAR = "shared"
+PAGE_TYPE_PATTERNS: List[Tuple[str, Pattern]] = [
+    ("home", re.compile(r"^https?://[^/]+/?(\?.*)?$")),
+    ("products", re.compile(r"/(products|category_products|brand_products)\b")),
+    ("product_details", re.compile(r"/product_details/")),
+    ("cart", re.compile(r"/(view_cart|add_to_cart|delete_cart)\b")),
+    ("login", re.compile(r"/(login|signup|account_created|logout|delete_account)\b")),
+    ("checkout", re.compile(r"/(checkout|payment|payment_done|download_invoice)\b")),
+    ("contact", re.compile(r"/contact_us\b")),
+]
+# Page-scoped recordings are made per test, so concurrent workers never write the same archive,
+# and merged into the page type archives at the end of the session
+RECORDING_DIR = "recording"
+HAR_ENTRY = "har.har"
+
+
+class HarNotFoundError(FileNotFoundError):
+    """Raised in strict replay mode when no archive was recorded for a test"""
+
+
+def page_type(url: str) -> str:
+    """Archive a URL belongs to with --har-scope=page; later patterns win, as their routes do in replay"""
+    for name, pattern in reversed(PAGE_TYPE_PATTERNS):
+        if pattern.search(url):
+            return name
+    return SHARED_HAR
+
+
+def read_har(path: str) -> Tuple[dict, Dict[str, bytes]]:
+    """HAR log of a .har.zip archive and the response bodies attached to it"""
+    with zipfile.ZipFile(path) as archive:
+        har = json.loads(archive.read(HAR_ENTRY))
+        files = {name: archive.read(name) for name in archive.namelist() if name != HAR_ENTRY}
+    return har, files
+
+
+def write_har(path: str, har: dict, files: Dict[str, bytes]):
+    """Write a .har.zip archive atomically"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(HAR_ENTRY, json.dumps(har))
+        for name, content in files.items():
+            archive.writestr(name, content)
+    os.replace(temp_path, path)
+
+
+def entry_key(entry: dict) -> Tuple[str, str, str]:
+    request = entry["request"]
+    return request["method"], request["url"], (request.get("postData") or {}).get("text", "")
+
+
+class HarRouter:
+    """Records browser traffic to HAR archives or replays it through context.route_from_har"""
+
+    def __init__(self, mode: str = "live", har_dir: str = Config.HAR_DIR, scope: str = "test",
+                 unmatched: str = "abort"):
+        if mode not in NETWORK_MODES:
+            raise ValueError(f"Invalid network mode: {mode}")
+        if scope not in HAR_SCOPES:
+            raise ValueError(f"Invalid HAR scope: {scope}")
+        if unmatched not in UNMATCHED_POLICIES:
+            raise ValueError(f"Invalid unmatched request policy: {unmatched}")
+        self.mode = mode
+        self.har_dir = har_dir
+        self.scope = scope
+        self.unmatched = unmatched
+        self.logger = logging.getLogger(__name__)
+        if mode == "record":
+            os.makedirs(self.har_dir, exist_ok=True)
+
+    def har_path(self, name: str) -> str:
+        """Archive path for a test id or page type"""
+        safe_name = re.sub(r"[^\w.-]+", "_", name)
+        return os.path.join(self.har_dir, f"{safe_name}.har.zip")
+
+    def recording_path(self, test_id: str) -> str:
+        """Archive a test records to: its own, or with page scope its share of the page type archives"""
+        if self.scope == "test":
+            return self.har_path(test_id)
+        return os.path.join(self.har_dir, RECORDING_DIR, os.path.basename(self.har_path(test_id)))
+
+    def archives(self, test_id: str) -> List[Tuple[str, Optional[Pattern]]]:
+        """Archive names and URL filters used for a test, least specific first"""
+        if self.scope == "test":
+            return [(test_id, None)]
+        return [(SHARED_HAR, None)] + PAGE_TYPE_PATTERNS
+
+    def install(self, context: BrowserContext, test_id: str):
+        """Set up recording or replay routes on a fresh context"""
+        if self.mode == "live":
+            return
+        if self.mode == "record":
+            path = self.recording_path(test_id)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            context.route_from_har(path, update=True, update_content="attach", update_mode="minimal")
+            return
+        # Routes registered later take precedence, so page types win over the shared archive
+        for name, url in self.archives(test_id):
+            path = self.har_path(name)
+            if not os.path.exists(path):
+                if self.unmatched == "abort":
+                    raise HarNotFoundError(f"No HAR recorded at {path}; run with --network-mode=record first")
+                self.logger.warning(f"No HAR recorded at {path}, passing requests through")
+                continue
+            context.route_from_har(path, url=url, not_found=self.unmatched)
+
+    def merge_recordings(self) -> int:
+        """Merge the page-scoped recordings of the session into the page type archives
+
+        An entry recorded in this session replaces the archived one for the same request, so
+        recording a subset of the tests keeps what the others recorded before. Returns the
+        number of recordings merged.
+        """
+        recording_dir = os.path.join(self.har_dir, RECORDING_DIR)
+        if not os.path.isdir(recording_dir):
+            return 0
+        recordings = sorted(name for name in os.listdir(recording_dir) if name.endswith(".har.zip"))
+        recorded: Dict[str, Tuple[dict, Dict[str, bytes]]] = {}
+        for name in recordings:
+            har, files = read_har(os.path.join(recording_dir, name))
+            for entry in har["log"]["entries"]:
+                # Pages are those of one test's context, so merged archives do not keep them
+                entry.pop("pageref", None)
+                entries, archive_files = recorded.setdefault(page_type(entry["request"]["url"]), ({}, {}))
+                entries[entry_key(entry)] = entry
+                attachment = entry["response"]["content"].get("_file")
+                if attachment in files:
+                    archive_files[attachment] = files[attachment]
+        for name, (entries, files) in recorded.items():
+            path = self.har_path(name)
+            if os.path.exists(path):
+                har, archived_files = read_har(path)
+                merged = {entry_key(entry): entry for entry in har["log"]["entries"]}
+                merged.update(entries)
+                har["log"]["entries"] = list(merged.values())
+                files = {**archived_files, **files}
+            else:
+                template, _ = read_har(os.path.join(recording_dir, recordings[0]))
+                har = {"log": {**template["log"], "pages": [], "entries": list(entries.values())}}
+            used = {entry["response"]["content"].get("_file") for entry in har["log"]["entries"]}
+            write_har(path, har, {file: content for file, content in files.items() if file in used})
+        shutil.rmtree(recording_dir)
+        self.logger.info(f"Merged {len(recordings)} HAR recordings into {len(recorded)} page type archives")
+        return len(recordings)
+
+
+class HarMergePlugin:
+    """Merges the page-scoped recordings once every test, on any worker, has finished"""
+
+    def __init__(self, router: HarRouter):
+        self.router = router
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self, session):
+        # Before xdist starts the workers; recordings of an interrupted session are not merged
+        shutil.rmtree(os.path.join(self.router.har_dir, RECORDING_DIR), ignore_errors=True)
+
+    def pytest_sessionfinish(self, session):
+        try:
+            self.router.merge_recordings()
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            self.router.logger.warning(f"Failed to merge HAR recordings: {str(e)}")
@@ -0,0 +1,183 @@
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Route
+import asyncio
+import concurrent.futures
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TYPE_CHECKING
+
+import pytest
+
+from config.config import Config
+from utils.request_router import RequestRouter, RouterStats
+
+if TYPE_CHECKING:
+    from pages.aio.session import AsyncSession
+
+
+class MuxPage:
+    """Placeholder fixture value, replaced by an async page when the multiplexer runs the test"""
+
+    def __init__(self, multiplexer: "BrowserMultiplexer", router: Optional[RequestRouter] = None):
+        self.multiplexer = multiplexer
+        self.router = router
+
+    async def materialize(self, contexts: List[BrowserContext]) -> Page:
+        """Open a page in a new context, tracked in contexts so it is closed after the test"""
+        context = await self.multiplexer.new_context(contexts, self.router)
+        return await context.new_page()
+
+
+class MuxSession(MuxPage):
+    """Placeholder fixture value, replaced by a pages.aio AsyncSession"""
+
+    async def materialize(self, contexts: List[BrowserContext]) -> "AsyncSession":
+        # Imported here so runs without multiplexed tests never load the async page objects
+        from pages.aio.session import AsyncSession
+        page = await super().materialize(contexts)
+        return AsyncSession(page, new_session=lambda: self.materialize(contexts))
+
+
+class BrowserMultiplexer:
+    """Runs async tests concurrently in isolated contexts of one browser
+
+    The browser is driven by Playwright's async API on an event loop in a background
+    thread, so several tests can overlap their network waits within one worker process.
+    """
+
+    def __init__(self, browser_name: str = Config.BROWSER, launch_args: Optional[dict] = None,
+                 context_args: Optional[dict] = None, max_contexts: int = Config.MULTIPLEX_CONTEXTS,
+                 stats: Optional[RouterStats] = None):
+        self.browser_name = browser_name
+        self.launch_args = launch_args or {}
+        self.context_args = context_args or {}
+        self.max_contexts = max_contexts
+        self.stats = stats or RouterStats()
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="browser-multiplexer", daemon=True)
+        self.futures: Dict[str, concurrent.futures.Future] = {}
+        self.busy_seconds = 0.0
+        self.started_at = 0.0
+        self.logger = logging.getLogger(__name__)
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self.semaphore: Optional[asyncio.Semaphore] = None
+
+    def start(self) -> "BrowserMultiplexer":
+        """Start the event loop thread and launch the browser"""
+        self.thread.start()
+        self.call(self._start())
+        self.started_at = time.perf_counter()
+        return self
+
+    async def _start(self):
+        self.playwright = await async_playwright().start()
+        self.browser = await getattr(self.playwright, self.browser_name).launch(**self.launch_args)
+        self.semaphore = asyncio.Semaphore(self.max_contexts)
+
+    def call(self, coroutine: Awaitable) -> Any:
+        """Run a coroutine on the multiplexer loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def submit(self, test_id: str, test_function: Callable[..., Awaitable], kwargs: Dict[str, Any]):
+        """Schedule a test; it starts as soon as a context slot is free"""
+        if test_id not in self.futures:
+            self.futures[test_id] = asyncio.run_coroutine_threadsafe(self._run(test_function, kwargs), self.loop)
+
+    def result(self, test_id: str) -> Any:
+        """Wait for a submitted test, re-raising its failure"""
+        return self.futures.pop(test_id).result()
+
+    def cancel_pending(self):
+        """Cancel tests that were submitted but never collected"""
+        for future in self.futures.values():
+            future.cancel()
+        self.futures.clear()
+
+    async def _run(self, test_function: Callable[..., Awaitable], kwargs: Dict[str, Any]):
+        async with self.semaphore:
+            started = time.perf_counter()
+            contexts: List[BrowserContext] = []
+            try:
+                call_kwargs = {
+                    name: await value.materialize(contexts) if isinstance(value, MuxPage) else value
+                    for name, value in kwargs.items()
+                }
+                return await test_function(**call_kwargs)
+            finally:
+                for context in contexts:
+                    await context.close()
+                self.busy_seconds += time.perf_counter() - started
+
+    async def new_context(self, contexts: List[BrowserContext], router: Optional[RequestRouter] = None) -> BrowserContext:
+        """Create an isolated context of the shared browser, with request blocking if a router is given"""
+        context = await self.browser.new_context(**self.context_args)
+        contexts.append(context)
+        if router:
+            await context.route("**/*", self._router_handler(router))
+        return context
+
+    @staticmethod
+    def _router_handler(router: RequestRouter) -> Callable[[Route], Awaitable]:
+        async def handle(route: Route):
+            request = route.request
+            if router.should_block(request.url, request.resource_type):
+                size = router.stats.record_blocked(request.url, request.resource_type)
+                router.blocked_requests += 1
+                router.estimated_bytes += size
+                await route.abort("blockedbyclient")
+            else:
+                await route.fallback()
+        return handle
+
+    @property
+    def concurrency(self) -> float:
+        """Average number of tests in flight since the browser started"""
+        elapsed = time.perf_counter() - self.started_at
+        return self.busy_seconds / elapsed if elapsed else 0.0
+
+    def stop(self):
+        """Close the browser and stop the event loop"""
+        self.cancel_pending()
+        try:
+            if self.browser:
+                self.call(self.browser.close())
+            if self.playwright:
+                self.call(self.playwright.stop())
+        finally:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=10)
+
+
+class MultiplexPlugin:
+    """Reports how many multiplexed tests each worker ran at a time"""
+
+    def __init__(self, worker_id: str):
+        self.worker_id = worker_id
+        self.concurrency: Optional[float] = None
+        self.rows: List[dict] = []
+
+    def record(self, multiplexer: BrowserMultiplexer):
+        self.concurrency = multiplexer.concurrency
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        row = getattr(node, "workeroutput", {}).get("multiplex")
+        if row:
+            self.rows.append(row)
+
+    def pytest_sessionfinish(self, session):
+        if self.concurrency is None:
+            return
+        row = {"worker": self.worker_id, "concurrency": self.concurrency}
+        if hasattr(session.config, "workerinput"):
+            session.config.workeroutput["multiplex"] = row
+        else:
+            self.rows.append(row)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.rows:
+            return
+        terminalreporter.write_sep("-", "multiplexed tests")
+        for row in sorted(self.rows, key=lambda row: row["worker"]):
+            terminalreporter.write_line(f"{row['worker']}: {row['concurrency']:.1f} tests at a time on average")
@@ -0,0 +1,104 @@
+from playwright.sync_api import Page
+import json
+import logging
+import os
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from config.config import Config
+
+REPORT_BINDING = "__perfReport"
+
+# Runs in every document of the page and reports its metrics once the load event has finished
+PERF_INIT_SCRIPT = """
+(() => {
+    if (window.top !== window) return;
+    const lcp = [];
+    try {
+        new PerformanceObserver(list => lcp.push(...list.getEntries()))
+            .observe({type: "largest-contentful-paint", buffered: true});
+    } catch (e) {}
+    window.addEventListener("load", () => setTimeout(() => {
+        const nav = performance.getEntriesByType("navigation")[0];
+        if (!nav || !window.%(binding)s) return;
+        const paints = {};
+        for (const paint of performance.getEntriesByType("paint")) paints[paint.name] = paint.startTime;
+        const resources = performance.getEntriesByType("resource");
+        const largest = lcp[lcp.length - 1];
+        window.%(binding)s({
+            url: location.href,
+            ttfb: nav.responseStart - nav.requestStart,
+            response_end: nav.responseEnd,
+            dom_content_loaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd,
+            first_paint: paints["first-paint"] ?? null,
+            first_contentful_paint: paints["first-contentful-paint"] ?? null,
+            largest_contentful_paint: largest ? largest.startTime : null,
+            transfer_bytes: (nav.transferSize || 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+            requests: resources.length + 1
+        });
+    }, 0));
+})();
+""" % {"binding": REPORT_BINDING}
+
+# Subset of CDP Performance.getMetrics worth tracking per page load
+CDP_METRICS = ("TaskDuration", "ScriptDuration", "LayoutDuration", "RecalcStyleDuration", "JSHeapUsedSize", "Nodes")
+
+
+
+def new_run_id() -> str:
+    """Id telling the samples of one run apart in the time series"""
+    return uuid.uuid4().hex[:12]
+
+
+class PerfCollector:
+    """Records Navigation Timing, paint/LCP, transferred bytes and CDP metrics of every page load"""
+
+    def __init__(self, page: Page, test_id: str, browser_name: str = Config.BROWSER, run_id: Optional[str] = None):
+        self.page = page
+        self.test_id = test_id
+        self.browser_name = browser_name
+        # The controller sets PERF_RUN_ID before starting xdist workers, so all of them share it
+        self.run_id = run_id or os.getenv("PERF_RUN_ID") or new_run_id()
+        self.samples: List[Dict] = []
+        self.cdp = None
+        self.logger = logging.getLogger(__name__)
+
+    def install(self) -> "PerfCollector":
+        """Start collecting; call before the first navigation of the page"""
+        if self.browser_name == "chromium":
+            try:
+                self.cdp = self.page.context.new_cdp_session(self.page)
+                self.cdp.send("Performance.enable")
+            except Exception as e:
+                self.logger.debug(f"CDP performance metrics unavailable: {str(e)}")
+                self.cdp = None
+        self.page.expose_binding(REPORT_BINDING, self._on_report)
+        self.page.add_init_script(PERF_INIT_SCRIPT)
+        return self
+
+    def _on_report(self, source, metrics: Dict):
+        sample = {"test": self.test_id, "run": self.run_id, "timestamp": round(time.time(), 3), **metrics}
+        if self.cdp is not None:
+            try:
+                values = {m["name"]: m["value"] for m in self.cdp.send("Performance.getMetrics")["metrics"]}
+                sample["cdp"] = {name: values[name] for name in CDP_METRICS if name in values}
+            except Exception as e:
+                self.logger.debug(f"Failed to read CDP metrics: {str(e)}")
+        self.samples.append(sample)
+
+    @property
+    def server_seconds(self) -> float:
+        """Time the server took to start answering the test's page loads"""
+        return sum(sample["ttfb"] for sample in self.samples) / 1000
+
+    def export(self, path: str = Config.PERF_METRICS_FILE):
+        """Append the samples to the JSON lines time series"""
+        if not self.samples:
+            return
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        lines = "".join(json.dumps(sample) + "\n" for sample in self.samples)
+        # One append per test keeps lines of concurrent xdist workers from interleaving
+        with open(path, "a") as f:
+            f.write(lines)
@@ -0,0 +1,139 @@
+from playwright.sync_api import BrowserContext, Request, Route
+import logging
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+DEFAULT_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
+DEFAULT_BLOCKED_DOMAINS = (
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "fundingchoicesmessages.google.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+)
+
+# Fallback size guesses (bytes) for blocked requests whose size was never observed
+TYPICAL_SIZES = {
+    "image": 40_000,
+    "media": 500_000,
+    "font": 50_000,
+    "script": 80_000,
+    "stylesheet": 20_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+    "document": 30_000,
+}
+
+
+def host_matches(host: str, domains: Iterable[str]) -> bool:
+    """Check if host equals or is a subdomain of any of the domains"""
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+class RouterStats:
+    """Counts blocked requests and learns response sizes to estimate the bytes saved; blocked bytes are never measured"""
+
+    def __init__(self):
+        self.blocked_requests = 0
+        self.estimated_bytes = 0
+        self.blocked_by_type: Dict[str, int] = {}
+        self.known_sizes: Dict[str, int] = {}
+        self._type_sizes: Dict[str, list] = {}
+
+    def record_blocked(self, url: str, resource_type: str) -> int:
+        """Count a blocked request and return its estimated size"""
+        size = self.estimate_size(url, resource_type)
+        self.blocked_requests += 1
+        self.estimated_bytes += size
+        self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+        return size
+
+    def record_size(self, url: str, resource_type: str, size: int):
+        """Remember the size of a response that was allowed through"""
+        self.known_sizes[url] = size
+        total_count = self._type_sizes.setdefault(resource_type, [0, 0])
+        total_count[0] += size
+        total_count[1] += 1
+
+    def estimate_size(self, url: str, resource_type: str) -> int:
+        """Best guess of a response size: observed for this URL, else average for its type"""
+        if url in self.known_sizes:
+            return self.known_sizes[url]
+        total, count = self._type_sizes.get(resource_type, (0, 0))
+        if count:
+            return total // count
+        return TYPICAL_SIZES.get(resource_type, 0)
+
+
+class RequestRouter:
+    """Aborts requests by resource type and domain to cut page weight"""
+
+    def __init__(self, block_resource_types: Iterable[str] = DEFAULT_BLOCKED_RESOURCE_TYPES,
+                 block_domains: Iterable[str] = DEFAULT_BLOCKED_DOMAINS,
+                 allow_domains: Iterable[str] = (), stats: Optional[RouterStats] = None):
+        self.block_resource_types = set(block_resource_types)
+        self.block_domains = set(block_domains)
+        self.allow_domains = set(allow_domains)
+        self.stats = stats or RouterStats()
+        self.blocked_requests = 0
+        self.estimated_bytes = 0
+        self.logger = logging.getLogger(__name__)
+
+    @classmethod
+    def for_node(cls, node, stats: RouterStats) -> "RequestRouter":
+        """Router of a test: the default lists, tuned by its block_resources and allow_resources markers"""
+        resource_types = set(DEFAULT_BLOCKED_RESOURCE_TYPES)
+        block_domains = set(DEFAULT_BLOCKED_DOMAINS)
+        allow_domains = set()
+        for marker in node.iter_markers("block_resources"):
+            resource_types |= set(marker.kwargs.get("types", ()))
+            block_domains |= set(marker.kwargs.get("domains", ()))
+        for marker in node.iter_markers("allow_resources"):
+            resource_types -= set(marker.kwargs.get("types", ()))
+            allow_domains |= set(marker.kwargs.get("domains", ()))
+        return cls(resource_types, block_domains, allow_domains, stats=stats)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Decide whether a request is dropped; allowed domains always win"""
+        host = urlsplit(url).hostname or ""
+        if host_matches(host, self.allow_domains):
+            return False
+        if host_matches(host, self.block_domains):
+            return True
+        return resource_type in self.block_resource_types
+
+    def install(self, context: BrowserContext):
+        """Route every request of the context through the router"""
+        context.route("**/*", self._handle)
+
+    def learn_sizes(self, context: BrowserContext):
+        """Record response sizes of a full-fidelity context to improve later estimates"""
+        context.on("requestfinished", self._record_size)
+
+    def uninstall(self, context: BrowserContext):
+        """Detach the router from a context that outlives the test"""
+        context.unroute("**/*", self._handle)
+        context.remove_listener("requestfinished", self._record_size)
+
+    def _handle(self, route: Route):
+        request = route.request
+        if self.should_block(request.url, request.resource_type):
+            size = self.stats.record_blocked(request.url, request.resource_type)
+            self.blocked_requests += 1
+            self.estimated_bytes += size
+            route.abort("blockedbyclient")
+        else:
+            # Let other handlers (e.g. HAR replay) see the request
+            route.fallback()
+
+    def _record_size(self, request: Request):
+        try:
+            sizes = request.sizes()
+            self.stats.record_size(request.url, request.resource_type, sizes["responseBodySize"])
+        except Exception as e:
+            self.logger.debug(f"Could not read size of {request.url}: {str(e)}")
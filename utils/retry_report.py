@@ -0,0 +1,75 @@
+import logging
+import time
+from typing import Iterable
+
+import pytest
+
+from pages.retry import TEST_RETRY_ON, Retrier, RetryPolicy, classify
+
+try:
+    from pytest_rerunfailures import get_reruns_count
+except ImportError:  # Test-level reruns need pytest-rerunfailures; action and step retries work without it
+    get_reruns_count = None
+
+
+class RetryPlugin:
+    """Limits pytest-rerunfailures to transient failures, backs off between reruns and reports retry stats
+
+    Reruns stay with pytest-rerunfailures; this plugin only decides which failed tests it may rerun,
+    so assertion failures and unknown errors fail on the first run. A test is kept from being rerun
+    through the plugin's public flaky marker, with a condition that is false.
+    """
+
+    def __init__(self, retrier: Retrier, retry_on: Iterable[str] = TEST_RETRY_ON):
+        self.retrier = retrier
+        self.retry_on = frozenset(retry_on)
+        self.logger = logging.getLogger(__name__)
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_runtest_makereport(self, item, call):
+        # Outermost wrapper: runs after the budget plugin has judged the report, before rerunfailures checks it
+        outcome = yield
+        report = outcome.get_result()
+        if get_reruns_count is None or report.when == "teardown":
+            return
+        reruns = get_reruns_count(item) or 0
+        retry = getattr(item, "execution_count", 1) - 1
+        if report.passed and report.when == "call" and retry:
+            self.retrier.stats.record("test", getattr(item, "_retry_failure", "other"), "recovered")
+            return
+        if not report.failed or not reruns:
+            return
+        failure = "budget" if getattr(report, "budget_only", False) else (
+            classify(call.excinfo.value) if call.excinfo else "other")
+        item._retry_failure = failure
+        policy = RetryPolicy(self.retry_on, reruns + 1)
+        if not self.retrier.should_retry("test", policy, failure, retry):
+            # Prepended, so it is the closest flaky marker even when the test has one of its own
+            item.add_marker(pytest.mark.flaky(reruns=reruns, condition=False), append=False)
+            return
+        delay = self.retrier.backoff("test", policy, failure, retry)
+        self.logger.info(f"Rerunning {item.nodeid} after {failure} failure in {delay:.1f}s")
+        time.sleep(delay)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        rows = getattr(node, "workeroutput", {}).get("retry_stats")
+        if rows:
+            self.retrier.stats.merge(rows)
+
+    def pytest_sessionfinish(self, session):
+        config = session.config
+        if hasattr(config, "workerinput"):
+            config.workeroutput["retry_stats"] = self.retrier.stats.rows()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        lines = self.retrier.stats.summary_lines()
+        reruns = terminalreporter.stats.get("rerun", [])
+        if not lines and not reruns:
+            return
+        terminalreporter.write_sep("-", "retries")
+        for line in lines:
+            terminalreporter.write_line(line)
+        if reruns:
+            seconds = sum(report.duration for report in reruns)
+            terminalreporter.write_line(f"{len(reruns)} test phases rerun, {seconds:.1f}s spent in failed attempts")
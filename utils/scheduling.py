@@ -0,0 +1,163 @@
+import heapq
+import json
+import logging
+import os
+import statistics
+from typing import Dict, List, Optional, Sequence
+
+import pytest
+from xdist.scheduler import LoadScheduling
+
+from config.config import Config
+
+
+def lpt_assign(durations: Sequence[float], bins: int) -> List[List[int]]:
+    """Longest-processing-time-first bin packing: indices of durations per bin, each in original order"""
+    loads = [(0.0, b) for b in range(bins)]
+    assignment: List[List[int]] = [[] for _ in range(bins)]
+    for index in sorted(range(len(durations)), key=lambda i: durations[i], reverse=True):
+        load, b = heapq.heappop(loads)
+        assignment[b].append(index)
+        heapq.heappush(loads, (load + durations[index], b))
+    return [sorted(indices) for indices in assignment]
+
+
+def makespan(durations: Sequence[float], assignment: List[List[int]]) -> float:
+    """Duration of the busiest bin"""
+    return max((sum(durations[i] for i in indices) for indices in assignment), default=0.0)
+
+
+class DurationHistory:
+    """Per-test durations from previous runs, smoothed with an exponential moving average"""
+
+    def __init__(self, path: str = Config.DURATION_HISTORY, durations: Optional[Dict[str, float]] = None,
+                 alpha: float = 0.5):
+        self.path = path
+        self.durations: Dict[str, float] = durations or {}
+        self.alpha = alpha
+
+    @classmethod
+    def load(cls, path: str = Config.DURATION_HISTORY) -> "DurationHistory":
+        """Read the history file; a missing or corrupt file gives an empty history"""
+        try:
+            with open(path) as f:
+                return cls(path, json.load(f))
+        except (OSError, ValueError):
+            return cls(path)
+
+    def save(self):
+        """Write the history file atomically"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def record(self, nodeid: str, seconds: float):
+        """Blend a new measurement into the history"""
+        previous = self.durations.get(nodeid)
+        self.durations[nodeid] = seconds if previous is None else self.alpha * seconds + (1 - self.alpha) * previous
+
+    def estimate(self, nodeid: str) -> float:
+        """Expected duration; tests without history are assumed to take the median"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        return statistics.median(self.durations.values()) if self.durations else 1.0
+
+
+class DurationScheduling(LoadScheduling):
+    """Load scheduling that hands out tests longest first, by their historical duration
+
+    Pending tests are ordered by expected duration and each worker is topped up to two
+    pending tests as it finishes one, so the longest remaining test goes to whichever
+    worker frees up first (list scheduling with LPT order). Tests of a crashed worker go
+    back to the pending list for the others or a restarted worker. Without any history
+    it behaves like the default load scheduler.
+    """
+
+    def __init__(self, config, log=None, history: Optional[DurationHistory] = None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory()
+        self.predicted_makespan = 0.0
+
+    def schedule(self):
+        assert self.collection_is_completed
+        if self.collection is not None or not self.history.durations:
+            super().schedule()
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+        self.collection = list(self.node2collection.values())[0]
+        if not self.collection:
+            return
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+
+        estimates = [self.history.estimate(nodeid) for nodeid in self.collection]
+        self.pending[:] = sorted(range(len(self.collection)), key=lambda i: estimates[i], reverse=True)
+        self.predicted_makespan = makespan(estimates, lpt_assign(estimates, len(self.nodes)))
+        self.log(f"duration scheduling: predicted makespan {self.predicted_makespan:.1f}s "
+                 f"over {len(self.nodes)} workers")
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration=0):
+        if self.collection is None or not self.history.durations:
+            super().check_schedule(node, duration)
+            return
+        if node.shutting_down:
+            return
+        if self.pending:
+            # One test running and one queued, so a worker never waits for the controller
+            missing = 2 - len(self.node2pending[node])
+            if missing > 0:
+                self._send_tests(node, missing)
+        else:
+            node.shutdown()
+
+    def remove_node(self, node):
+        crashitem = super().remove_node(node)
+        if crashitem is not None and self.history.durations:
+            # Keep the longest-first order for the tests handed back
+            self.pending.sort(key=lambda i: self.history.estimate(self.collection[i]), reverse=True)
+        return crashitem
+
+
+class DurationPlugin:
+    """Records test durations to the history file and schedules xdist runs from it"""
+
+    def __init__(self, history: DurationHistory, schedule: bool = True):
+        self.history = history
+        self.schedule = schedule
+        self.started: Dict[str, float] = {}
+        self.skipped = set()
+        self.logger = logging.getLogger(__name__)
+
+    def pytest_runtest_logreport(self, report):
+        # Reports from xdist workers also reach the controller, so every test is seen here.
+        # A rerun attempt stops reporting at its failed phase, without a teardown report, so
+        # a test is measured from the start of its first attempt to the end of its last one
+        self.started.setdefault(report.nodeid, report.start)
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+        if report.when == "teardown" and report.outcome != "rerun":
+            seconds = report.stop - self.started.pop(report.nodeid)
+            if report.nodeid in self.skipped:
+                self.skipped.discard(report.nodeid)
+            else:
+                self.history.record(report.nodeid, seconds)
+
+    def pytest_sessionfinish(self, session):
+        if not self.history.durations:
+            return
+        try:
+            self.history.save()
+        except OSError as e:
+            self.logger.warning(f"Failed to save test duration history: {str(e)}")
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        if self.schedule and config.getoption("dist") == "load":
+            return DurationScheduling(config, log, history=self.history)
+        return None
@@ -0,0 +1,122 @@
+from playwright.sync_api import BrowserContext
+import contextlib
+import logging
+import time
+from typing import Dict, List, Optional
+
+import pytest
+
+from config.config import Config
+
+# Chromium features a test run never needs; each one costs start-up time or background work
+CHROMIUM_LAUNCH_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,OptimizationHints,MediaRouter",
+    "--mute-audio",
+)
+
+
+def tuned_launch_args(browser_name: str, launch_args: Dict) -> Dict:
+    """Launch arguments with the start-up flags of the browser added"""
+    if browser_name != "chromium":
+        return launch_args
+    return {**launch_args, "args": [*launch_args.get("args", ()), *CHROMIUM_LAUNCH_ARGS]}
+
+
+def warm_up(context: BrowserContext, url: str, timeout: int = Config.NAVIGATION_TIMEOUT):
+    """Load the site once so DNS, TLS and the context's HTTP cache are warm for the first test"""
+    page = context.new_page()
+    try:
+        page.goto(url, wait_until="load", timeout=timeout)
+    finally:
+        page.close()
+
+
+class StartupTimer:
+    """Start-up phases of this process and when its first test started"""
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.session_started: Optional[float] = None
+        self.first_test: Optional[float] = None
+
+    def record(self, name: str, seconds: float):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def row(self, worker_id: str) -> dict:
+        """Time to first test and the phases before it, JSON-friendly"""
+        first_test = None
+        if self.first_test is not None and self.session_started is not None:
+            first_test = round(self.first_test - self.session_started, 3)
+        return {
+            "worker": worker_id,
+            "first_test_seconds": first_test,
+            "phases": {name: round(seconds, 3) for name, seconds in self.phases.items()},
+        }
+
+
+startup_timer = StartupTimer()
+
+
+class StartupPlugin:
+    """Measures collection and the time each worker takes to reach its first test"""
+
+    def __init__(self, timer: StartupTimer, worker_id: str):
+        self.timer = timer
+        self.worker_id = worker_id
+        self.rows: List[dict] = []
+        self.logger = logging.getLogger(__name__)
+
+    def pytest_sessionstart(self, session):
+        self.timer.session_started = time.perf_counter()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session):
+        with self.timer.phase("collection"):
+            yield
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_call(self, item):
+        # Setup of the first test launches and warms the browser, so it counts as start-up
+        if self.timer.first_test is None:
+            self.timer.first_test = time.perf_counter()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        row = getattr(node, "workeroutput", {}).get("startup")
+        if row:
+            self.rows.append(row)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(session.config, "workerinput"):
+            session.config.workeroutput["startup"] = self.timer.row(self.worker_id)
+        elif not self.rows:
+            self.rows.append(self.timer.row(self.worker_id))
+
+    def pytest_terminal_summary(self, terminalreporter):
+        rows = [row for row in self.rows if row["first_test_seconds"] is not None]
+        if not rows:
+            return
+        terminalreporter.write_sep("-", "start-up")
+        for row in sorted(rows, key=lambda row: row["worker"]):
+            phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in row["phases"].items())
+            terminalreporter.write_line(
+                f"{row['worker']}: first test started after {row['first_test_seconds']:.2f}s ({phases})"
+            )
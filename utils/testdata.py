@@ -0,0 +1,214 @@
+import collections
+import datetime
+import random
+import threading
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional
+
+from config.config import Config
+from utils.user_pool import get_worker_id
+
+FIRST_NAMES = ("Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie", "Avery", "Quinn")
+LAST_NAMES = ("Smith", "Khan", "Garcia", "Chen", "Okafor", "Novak", "Silva", "Hansen", "Rossi", "Ahmed")
+STREETS = ("Main St", "Oak Ave", "Park Rd", "Lake Dr", "Hill St", "River Rd")
+# Countries and a (state, city) of each, as offered by the signup form
+LOCATIONS = (
+    ("United States", "California", "San Francisco"),
+    ("Canada", "Ontario", "Toronto"),
+    ("Australia", "Victoria", "Melbourne"),
+    ("India", "Karnataka", "Bengaluru"),
+    ("New Zealand", "Auckland", "Auckland"),
+    ("Singapore", "Singapore", "Singapore"),
+)
+SUBJECTS = ("Order question", "Delivery delay", "Product feedback", "Return request", "Invoice copy")
+
+
+class Record:
+    """Read-only dict-style access for NamedTuple records, so they can go wherever user dicts went"""
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def get(self, key: str, default=None):
+        return getattr(self, key, default)
+
+    def keys(self):
+        return self._fields
+
+
+class _UserFields(NamedTuple):
+    name: str
+    email: str
+    password: str
+    title: str
+    dob_day: str
+    dob_month: str
+    dob_year: str
+    first_name: str
+    last_name: str
+    company: str
+    address: str
+    address2: str
+    country: str
+    state: str
+    city: str
+    zipcode: str
+    mobile_number: str
+
+
+class User(Record, _UserFields):
+    """Account data for signup forms and the account API"""
+    __slots__ = ()
+
+
+class _CardFields(NamedTuple):
+    name_on_card: str
+    card_number: str
+    cvc: str
+    expiry_month: str
+    expiry_year: str
+
+
+class Card(Record, _CardFields):
+    """Payment card details for the checkout payment form"""
+    __slots__ = ()
+
+
+class _ContactFields(NamedTuple):
+    name: str
+    email: str
+    subject: str
+    message: str
+
+
+class ContactMessage(Record, _ContactFields):
+    """Contact Us form submission"""
+    __slots__ = ()
+
+
+def luhn_digit(digits: str) -> str:
+    """Check digit that makes digits + check digit pass the Luhn test"""
+    total = 0
+    for i, digit in enumerate(reversed(digits)):
+        value = int(digit) * (2 if i % 2 == 0 else 1)
+        total += value - 9 if value > 9 else value
+    return str(-total % 10)
+
+
+class TestData:
+    """Deterministic, collision-free test data per xdist worker, generated in batches
+
+    Every worker draws from its own generator seeded with the run seed and the worker id, so a run
+    can be reproduced with TESTDATA_SEED. Emails carry the run token, worker id and a sequence
+    number, so no two workers or runs ever sign up the same address.
+    """
+    __test__ = False
+
+    def __init__(self, seed: Optional[int] = None, worker_id: Optional[str] = None,
+                 batch_size: int = Config.TESTDATA_BATCH):
+        self.seed = seed if seed is not None else (
+            int(Config.TESTDATA_SEED) if Config.TESTDATA_SEED else random.SystemRandom().randrange(2 ** 32))
+        self.worker_id = worker_id or get_worker_id()
+        self.batch_size = batch_size
+        self.token = f"{self.seed:08x}"[-8:]
+        self._random = random.Random(f"{self.seed}:{self.worker_id}")
+        self._sequence = 0
+        self._batches: Dict[str, Deque] = collections.defaultdict(collections.deque)
+        self._lock = threading.Lock()
+
+    def _next_email(self, role: str) -> str:
+        self._sequence += 1
+        return f"test_{self.token}_{self.worker_id}_{role}_{self._sequence}@example.com"
+
+    def _build_users(self, count: int, role: str) -> List[User]:
+        users = []
+        rnd = self._random
+        for _ in range(count):
+            first_name, last_name = rnd.choice(FIRST_NAMES), rnd.choice(LAST_NAMES)
+            country, state, city = rnd.choice(LOCATIONS)
+            users.append(User(
+                name=f"{first_name} {last_name}",
+                email=self._next_email(role),
+                password=f"pw-{rnd.getrandbits(48):012x}",
+                title=rnd.choice(("Mr", "Mrs")),
+                dob_day=str(rnd.randint(1, 28)),
+                dob_month=str(rnd.randint(1, 12)),
+                dob_year=str(rnd.randint(1960, 2004)),
+                first_name=first_name,
+                last_name=last_name,
+                company=f"{last_name} Ltd",
+                address=f"{rnd.randint(1, 999)} {rnd.choice(STREETS)}",
+                address2=f"Apt {rnd.randint(1, 99)}",
+                country=country,
+                state=state,
+                city=city,
+                zipcode=f"{rnd.randint(10000, 99999)}",
+                mobile_number=f"555{rnd.randint(0, 9999999):07d}",
+            ))
+        return users
+
+    def _build_cards(self, count: int) -> List[Card]:
+        rnd = self._random
+        year = datetime.date.today().year
+        cards = []
+        for _ in range(count):
+            digits = "4" + "".join(str(rnd.randint(0, 9)) for _ in range(14))
+            cards.append(Card(
+                name_on_card=f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}",
+                card_number=digits + luhn_digit(digits),
+                cvc=f"{rnd.randint(100, 999)}",
+                expiry_month=f"{rnd.randint(1, 12):02d}",
+                expiry_year=str(year + rnd.randint(1, 5)),
+            ))
+        return cards
+
+    def _build_contact_messages(self, count: int) -> List[ContactMessage]:
+        rnd = self._random
+        messages = []
+        for _ in range(count):
+            subject = rnd.choice(SUBJECTS)
+            messages.append(ContactMessage(
+                name=f"{rnd.choice(FIRST_NAMES)} {rnd.choice(LAST_NAMES)}",
+                email=self._next_email("contact"),
+                subject=subject,
+                message=f"{subject}: reference {rnd.getrandbits(32):08x}",
+            ))
+        return messages
+
+    def _take(self, key: str, build: Callable[[int], list], count: int) -> list:
+        with self._lock:
+            batch = self._batches[key]
+            if len(batch) < count:
+                batch.extend(build(max(self.batch_size, count - len(batch))))
+            return [batch.popleft() for _ in range(count)]
+
+    def users(self, count: int, role: str = "user", **overrides) -> List[User]:
+        """Unique users; overrides replace fields of every one of them"""
+        users = self._take(f"user:{role}", lambda n: self._build_users(n, role), count)
+        return [user._replace(**overrides) for user in users] if overrides else users
+
+    def user(self, role: str = "user", **overrides) -> User:
+        return self.users(1, role, **overrides)[0]
+
+    def cards(self, count: int) -> List[Card]:
+        return self._take("card", self._build_cards, count)
+
+    def card(self, **overrides) -> Card:
+        return self.cards(1)[0]._replace(**overrides)
+
+    def contact_messages(self, count: int) -> List[ContactMessage]:
+        return self._take("contact", self._build_contact_messages, count)
+
+    def contact_message(self, **overrides) -> ContactMessage:
+        return self.contact_messages(1)[0]._replace(**overrides)
+
+
+testdata = TestData()
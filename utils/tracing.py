@@ -0,0 +1,81 @@
+from playwright.sync_api import BrowserContext
+import logging
+import os
+import random
+import re
+import time
+import weakref
+from typing import Optional
+
+from config.config import Config
+
+UNSAFE_NAME_CHARS = re.compile(r"[^\w.-]+")
+
+
+class TraceRecorder:
+    """Always-on Playwright tracing of test contexts, written to disk only for failed or slow tests
+
+    Tracing runs without DOM snapshots or sources; each test is a chunk of its context's trace, so
+    pooled contexts keep one tracing session across the tests they serve. Chunks of passing tests are
+    discarded inside the browser, and at most `keep` trace files are kept, oldest deleted first.
+    """
+
+    def __init__(self, trace_dir: str = Config.TRACE_DIR, keep: int = Config.TRACE_KEEP,
+                 slow_seconds: float = Config.TRACE_SLOW_SECONDS,
+                 screenshot_sample: float = Config.TRACE_SCREENSHOT_SAMPLE):
+        self.trace_dir = trace_dir
+        self.keep = keep
+        self.slow_seconds = slow_seconds
+        self.screenshot_sample = screenshot_sample
+        self.kept = 0
+        self.discarded = 0
+        self.logger = logging.getLogger(__name__)
+        self._started: "weakref.WeakSet[BrowserContext]" = weakref.WeakSet()
+
+    def start(self, context: BrowserContext, test_id: str):
+        """Start a chunk for the test, starting tracing on the context first if needed"""
+        if context not in self._started:
+            # Screencast frames are the costly part, so only a sample of contexts records them
+            context.tracing.start(snapshots=False, sources=False,
+                                  screenshots=random.random() < self.screenshot_sample)
+            self._started.add(context)
+        context.tracing.start_chunk(title=test_id)
+
+    def should_keep(self, report) -> bool:
+        """Keep traces of tests that failed, never got to run their body, or were slow"""
+        return report is None or report.failed or report.duration > self.slow_seconds
+
+    def stop(self, context: BrowserContext, test_id: str, keep: bool) -> Optional[str]:
+        """End the test's chunk, writing it only when it is kept; returns the trace path"""
+        try:
+            if not keep:
+                context.tracing.stop_chunk()
+                self.discarded += 1
+                return None
+            os.makedirs(self.trace_dir, exist_ok=True)
+            path = os.path.join(self.trace_dir, f"{UNSAFE_NAME_CHARS.sub('_', test_id)[-100:]}_{time.time_ns()}.zip")
+            context.tracing.stop_chunk(path=path)
+        except Exception as e:
+            # A crashed or closed context has no chunk left to stop
+            self.logger.debug(f"Failed to stop trace chunk of {test_id}: {str(e)}")
+            self._started.discard(context)
+            return None
+        self.kept += 1
+        self._rotate()
+        return path
+
+    def _rotate(self):
+        # Scans the directory, so traces of other xdist workers and earlier runs count as well
+        traces = []
+        for entry in os.scandir(self.trace_dir):
+            if entry.name.endswith(".zip"):
+                try:
+                    traces.append((entry.stat().st_mtime, entry.path))
+                except FileNotFoundError:
+                    pass
+        traces.sort()
+        for _, path in traces[:max(len(traces) - self.keep, 0)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,127 @@
+from playwright.sync_api import Playwright, APIResponse
+import json
+import logging
+import re
+from typing import Dict, Iterable, List, Optional
+
+from config.config import Config
+from utils.testdata import User, testdata
+
+CSRF_TOKEN_PATTERN = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+
+class UserFactoryError(Exception):
+    """Raised when the site rejects an account operation"""
+
+
+class UserFactory:
+    """Creates, verifies and deletes test accounts over HTTP instead of the UI"""
+
+    def __init__(self, playwright: Playwright, base_url: Optional[str] = None):
+        self.playwright = playwright
+        self.base_url = (base_url or Config.BASE_URL).rstrip("/")
+        # A single request context keeps connections alive across batched calls
+        self.request = playwright.request.new_context(base_url=self.base_url)
+        self.created: Dict[str, Dict[str, str]] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def __enter__(self) -> "UserFactory":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def build(self, role: str = "user", **overrides) -> User:
+        """Build account data with a unique email from the pre-generated test data"""
+        return testdata.user(role, **overrides)
+
+    def create(self, user_data: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Create an account and track it for teardown"""
+        user_data = user_data or self.build()
+        self.logger.info(f"Creating account over HTTP: {user_data['email']}")
+        response = self.request.post("/api/createAccount", form={
+            "name": user_data["name"],
+            "email": user_data["email"],
+            "password": user_data["password"],
+            "title": user_data.get("title", "Mr"),
+            "birth_date": user_data.get("dob_day", "1"),
+            "birth_month": user_data.get("dob_month", "1"),
+            "birth_year": user_data.get("dob_year", "1990"),
+            "firstname": user_data["first_name"],
+            "lastname": user_data["last_name"],
+            "company": user_data.get("company", ""),
+            "address1": user_data["address"],
+            "address2": user_data.get("address2", ""),
+            "country": user_data["country"],
+            "zipcode": user_data["zipcode"],
+            "state": user_data["state"],
+            "city": user_data["city"],
+            "mobile_number": user_data["mobile_number"]
+        })
+        result = self._result(response)
+        if result.get("responseCode") != 201:
+            raise UserFactoryError(f"Failed to create {user_data['email']}: {result.get('message')}")
+        self.created[user_data["email"]] = user_data
+        return user_data
+
+    def create_many(self, users: Iterable[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Create several accounts over the same connection"""
+        return [self.create(user_data) for user_data in users]
+
+    def verify(self, email: str, password: str) -> bool:
+        """Check that an account exists with the given credentials"""
+        response = self.request.post("/api/verifyLogin", form={"email": email, "password": password})
+        return self._result(response).get("responseCode") == 200
+
+    def delete(self, user_data: Dict[str, str]) -> bool:
+        """Delete an account; returns False if it did not exist"""
+        self.logger.info(f"Deleting account over HTTP: {user_data['email']}")
+        response = self.request.delete("/api/deleteAccount", form={
+            "email": user_data["email"],
+            "password": user_data["password"]
+        })
+        self.created.pop(user_data["email"], None)
+        return self._result(response).get("responseCode") == 200
+
+    def delete_many(self, users: Iterable[Dict[str, str]]) -> List[bool]:
+        """Delete several accounts over the same connection"""
+        return [self.delete(user_data) for user_data in list(users)]
+
+    def storage_state(self, user_data: Dict[str, str], path: str) -> str:
+        """Log in through the login form over HTTP and save the resulting storage state"""
+        context = self.playwright.request.new_context(base_url=self.base_url)
+        try:
+            match = CSRF_TOKEN_PATTERN.search(context.get("/login").text())
+            response = context.post("/login", form={
+                "csrfmiddlewaretoken": match.group(1) if match else "",
+                "email": user_data["email"],
+                "password": user_data["password"]
+            }, headers={"Referer": f"{self.base_url}/login"})
+            if "Logged in as" not in response.text():
+                raise UserFactoryError(f"Failed to log in as {user_data['email']}")
+            context.storage_state(path=path)
+            return path
+        finally:
+            context.dispose()
+
+    def cleanup(self):
+        """Delete every account created by this factory that still exists"""
+        for user_data in list(self.created.values()):
+            try:
+                self.delete(user_data)
+            except Exception as e:
+                self.logger.error(f"Failed to delete account {user_data['email']}: {str(e)}")
+
+    def close(self):
+        """Delete leftover accounts and release the connection"""
+        try:
+            self.cleanup()
+        finally:
+            self.request.dispose()
+
+    def _result(self, response: APIResponse) -> dict:
+        """Parse the JSON body the API returns, whatever the HTTP status"""
+        try:
+            return json.loads(response.text())
+        except ValueError:
+            raise UserFactoryError(f"{response.url} returned a non-JSON response ({response.status})")
@@ -0,0 +1,87 @@
+import json
+import logging
+import os
+import time
+from typing import Dict, Optional, TYPE_CHECKING
+
+from config.config import Config
+
+if TYPE_CHECKING:
+    from utils.user_factory import UserFactory
+
+
+def get_worker_id() -> str:
+    """Get the pytest-xdist worker id, or 'master' when not running distributed"""
+    return os.getenv("PYTEST_XDIST_WORKER", "master")
+
+
+class UserPool:
+    """Provisions test accounts once and caches their logged-in storage state on disk"""
+
+    def __init__(self, factory: "UserFactory", state_dir: str = Config.STORAGE_STATE_DIR,
+                 ttl: int = Config.STORAGE_STATE_TTL, worker_id: Optional[str] = None):
+        self.factory = factory
+        self.state_dir = state_dir
+        self.ttl = ttl
+        self.worker_id = worker_id or get_worker_id()
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(self.state_dir, exist_ok=True)
+
+    def _paths(self, role: str) -> tuple:
+        """Storage state and credentials file for a role, keyed per worker"""
+        base = os.path.join(self.state_dir, f"{self.worker_id}_{role}")
+        return f"{base}.state.json", f"{base}.user.json"
+
+    def is_fresh(self, role: str = "default") -> bool:
+        """Check if a cached account exists for the role and is younger than the TTL"""
+        state_path, user_path = self._paths(role)
+        if not (os.path.exists(state_path) and os.path.exists(user_path)):
+            return False
+        return time.time() - os.path.getmtime(state_path) < self.ttl
+
+    def acquire(self, role: str = "default") -> Dict[str, str]:
+        """Get credentials of the account for a role, provisioning it if needed"""
+        state_path, user_path = self._paths(role)
+        if not self.is_fresh(role):
+            self.invalidate(role)
+            self._provision(role)
+        with open(user_path) as f:
+            return json.load(f)
+
+    def storage_state(self, role: str = "default") -> str:
+        """Get the path of the logged-in storage state for a role"""
+        self.acquire(role)
+        return self._paths(role)[0]
+
+    def invalidate(self, role: Optional[str] = None):
+        """Drop the cached account of a role, or of every role of this worker, and delete it remotely"""
+        prefix = f"{self.worker_id}_{role}." if role else f"{self.worker_id}_"
+        for name in os.listdir(self.state_dir):
+            if not name.startswith(prefix):
+                continue
+            path = os.path.join(self.state_dir, name)
+            if name.endswith(".user.json"):
+                self._delete_account(path)
+            os.remove(path)
+
+    def _delete_account(self, user_path: str):
+        """Best-effort removal of a pooled account from the site"""
+        try:
+            with open(user_path) as f:
+                self.factory.delete(json.load(f))
+        except Exception as e:
+            self.logger.warning(f"Failed to delete pooled account from {user_path}: {str(e)}")
+
+    def _provision(self, role: str):
+        """Create a new account over HTTP and save its logged-in storage state"""
+        user_data = self.factory.build(role)
+        state_path, user_path = self._paths(role)
+        self.logger.info(f"Provisioning pooled user '{role}' for worker {self.worker_id}: {user_data['email']}")
+
+        self.factory.create(user_data)
+        # Pooled accounts outlive the session, the TTL decides when they are replaced
+        self.factory.created.pop(user_data["email"], None)
+        self.factory.storage_state(user_data, state_path)
+
+        with open(user_path, "w") as f:
+            json.dump(dict(user_data), f, indent=2)
@@ -0,0 +1,27 @@
+import pytest
+
+from pages.wait_strategies import WaitStats
+
+
+class WaitReportPlugin:
+    """Reports the time spent in each wait strategy, summed over all xdist workers"""
+
+    def __init__(self, stats: WaitStats):
+        self.stats = stats
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        rows = getattr(node, "workeroutput", {}).get("wait_stats")
+        if rows:
+            self.stats.merge(rows)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(session.config, "workerinput"):
+            session.config.workeroutput["wait_stats"] = self.stats.rows()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.stats.counts:
+            return
+        terminalreporter.write_sep("-", "wait time by strategy")
+        for line in self.stats.summary_lines():
+            terminalreporter.write_line(line)